@@ -1,6 +1,7 @@
 import os
 import hashlib
-import requests
+
+from integrations.http import http_get
 
 
 def _cache_sprite(url: str, cache_dir: str, prefix: str) -> str:
@@ -36,7 +37,7 @@ def _cache_sprite(url: str, cache_dir: str, prefix: str) -> str:
 
     # baixa
     try:
-        r = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
+        r = http_get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
         r.raise_for_status()
         with open(raw_path, "wb") as f:
             f.write(r.content)
@@ -76,8 +77,8 @@ def fetch_boosted():
     Além dos nomes, tenta retornar também os sprites (image_url) quando disponíveis.
     """
     try:
-        c = requests.get("https://api.tibiadata.com/v4/creatures", timeout=10).json()
-        b = requests.get("https://api.tibiadata.com/v4/boostablebosses", timeout=10).json()
+        c = http_get("https://api.tibiadata.com/v4/creatures", timeout=10).json()
+        b = http_get("https://api.tibiadata.com/v4/boostablebosses", timeout=10).json()
 
         c_boosted = ((c.get("creatures") or {}).get("boosted") or {})
         b_boosted = ((b.get("boostable_bosses") or {}).get("boosted") or {})
@@ -1,30 +1,64 @@
 from dataclasses import dataclass
+from typing import Iterable, Union
 import re
 
+from core.utilities import format_int_pt
+
 @dataclass
 class HuntResult:
     ok: bool
     error: str = ""
     pretty: str = ""
 
+# Padrões compilados uma única vez (não recompila a cada análise).
+_LINE_PATTERNS = (
+    ("loot", re.compile(r"Loot:\s*([\d\.,]+)")),
+    ("sup", re.compile(r"Supplies:\s*([\d\.,]+)")),
+    ("bal", re.compile(r"Balance:\s*([-]?\s*[\d\.,]+)")),
+    # opcionais
+    ("xp_gain", re.compile(r"XP Gain:\s*([\d\.,]+)", re.I)),
+    ("raw_xp", re.compile(r"Raw XP Gain:\s*([\d\.,]+)", re.I)),
+    # Session Time: 01:23h (Tibia)
+    ("sess_time", re.compile(r"Session\s*Time:\s*(\d{1,2})\s*:\s*(\d{2})\s*h", re.I)),
+    # Alguns clientes usam 'Session duration'
+    ("sess_alt", re.compile(r"Session\s*(?:duration|time)\s*:\s*(\d{1,2})\s*:\s*(\d{2})", re.I)),
+)
+
+
 def _num(s):
     s = s.replace(".", "").replace(",", "")
     return int(s)
 
-def parse_hunt_session_text(txt: str) -> HuntResult:
+
+def _scan_lines(lines: Iterable[str]) -> dict:
+    """Primeiro match de cada padrão, linha a linha (para cedo quando achar todos)."""
+    found = {}
+    pending = list(_LINE_PATTERNS)
+    for line in lines:
+        if not line:
+            continue
+        for item in tuple(pending):
+            key, rx = item
+            m = rx.search(line)
+            if m:
+                found[key] = m
+                pending.remove(item)
+        if not pending:
+            break
+    return found
+
+
+def parse_hunt_session_text(txt: Union[str, Iterable[str]]) -> HuntResult:
+    """Analisa o Session Data do Tibia (texto inteiro ou iterável de linhas)."""
     try:
-        loot = re.search(r"Loot:\s*([\d\.,]+)", txt)
-        sup = re.search(r"Supplies:\s*([\d\.,]+)", txt)
-        bal = re.search(r"Balance:\s*([-]?\s*[\d\.,]+)", txt)
-
-        # opcionais
-        xp_gain = re.search(r"XP Gain:\s*([\d\.,]+)", txt, flags=re.I)
-        raw_xp = re.search(r"Raw XP Gain:\s*([\d\.,]+)", txt, flags=re.I)
-        # Session Time: 01:23h (Tibia)
-        sess_time = re.search(r"Session\s*Time:\s*(\d{1,2})\s*:\s*(\d{2})\s*h", txt, flags=re.I)
-        # Alguns clientes usam 'Session duration'
-        if not sess_time:
-            sess_time = re.search(r"Session\s*(?:duration|time)\s*:\s*(\d{1,2})\s*:\s*(\d{2})", txt, flags=re.I)
+        lines_in = txt.splitlines() if isinstance(txt, str) else txt
+        found = _scan_lines(lines_in)
+        loot = found.get("loot")
+        sup = found.get("sup")
+        bal = found.get("bal")
+        xp_gain = found.get("xp_gain")
+        raw_xp = found.get("raw_xp")
+        sess_time = found.get("sess_time") or found.get("sess_alt")
 
         if not loot or not sup or not bal:
             return HuntResult(False, "Texto inválido. Copie o Session Data do Tibia.")
@@ -34,9 +68,9 @@ def parse_hunt_session_text(txt: str) -> HuntResult:
         bal_v = _num(bal.group(1).replace(" ", ""))
 
         lines = [
-            f"Loot: {loot_v:,} gp",
-            f"Supplies: {sup_v:,} gp",
-            f"Balance: {bal_v:,} gp",
+            f"Loot: {format_int_pt(loot_v)} gp",
+            f"Supplies: {format_int_pt(sup_v)} gp",
+            f"Balance: {format_int_pt(bal_v)} gp",
         ]
 
         # métricas por hora
@@ -54,7 +88,7 @@ def parse_hunt_session_text(txt: str) -> HuntResult:
             if not minutes:
                 return ""
             v = int(round(val * 60.0 / minutes))
-            return f"{v:,} /h".replace(",", ".")
+            return f"{format_int_pt(v)} /h"
 
         if minutes:
             lines.append(f"Profit/h: {per_hour(bal_v)}")
@@ -62,7 +96,7 @@ def parse_hunt_session_text(txt: str) -> HuntResult:
         if xp_gain:
             try:
                 xp = _num(xp_gain.group(1))
-                lines.append(f"XP Gain: {xp:,}".replace(",", "."))
+                lines.append(f"XP Gain: {format_int_pt(xp)}")
                 if minutes:
                     lines.append(f"XP/h: {per_hour(xp)}")
             except Exception:
@@ -71,11 +105,11 @@ def parse_hunt_session_text(txt: str) -> HuntResult:
         if raw_xp:
             try:
                 rxp = _num(raw_xp.group(1))
-                lines.append(f"Raw XP Gain: {rxp:,}".replace(",", "."))
+                lines.append(f"Raw XP Gain: {format_int_pt(rxp)}")
             except Exception:
                 pass
 
-        pretty = "\n".join(lines).replace(",", ".") + "\n"
+        pretty = "\n".join(lines) + "\n"
 
         return HuntResult(True, pretty=pretty)
     except Exception as e:
@@ -44,6 +44,9 @@ _MEM_CACHE: Optional[Dict[str, Any]] = None
 
 
 class ImbuementEntry(object):
+    # Sem __dict__ por instância: a lista é varrida a cada tecla digitada no filtro.
+    __slots__ = ("name", "page", "basic", "intricate", "powerful")
+
     def __init__(self, name: str, page: str = "", basic: str = "", intricate: str = "", powerful: str = ""):
         self.name = name
         self.page = page  # chave do JSON (ex.: Vampirism, Void, Strike...)
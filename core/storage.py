@@ -5,6 +5,11 @@ import os
 from pathlib import Path
 from typing import Any
 
+try:  # orjson é opcional (não há receita no p4a); json da stdlib é o fallback
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
 
 def get_data_dir() -> str:
     try:
@@ -19,13 +24,25 @@ def get_data_dir() -> str:
     return str(Path(__file__).resolve().parent.parent / 'data')
 
 
+def loads_json(raw: bytes | str) -> Any:
+    """Decodifica JSON usando orjson quando disponível."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError as exc:
+            raise ValueError(str(exc)) from exc
+    if isinstance(raw, bytes):
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
+
 def safe_read_json(path: str, default: Any = None):
     try:
-        with open(path, 'r', encoding='utf-8') as handle:
-            return json.load(handle)
+        with open(path, 'rb') as handle:
+            return loads_json(handle.read())
     except FileNotFoundError:
         return default
-    except json.JSONDecodeError:
+    except (ValueError, UnicodeDecodeError):
         return default
     except OSError:
         return default
@@ -36,8 +53,17 @@ def safe_write_json(path: str, data: Any) -> bool:
     try:
         target.parent.mkdir(parents=True, exist_ok=True)
         tmp = target.with_suffix(target.suffix + '.tmp')
-        with tmp.open('w', encoding='utf-8') as handle:
-            json.dump(data, handle, ensure_ascii=False, indent=2)
+        payload = None
+        if _orjson is not None:
+            try:
+                payload = _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+            except TypeError:
+                # ex.: chaves não-str, que a stdlib converte sozinha
+                payload = None
+        if payload is None:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        with tmp.open('wb') as handle:
+            handle.write(payload)
         os.replace(tmp, target)
         return True
     except OSError:
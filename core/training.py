@@ -176,7 +176,8 @@ def compute_training_plan(inp: TrainingInput) -> TrainingPlan:
         return TrainingPlan(False, "Nada para calcular.")
 
     charges_needed = int(math.ceil(total_points / (points_per_charge * mult)))
-    weapons_needed = int(math.ceil(charges_needed / charges_per_weapon))
+    # Ambos inteiros: ceil-div sem passar por float.
+    weapons_needed = -(-charges_needed // charges_per_weapon)
 
     # Consome 1 charge a cada 2 segundos
     hours = (charges_needed * 2) / 3600.0
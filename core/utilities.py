@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 
+# ------------------------------------------------------------
+# Formatação
+# ------------------------------------------------------------
+def format_int_pt(n: int) -> str:
+    """Inteiro com separador de milhar no padrão pt-BR (1.234.567)."""
+    return f"{n:,}".replace(",", ".")
+
+
 # ------------------------------------------------------------
 # Rashid (NPC)
 # ------------------------------------------------------------
@@ -18,6 +27,8 @@ RASHID_SCHEDULE: Dict[int, str] = {
     5: "Edron",
     6: "Carlin",
 }
+# Mesma tabela indexada direto por weekday() (sem hash/get por consulta).
+_RASHID_BY_WEEKDAY = tuple(RASHID_SCHEDULE[day] for day in range(7))
 
 
 def tibia_utc_now() -> datetime:
@@ -27,7 +38,7 @@ def tibia_utc_now() -> datetime:
 
 def rashid_today(dt: Optional[datetime] = None) -> str:
     dt = dt or tibia_utc_now()
-    return RASHID_SCHEDULE.get(dt.weekday(), "Unknown")
+    return _RASHID_BY_WEEKDAY[dt.weekday()]
 
 
 def is_rashid_day(dt: Optional[datetime] = None) -> bool:
@@ -169,6 +180,9 @@ def calc_blessings_cost(level: int, pvp: bool = True) -> int:
     return blessings_cost(level=level, regular_count=5, enhanced_count=0, inq_discount=False)
 
 
+_HHMM_RE = re.compile(r"(\d+)\s*:\s*(\d+)")
+
+
 def stamina_to_full(current_stamina: str | float, max_hours: int = 42) -> float:
     """Compatibilidade: calcula quantas horas faltam para chegar ao máximo.
 
@@ -187,14 +201,11 @@ def stamina_to_full(current_stamina: str | float, max_hours: int = 42) -> float:
 
     if isinstance(current_stamina, str):
         s = current_stamina.strip()
-        if ":" in s:
-            hh, mm = s.split(":", 1)
-            try:
-                current = float(int(hh)) + (float(int(mm)) / 60.0)
-            except ValueError:
-                # fallback: tenta converter direto
-                current = float(s)
+        m = _HHMM_RE.fullmatch(s)
+        if m:
+            current = float(int(m.group(1))) + (float(int(m.group(2))) / 60.0)
         else:
+            # fallback: tenta converter direto (ex.: "37.5")
             current = float(s)
     else:
         current = float(current_stamina)
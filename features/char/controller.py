@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import bisect
 import math
+import operator
+import re
 import threading
 import time
-import urllib.parse
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 
 import requests
-from kivy.clock import Clock
 from kivy.metrics import dp
 from kivymd.uix.list import OneLineIconListItem, TwoLineIconListItem, IconLeftWidget
 from kivymd.uix.menu import MDDropdownMenu
@@ -17,13 +20,119 @@ from integrations.tibiadata import (
     fetch_character_tibiadata,
     fetch_guildstats_deaths_xp,
     fetch_guildstats_exp_changes,
+    guildstats_exp_url,
+    normalize_character,
 )
-from integrations.tibia_com import is_character_online_tibia_com
+from integrations.tibia_com import character_page_url, is_character_online_tibia_com
 from core.exp_loss import estimate_death_exp_lost
+from core.utilities import format_int_pt
+from services.browser import open_url
 from services.error_reporting import log_current_exception
 
 
+_NA = "N/A"
+_ONLINE_BADGE = "[b][color=#2ecc71]ONLINE[/color][/b]"
+_OFFLINE_BADGE = "[b][color=#e74c3c]OFFLINE[/color][/b]"
+# status -> (badge do título, ícone, texto da linha de status)
+_STATUS_BADGES = {
+    "online": (_ONLINE_BADGE, "wifi", "Online"),
+    "offline": (_OFFLINE_BADGE, "wifi-off", "Offline"),
+}
+_STATUS_BADGE_UNKNOWN = (_OFFLINE_BADGE, "help-circle-outline", "Offline")
+
+# Campos de cada morte no JSON do TibiaData (time/level/reason sempre presentes).
+_DEATH_FIELDS = operator.itemgetter("time", "level", "reason")
+
+
+_DEATH_BY_RE = re.compile(r" by ", re.IGNORECASE)
+_KILLERS_SPLIT_RE = re.compile(r",| and ")
+
+
+@lru_cache(maxsize=256)
+def _shorten_death_text(r: str) -> str:
+    if not r:
+        return ""
+
+    # Tenta reduzir listas enormes de killers: "... by A, B, C and D"
+    m = _DEATH_BY_RE.search(r)
+    if m:
+        prefix = r[: m.start()].strip().rstrip(".")
+        killers = r[m.end() :].strip().rstrip(".")
+        parts = [p.strip() for p in _KILLERS_SPLIT_RE.split(killers) if p.strip()]
+        if parts:
+            extra = len(parts) - 1
+
+            # compacta "Slain/Died at Level X" -> "Slain"/"Died"
+            event = prefix
+            low = prefix.lower()
+            if low.startswith("slain"):
+                event = "Slain"
+            elif low.startswith("died"):
+                event = "Died"
+
+            return f"{event} by {parts[0]}" + (f" +{extra}" if extra > 0 else "")
+
+    # fallback: corta com bom senso (sem '...')
+    return r[:80] + ("" if len(r) <= 80 else "…")
+
+
+def _add_detail_row(dl, text: str, icon: str, secondary=None, dialog_title: str = "", dialog_text: str = "", on_release=None):
+    """Linha do card de detalhes (1 ou 2 linhas); com dialog_text, abre o texto completo ao tocar."""
+    if secondary is None:
+        item = OneLineIconListItem(text=text)
+    else:
+        item = TwoLineIconListItem(text=text, secondary_text=secondary or " ")
+    item.add_widget(IconLeftWidget(icon=icon))
+    if dialog_text and on_release is not None:
+        item._dialog = (dialog_title or "Detalhes", dialog_text)
+        item.bind(on_release=on_release)
+    dl.add_widget(item)
+
+
 class CharControllerMixin:
+    # Buscas em andamento (nome em minúsculas): evita workers duplicados em toques repetidos.
+    _char_inflight_lock = threading.Lock()
+    # Pool próprio das consultas ao GuildStats: o worker da busca já roda no pool
+    # compartilhado e espera esses resultados (no mesmo pool poderia travar).
+    _gs_pool = None
+    _gs_pool_lock = threading.Lock()
+
+    def _guildstats_pool(self) -> ThreadPoolExecutor:
+        pool = self._gs_pool
+        if pool is None:
+            with self._gs_pool_lock:
+                pool = self._gs_pool
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tt-gs")
+                    self._gs_pool = pool
+        return pool
+
+    def _shutdown_guildstats_pool(self) -> None:
+        with self._gs_pool_lock:
+            pool, self._gs_pool = self._gs_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _char_search_claim(self, key: str, owner=None) -> bool:
+        with self._char_inflight_lock:
+            inflight = getattr(self, "_char_inflight", None)
+            if inflight is None:
+                inflight = self._char_inflight = {}
+            if key in inflight:
+                return False
+            inflight[key] = owner
+            return True
+
+    def _char_search_release(self, key: str, owner=None) -> None:
+        # Com owner, só libera se a reserva ainda for dessa busca (uma busca mais
+        # nova do mesmo nome pode ter reservado depois da liberação antecipada).
+        with self._char_inflight_lock:
+            inflight = getattr(self, "_char_inflight", None)
+            if inflight is None or key not in inflight:
+                return
+            if owner is None or inflight[key] == owner:
+                del inflight[key]
+
     def _get_home_screen(self):
         root = getattr(self, "root", None)
         if root is None:
@@ -79,6 +188,10 @@ class CharControllerMixin:
         except Exception:
             log_current_exception(prefix="[char] falha ao focar campo de busca")
 
+    def _on_account_char_release(self, item) -> None:
+        # Handler único da lista 'Outros chars na conta': o nome é o texto da linha.
+        self.open_char_from_account_list(item.text)
+
     def open_char_from_account_list(self, name: str):
         """Abre (pesquisa) um personagem a partir da lista 'Outros chars na conta'."""
         nm = (name or "").strip()
@@ -147,7 +260,7 @@ class CharControllerMixin:
             {
                 "viewclass": "OneLineListItem",
                 "text": item,
-                "on_release": (lambda selected=item: pick(selected)),
+                "on_release": partial(pick, item),
             }
             for item in hist
         ]
@@ -163,35 +276,8 @@ class CharControllerMixin:
 
     def _shorten_death_reason(self, reason: str) -> str:
         """Deixa o texto da morte mais legível no card (o completo pode abrir no dialog)."""
-        r = (reason or "").strip()
-        if not r:
-            return ""
-
-        # Tenta reduzir listas enormes de killers: "... by A, B, C and D"
-        low = r.lower()
-        if " by " in low:
-            idx = low.find(" by ")
-            prefix = r[:idx].strip().rstrip(".")
-            killers = r[idx + 4 :].strip().rstrip(".")
-
-            # normaliza separadores
-            killers_norm = killers.replace(" and ", ", ")
-            parts = [p.strip() for p in killers_norm.split(",") if p.strip()]
-            if parts:
-                first = parts[0]
-                extra = len(parts) - 1
-
-                # compacta "Slain/Died at Level X" -> "Slain"/"Died"
-                event = prefix
-                if prefix.lower().startswith("slain"):
-                    event = "Slain"
-                elif prefix.lower().startswith("died"):
-                    event = "Died"
-
-                return f"{event} by {first}" + (f" +{extra}" if extra > 0 else "")
-
-        # fallback: corta com bom senso (sem '...')
-        return r[:80] + ("" if len(r) <= 80 else "…")
+        return _shorten_death_text((reason or "").strip())
+
     def _char_set_loading(self, home, name: str):
         ids = getattr(home, "ids", None)
         if ids is None:
@@ -276,17 +362,30 @@ class CharControllerMixin:
         if char_status is not None:
             char_status.text = message
 
+    def _on_char_detail_release(self, item) -> None:
+        title, text = getattr(item, "_dialog", ("Detalhes", ""))
+        if text:
+            self._show_text_dialog(title, text)
+
+    def _on_char_death_release(self, item) -> None:
+        reason, meta = getattr(item, "_death", ("", ""))
+        text = f"{reason}\n\n{meta}".strip()
+        if text:
+            self._show_text_dialog("Morte", text)
+
     def _char_show_result(self, home, payload: dict, *, side_effects: bool = True):
-        status = str(payload.get("status", "N/A"))
-        title = str(payload.get("title", ""))
-        voc = str(payload.get("voc", "N/A"))
-        level = str(payload.get("level", "N/A"))
-        world = str(payload.get("world", "N/A"))
-        guild_line = str(payload.get("guild_line", "Guild: N/A"))
-        house_line = str(payload.get("house_line", "Houses: N/A"))
-        guild = payload.get("guild") or {}
-        houses = payload.get("houses") or []
-        deaths = payload.get("deaths", [])
+        # O worker monta o payload a partir do CharView (tipos já validados); aqui só defaults.
+        get = payload.get
+        status = get("status") or _NA
+        title = get("title") or ""
+        voc = get("voc") or _NA
+        level = get("level") or _NA
+        world = get("world") or _NA
+        guild_line = get("guild_line") or "Guild: N/A"
+        house_line = get("house_line") or "Houses: N/A"
+        guild = get("guild") or {}
+        houses = get("houses") or []
+        deaths = get("deaths") or []
 
         # XP últimos 30 dias (GuildStats tab=9)
         exp_rows_30 = payload.get("exp_rows_30") or []
@@ -307,41 +406,27 @@ class CharControllerMixin:
             except Exception:
                 log_current_exception(prefix="[char] dashboard_refresh falhou")
 
-        st = status.strip().lower()
-        if st == "online":
-            badge = "[b][color=#2ecc71]ONLINE[/color][/b]"
-            status_icon = "wifi"
-        elif st == "offline":
-            badge = "[b][color=#e74c3c]OFFLINE[/color][/b]"
-            status_icon = "wifi-off"
-        else:
-            badge = "[b][color=#e74c3c]OFFLINE[/color][/b]"
-            status_icon = "help-circle-outline"
+        st = str(status).strip().lower()
+        badge, status_icon, status_label = _STATUS_BADGES.get(st, _STATUS_BADGE_UNKNOWN)
 
         # Layout novo (cards + listas)
-        if hasattr(home, "ids") and "char_title" in home.ids and "char_details_list" in home.ids and "char_deaths_list" in home.ids:
-            home.ids.char_title.text = title or "Resultado"
-            home.ids.char_badge.text = badge
+        ids = getattr(home, "ids", None)
+        if ids is not None and "char_title" in ids and "char_details_list" in ids and "char_deaths_list" in ids:
+            ids.char_title.text = title or "Resultado"
+            ids.char_badge.text = badge
 
-            dl = home.ids.char_details_list
+            dl = ids.char_details_list
             dl.clear_widgets()
+            on_detail = self._on_char_detail_release
 
             def add_one(text: str, icon: str, dialog_title: str = "", dialog_text: str = ""):
-                item = OneLineIconListItem(text=text)
-                item.add_widget(IconLeftWidget(icon=icon))
-                if dialog_text:
-                    item.bind(on_release=lambda *_: self._show_text_dialog(dialog_title or "Detalhes", dialog_text))
-                dl.add_widget(item)
+                _add_detail_row(dl, text, icon, None, dialog_title, dialog_text, on_detail)
 
             def add_two(text: str, secondary: str, icon: str, dialog_title: str = "", dialog_text: str = ""):
-                item = TwoLineIconListItem(text=text, secondary_text=secondary or " ")
-                item.add_widget(IconLeftWidget(icon=icon))
-                if dialog_text:
-                    item.bind(on_release=lambda *_: self._show_text_dialog(dialog_title or "Detalhes", dialog_text))
-                dl.add_widget(item)
+                _add_detail_row(dl, text, icon, secondary, dialog_title, dialog_text, on_detail)
 
             # Usuário pediu para mostrar apenas ONLINE/OFFLINE (sem "Status:")
-            add_one((st if st in ("online", "offline") else "offline").capitalize(), status_icon)
+            add_one(status_label, status_icon)
             # Se estiver OFFLINE, mostra há quanto tempo (se disponível)
             try:
                 if st == "offline":
@@ -355,8 +440,8 @@ class CharControllerMixin:
             add_one(f"World: {world}", "earth")
 
             # Guild (evita cortar demais; toque para ver completo)
-            gname = str(guild.get("name") or "").strip() if isinstance(guild, dict) else ""
-            grank = str(guild.get("rank") or "").strip() if isinstance(guild, dict) else ""
+            gname = guild.get("name") or ""
+            grank = guild.get("rank") or ""
             if gname:
                 full = f"{gname}{(' (' + grank + ')') if grank else ''}".strip()
                 if grank:
@@ -367,7 +452,7 @@ class CharControllerMixin:
                 add_one(guild_line, "account-group")
 
             # Houses (se for mais de 1, mostra quantidade e abre dialog com a lista)
-            houses_list = [str(x).strip() for x in houses if str(x).strip()] if isinstance(houses, list) else []
+            houses_list = houses
             if not houses_list:
                 add_one("Houses: Nenhuma", "home")
             elif len(houses_list) == 1:
@@ -379,24 +464,25 @@ class CharControllerMixin:
             # ----------------------------
             # Card: XP últimos 30 dias
             # ----------------------------
-            if "char_xp_list" in home.ids:
+            if "char_xp_list" in ids:
                 def fmt_pt(n: int) -> str:
                     try:
-                        s = f"{abs(int(n)):,}".replace(",", ".")
+                        s = format_int_pt(abs(int(n)))
                     except Exception:
                         s = str(n)
                     return ("-" if int(n) < 0 else "+") + s
 
                 try:
-                    xlist = home.ids.char_xp_list
+                    xlist = ids.char_xp_list
                     xlist.clear_widgets()
+                    xp_total_w = ids.char_xp_total
 
                     loading_gs = bool(payload.get("gs_exp_loading"))
                     rows = exp_rows_30 if isinstance(exp_rows_30, list) else []
 
                     if loading_gs and not rows:
-                        home.ids.char_xp_total.text = "Carregando histórico de XP..."
-                        home.ids.char_xp_total.theme_text_color = "Hint"
+                        xp_total_w.text = "Carregando histórico de XP..."
+                        xp_total_w.theme_text_color = "Hint"
                     elif isinstance(exp_total_30, (int, float)) and rows:
                         # também calcula últimos 7 dias com base na data mais recente do histórico
                         total_7 = None
@@ -432,13 +518,13 @@ class CharControllerMixin:
                             total_7 = None
 
                         if isinstance(total_7, int):
-                            home.ids.char_xp_total.text = f"Total 7d: {fmt_pt(total_7)} XP • 30d: {fmt_pt(int(exp_total_30))} XP"
+                            xp_total_w.text = f"Total 7d: {fmt_pt(total_7)} XP • 30d: {fmt_pt(int(exp_total_30))} XP"
                         else:
-                            home.ids.char_xp_total.text = f"Total 30d: {fmt_pt(int(exp_total_30))} XP"
-                        home.ids.char_xp_total.theme_text_color = "Primary"
+                            xp_total_w.text = f"Total 30d: {fmt_pt(int(exp_total_30))} XP"
+                        xp_total_w.theme_text_color = "Primary"
                     elif not loading_gs:
-                        home.ids.char_xp_total.text = "Histórico de XP indisponível. Toque no ícone ↗ para conferir."
-                        home.ids.char_xp_total.theme_text_color = "Hint"
+                        xp_total_w.text = "Histórico de XP indisponível. Toque no ícone ↗ para conferir."
+                        xp_total_w.theme_text_color = "Hint"
 
                     if not rows:
                         it = OneLineIconListItem(text=("Buscando dados no GuildStats..." if loading_gs else "Sem dados."))
@@ -483,7 +569,7 @@ class CharControllerMixin:
                                 xlist.add_widget(item)
                         except Exception:
                             # fallback: mostra os 7 primeiros registros como antes
-                            for r in rows[:7]:
+                            for r in islice(rows, 7):
                                 ds = str(r.get("date") or "").strip()
                                 ev = r.get("exp_change_int")
                                 try:
@@ -498,15 +584,20 @@ class CharControllerMixin:
                 except Exception:
                     pass
 
-            dlist = home.ids.char_deaths_list
+            dlist = ids.char_deaths_list
             dlist.clear_widgets()
+            on_death = self._on_char_death_release
 
-            deaths_list = [d for d in deaths if isinstance(d, dict)] if isinstance(deaths, list) else []
-            for d in deaths_list[:6]:
-                time_s = str(d.get("time") or d.get("date") or "").strip()
-                lvl_s = str(d.get("level") or "").strip()
+            for d in islice(deaths, 6):
+                # Formato conhecido do TibiaData: acesso direto; outros formatos caem no .get().
+                try:
+                    time_v, lvl_v, reason_v = _DEATH_FIELDS(d)
+                except KeyError:
+                    time_v, lvl_v, reason_v = d.get("time"), d.get("level"), d.get("reason")
+                time_s = str(time_v or d.get("date") or "").strip()
+                lvl_s = str(lvl_v or "").strip()
                 xp_s = str(d.get("exp_lost") or d.get("xp_lost") or "").strip()
-                reason_s = str(d.get("reason") or d.get("description") or "").strip()
+                reason_s = str(reason_v or d.get("description") or "").strip()
                 if not reason_s:
                     continue
 
@@ -519,7 +610,8 @@ class CharControllerMixin:
                 short_reason = self._shorten_death_reason(reason_s)
                 it = TwoLineIconListItem(text=short_reason or reason_s, secondary_text=meta or " ")
                 it.add_widget(IconLeftWidget(icon="skull"))
-                it.bind(on_release=lambda *_ , rr=reason_s, mm=meta: self._show_text_dialog("Morte", f"{rr}\n\n{mm}".strip()))
+                it._death = (reason_s, meta)
+                it.bind(on_release=on_death)
                 dlist.add_widget(it)
 
             if len(dlist.children) == 0:
@@ -530,33 +622,17 @@ class CharControllerMixin:
             # ----------------------------
             # Card: Outros chars na conta
             # ----------------------------
-            if "char_account_list" in home.ids:
+            if "char_account_list" in ids:
                 try:
-                    alist = home.ids.char_account_list
+                    alist = ids.char_account_list
                     alist.clear_widgets()
 
-                    others = payload.get("other_characters")
-                    if others is None:
-                        others = payload.get("other_chars")
-                    if not isinstance(others, list):
-                        others = []
+                    # Já normalizada no worker (CharView): lista de dicts com name/world/status em str.
+                    others = payload.get("other_characters") or []
 
                     # remove o próprio char, se vier na lista
                     cur_l = (title or "").strip().lower()
-                    cleaned = []
-                    for oc in others:
-                        if not isinstance(oc, dict):
-                            continue
-                        nm = str(oc.get("name") or oc.get("title") or "").strip()
-                        if not nm:
-                            continue
-                        if cur_l and nm.strip().lower() == cur_l:
-                            continue
-                        cleaned.append({
-                            "name": nm,
-                            "world": str(oc.get("world") or "").strip(),
-                            "status": str(oc.get("status") or "").strip().lower(),
-                        })
+                    cleaned = [oc for oc in others if oc["name"].lower() != cur_l]
 
                     if not cleaned:
                         aitem = OneLineIconListItem(text="Nenhum outro personagem visível na conta.")
@@ -564,11 +640,9 @@ class CharControllerMixin:
                         alist.add_widget(aitem)
                     else:
                         # ordena por nome
-                        cleaned.sort(key=lambda x: x.get("name", "").lower())
+                        cleaned.sort(key=lambda x: x["name"].lower())
                         for oc in cleaned:
-                            nm = oc.get("name") or ""
-                            ww = oc.get("world") or ""
-                            st2 = oc.get("status") or ""
+                            nm, ww, st2 = oc["name"], oc["world"], oc["status"]
 
                             # Se tivermos status, mostra junto; senão só o world.
                             sec = ww if ww else " "
@@ -578,22 +652,20 @@ class CharControllerMixin:
                             icon = "wifi" if st2 == "online" else "wifi-off" if st2 == "offline" else "account"
                             it = TwoLineIconListItem(text=nm, secondary_text=sec or " ")
                             it.add_widget(IconLeftWidget(icon=icon))
-                            it.bind(on_release=lambda *_ , nn=nm: self.open_char_from_account_list(nn))
+                            it.bind(on_release=self._on_account_char_release)
                             alist.add_widget(it)
                 except Exception:
                     pass
             return
 
         # Fallback antigo (se ainda existir)
-        if "char_status" in home.ids:
-            home.ids.char_status.text = (
-                f"Status: {status}\n"
-                f"Vocation: {voc}\n"
-                f"Level: {level}\n"
-                f"World: {world}\n"
-                f"{guild_line}\n"
-                f"{house_line}"
+        if ids is not None and "char_status" in ids:
+            ids.char_status.text = (
+                f"Status: {status}\nVocation: {voc}\nLevel: {level}\nWorld: {world}"
+                + (f"\n{guild_line}" if guild_line else "")
+                + (f"\n{house_line}" if house_line else "")
             )
+
     def search_character(self, *, silent: bool = False):
         home = self._get_home_screen()
         ids = getattr(home, "ids", None) if home is not None else None
@@ -604,17 +676,27 @@ class CharControllerMixin:
                 self.toast("Digite o nome do char.")
             return
 
-        # Marca como "buscando" imediatamente (UI responsiva).
-        self._char_set_loading(home, name)
-        home.char_last_url = ""
-        home.char_xp_source_url = ""
-
         # Token para evitar que resultados de buscas antigas sobrescrevam a busca atual.
         try:
-            self._char_search_seq = int(getattr(self, "_char_search_seq", 0)) + 1
+            seq = int(getattr(self, "_char_search_seq", 0)) + 1
         except (TypeError, ValueError):
-            self._char_search_seq = int(time.time() * 1000)
-        seq = self._char_search_seq
+            seq = int(time.time() * 1000)
+
+        inflight_key = name.lower()
+        if not self._char_search_claim(inflight_key, seq):
+            if not silent:
+                self.toast("Já buscando...")
+            return
+        self._char_search_seq = seq
+
+        try:
+            # Marca como "buscando" imediatamente (UI responsiva).
+            self._char_set_loading(home, name)
+            home.char_last_url = ""
+            home.char_xp_source_url = ""
+        except Exception:
+            self._char_search_release(inflight_key, seq)
+            raise
 
         def done_stage1(ok: bool, payload_or_msg, url: str):
             if getattr(self, "_char_search_seq", None) != seq:
@@ -673,65 +755,52 @@ class CharControllerMixin:
             home.char_xp_source_url = str(payload.get("gs_exp_url") or "")
             self._char_show_result(home, payload, side_effects=False)
 
+        released = False
+
+        def release_claim():
+            nonlocal released
+            if not released:
+                released = True
+                self._char_search_release(inflight_key, seq)
+
         def worker():
             try:
                 data = fetch_character_tibiadata(name)
                 if not data:
                     raise ValueError("Sem resposta da API.")
     
-                character_wrapper = data.get("character", {})
-                character = character_wrapper.get("character", character_wrapper) if isinstance(character_wrapper, dict) else {}
-    
-                url = f"https://www.tibia.com/community/?subtopic=characters&name={name.replace(' ', '+')}"
-                title = str(character.get("name") or name)
+                # Validação/normalização do JSON acontece uma vez só (CharView com tipos garantidos).
+                view = normalize_character(data)
     
-                voc = character.get("vocation", "N/A")
-                level = character.get("level", "N/A")
-                world = character.get("world", "N/A")
+                url = character_page_url(name)
+                title = view.name or name
+                voc, level, world = view.vocation, view.level, view.world
     
                 # Status: prioriza TibiaData (rápido). Dados oficiais (tibia.com) ficam para o "enriquecimento".
-                status_raw = str(character.get("status") or "").strip().lower()
+                status_raw = view.status
                 status = "online" if status_raw == "online" else "offline"
 
                 # Correção: TibiaData/tibia.com podem dar falso OFF.
                 # A lista oficial de players online por world costuma ser a fonte mais confiável.
+                # O erro conhecido é só o falso OFF: se o TibiaData já diz "online", o stage 1
+                # confia nele sem outra requisição (a confirmação fica para o stage 2).
+                # As listas buscadas ficam em world_online (reuso no stage 2).
+                status_trusted_from_api = status_raw == "online"
                 world_status_checked = False
+                world_online = {}
                 try:
                     w_clean = str(world or "").strip()
-                    if w_clean and w_clean.upper() != "N/A":
+                    if not status_trusted_from_api and w_clean and w_clean.upper() != "N/A":
                         online_set = self._fetch_world_online_players(w_clean, timeout=12)
                         if online_set is not None:
+                            world_online[w_clean.lower()] = online_set
                             world_status_checked = True
-                            status = "online" if (title or name).strip().lower() in online_set else "offline"
+                            status = "online" if title.strip().lower() in online_set else "offline"
                 except Exception:
                     world_status_checked = False
     
-                guild = character.get("guild") or {}
-                guild_name = ""
-                guild_rank = ""
-                if isinstance(guild, dict) and guild.get("name"):
-                    guild_name = str(guild.get("name") or "").strip()
-                    guild_rank = str(guild.get("rank") or guild.get("title") or "").strip()
-    
-                guild_line = (
-                    f"Guild: {guild_name}{(' (' + guild_rank + ')') if guild_rank else ''}"
-                    if guild_name
-                    else "Guild: N/A"
-                )
-    
-                houses = character.get("houses") or []
-                houses_list = []
-                if isinstance(houses, list):
-                    for h in houses:
-                        if isinstance(h, dict):
-                            hn = str(h.get("name") or h.get("house") or "").strip()
-                            ht = str(h.get("town") or "").strip()
-                            if hn and ht:
-                                houses_list.append(f"{hn} ({ht})")
-                            elif hn:
-                                houses_list.append(hn)
-                        elif isinstance(h, str) and h.strip():
-                            houses_list.append(h.strip())
+                guild_name, guild_rank, guild_line = view.guild_name, view.guild_rank, view.guild_line
+                houses_list = view.houses_list
     
                 if houses_list:
                     if len(houses_list) == 1:
@@ -741,71 +810,15 @@ class CharControllerMixin:
                 else:
                     house_line = "Houses: Nenhuma"
     
-                deaths = (character.get('deaths') or character_wrapper.get('deaths') or data.get('deaths') or [])
-                if not isinstance(deaths, list):
-                    deaths = []
-
-                # Outros personagens visíveis na conta (TibiaData)
-                def _find_other_chars(obj):
-                    try:
-                        if isinstance(obj, dict):
-                            if "other_characters" in obj:
-                                return obj.get("other_characters")
-                            # alguns wrappers mudam o formato
-                            for vv in obj.values():
-                                r = _find_other_chars(vv)
-                                if r is not None:
-                                    return r
-                        elif isinstance(obj, list):
-                            for vv in obj:
-                                r = _find_other_chars(vv)
-                                if r is not None:
-                                    return r
-                    except Exception:
-                        return None
-                    return None
-
-                other_raw = None
-                try:
-                    other_raw = character.get("other_characters")
-                except Exception:
-                    other_raw = None
-                if other_raw is None:
-                    try:
-                        other_raw = character_wrapper.get("other_characters")
-                    except Exception:
-                        other_raw = None
-                if other_raw is None:
-                    other_raw = _find_other_chars(data)
-
-                other_chars = []
-                try:
-                    if isinstance(other_raw, dict) and "other_characters" in other_raw:
-                        other_raw = other_raw.get("other_characters")
-                    if isinstance(other_raw, list):
-                        for oc in other_raw:
-                            if isinstance(oc, dict):
-                                nm = str(oc.get("name") or oc.get("character") or oc.get("title") or "").strip()
-                                if not nm:
-                                    continue
-                                other_chars.append({
-                                    "name": nm,
-                                    "world": str(oc.get("world") or "").strip(),
-                                    "status": str(oc.get("status") or "").strip().lower(),
-                                })
-                            elif isinstance(oc, str) and oc.strip():
-                                other_chars.append({"name": oc.strip(), "world": "", "status": ""})
-                except Exception:
-                    other_chars = []
+                deaths = view.deaths
+                other_chars = view.other_characters
     
                 # Fonte do XP 30 dias (GuildStats tab=9)
-                gs_exp_url = f"https://guildstats.eu/character?nick={urllib.parse.quote((title or name), safe='')}&tab=9"
+                gs_exp_url = guildstats_exp_url(title)
     
                 # Fallback robusto imediato: estimativa local (não depende de scraping)
                 # (A etapa 2 tenta sobrescrever com valores do GuildStats se disponíveis.)
                 for d in deaths:
-                    if not isinstance(d, dict):
-                        continue
                     if d.get("exp_lost"):
                         continue
                     lvl = d.get("level")
@@ -901,7 +914,9 @@ class CharControllerMixin:
                     payload["last_login_ago"] = None
     
                 # Mostra o resultado básico imediatamente.
-                Clock.schedule_once(lambda *_: done_stage1(True, payload, url), 0)
+                self.post_ui(done_stage1, True, payload, url)
+                # O enriquecimento não bloqueia uma nova busca do mesmo nome.
+                release_claim()
     
                 # Se outra busca começou, não continua.
                 if getattr(self, "_char_search_seq", None) != seq:
@@ -912,6 +927,22 @@ class CharControllerMixin:
                 # - roda em background
                 # - não bloqueia a exibição do resultado básico
                 # -----------------------------------------------------------
+                # As duas consultas ao GuildStats não dependem do status: disparam já,
+                # em paralelo com as checagens de status abaixo (latência ~max, não soma).
+                gs_name = title or name
+                gs_key = gs_name.strip().lower()
+                light_only = self._is_android()
+                fut_exp = fut_death_xp = None
+                try:
+                    gs_pool = self._guildstats_pool()
+                    if self._cache_get(f"gs_exp_rows:{gs_key}", ttl_seconds=10 * 60) is None:
+                        fut_exp = gs_pool.submit(fetch_guildstats_exp_changes, gs_name, light_only=light_only)
+                    if payload.get("deaths") and self._cache_get(f"gs_death_xp:{gs_key}", ttl_seconds=6 * 3600) is None:
+                        fut_death_xp = gs_pool.submit(fetch_guildstats_deaths_xp, gs_name, light_only=light_only)
+                    # Não bloqueia aqui: os resultados são lidos mais abaixo via .result().
+                except Exception:
+                    fut_exp = fut_death_xp = None
+
                 try:
                     # Status "oficial": tenta novamente via /v4/world (mais confiável) e evita sobrescrever se já checamos.
                     if not bool(payload.get("_world_status_checked")):
@@ -920,6 +951,7 @@ class CharControllerMixin:
                             if w_clean2 and w_clean2.upper() != "N/A":
                                 online_set2 = self._fetch_world_online_players(w_clean2, timeout=12)
                                 if online_set2 is not None:
+                                    world_online[w_clean2.lower()] = online_set2
                                     payload["_world_status_checked"] = True
                                     payload["status"] = "online" if (title or name).strip().lower() in online_set2 else "offline"
                         except Exception:
@@ -939,13 +971,11 @@ class CharControllerMixin:
                     # Outros chars: tenta refinar o status via /v4/world/{world}
                     try:
                         others = payload.get("other_characters")
-                        if isinstance(others, list) and others:
+                        if others:
                             # agrupa worlds para evitar chamadas duplicadas
                             worlds_map = {}
                             for oc in others:
-                                if not isinstance(oc, dict):
-                                    continue
-                                ww = str(oc.get("world") or "").strip()
+                                ww = oc["world"]
                                 if not ww or ww.upper() == "N/A":
                                     continue
                                 worlds_map.setdefault(ww, []).append(oc)
@@ -954,17 +984,16 @@ class CharControllerMixin:
                             for i, (ww, lst) in enumerate(list(worlds_map.items())):
                                 if i >= 5:
                                     break
-                                try:
-                                    online_setw = self._fetch_world_online_players(ww, timeout=10)
-                                except Exception:
-                                    online_setw = None
+                                online_setw = world_online.get(ww.lower())
+                                if online_setw is None:
+                                    try:
+                                        online_setw = self._fetch_world_online_players(ww, timeout=10)
+                                    except Exception:
+                                        online_setw = None
                                 if online_setw is None:
                                     continue
                                 for oc in lst:
-                                    nm_l = str(oc.get("name") or "").strip().lower()
-                                    if not nm_l:
-                                        continue
-                                    oc["status"] = "online" if nm_l in online_setw else "offline"
+                                    oc["status"] = "online" if oc["name"].lower() in online_setw else "offline"
                             payload["other_characters"] = others
                     except Exception:
                         pass
@@ -1018,7 +1047,10 @@ class CharControllerMixin:
                         key = f"gs_exp_rows:{(title or name).strip().lower()}"
                         rows = self._cache_get(key, ttl_seconds=10 * 60)
                         if rows is None:
-                            rows = fetch_guildstats_exp_changes(title or name, light_only=self._is_android())
+                            if fut_exp is not None:
+                                rows = fut_exp.result()
+                            else:
+                                rows = fetch_guildstats_exp_changes(title or name, light_only=light_only)
                             try:
                                 self._cache_set(key, rows or [])
                             except Exception:
@@ -1064,7 +1096,10 @@ class CharControllerMixin:
                             xp_list = self._cache_get(key2, ttl_seconds=6 * 3600)
                             if xp_list is None:
                                 try:
-                                    xp_list = fetch_guildstats_deaths_xp(title or name, light_only=self._is_android())
+                                    if fut_death_xp is not None:
+                                        xp_list = fut_death_xp.result()
+                                    else:
+                                        xp_list = fetch_guildstats_deaths_xp(title or name, light_only=light_only)
                                 except Exception:
                                     xp_list = []
                                 try:
@@ -1076,7 +1111,7 @@ class CharControllerMixin:
                             for i, d in enumerate(deaths2):
                                 if i >= len(xp_list):
                                     break
-                                if isinstance(d, dict) and xp_list[i]:
+                                if xp_list[i]:
                                     d["exp_lost"] = xp_list[i]
                             payload["deaths"] = deaths2
                     except Exception:
@@ -1088,42 +1123,45 @@ class CharControllerMixin:
     
                 # Aplica o enrichment na UI (sem side-effects)
                 if getattr(self, "_char_search_seq", None) == seq:
-                    Clock.schedule_once(lambda *_: done_stage2(payload, url), 0)
+                    self.post_ui(done_stage2, payload, url)
     
             except Exception as e:
-                Clock.schedule_once(lambda *_: done_stage1(False, f"Erro: {e}", ""), 0)
-    
-        threading.Thread(target=worker, daemon=True).start()
+                msg = f"Erro: {e}"
+                self.post_ui(done_stage1, False, msg, "")
+            finally:
+                release_claim()
+
+        try:
+            self.run_bg(worker)
+        except Exception:
+            release_claim()
+            raise
     def open_last_in_browser(self):
-        home = self.root.get_screen("home")
+        home = self._screen("home")
         url = getattr(home, "char_last_url", "") or ""
         if not url:
             self.toast("Sem link ainda. Faça uma busca primeiro.")
             return
-        webbrowser.open(url)
+        open_url(url)
     def open_char_xp_source(self):
         """Abre a fonte do histórico de XP (GuildStats tab=9) no navegador."""
-        home = self.root.get_screen("home")
+        home = self._screen("home")
         url = getattr(home, "char_xp_source_url", "") or ""
         if not url:
             self.toast("Sem link ainda. Faça uma busca primeiro.")
             return
-        webbrowser.open(url)
+        open_url(url)
     def add_current_to_favorites(self):
-        home = self.root.get_screen("home")
+        home = self._screen("home")
         name = (home.ids.char_name.text or "").strip()
         if not name:
             self.toast("Digite o nome do char.")
             return
         if name not in self.favorites:
-            self.favorites.append(name)
-            self.favorites.sort(key=lambda s: s.lower())
+            # A lista já está ordenada (case-insensitive): insere na posição certa.
+            bisect.insort(self.favorites, name, key=str.lower)
+            # mantém serviço em sync: save_favorites reavalia o serviço após gravar o arquivo
             self.save_favorites()
-            # mantém serviço em sync
-            try:
-                self._maybe_start_fav_monitor_service()
-            except Exception:
-                pass
             self.refresh_favorites_list()
             self.toast("Adicionado aos favoritos.")
         else:
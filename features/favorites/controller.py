@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import threading
-import urllib.parse
-import webbrowser
 from datetime import datetime
+from functools import partial
 from typing import List, Optional
 
 from kivy.clock import Clock
@@ -13,10 +11,17 @@ from kivymd.uix.list import OneLineIconListItem, TwoLineIconListItem, IconLeftWi
 from kivymd.uix.menu import MDDropdownMenu
 
 from integrations.tibiadata import fetch_character_tibiadata, is_character_online_tibiadata
-from integrations.tibia_com import fetch_world_online_players, is_character_online_tibia_com
+from integrations.tibia_com import character_page_url, fetch_world_online_players, is_character_online_tibia_com
+from services.browser import open_url
 from services.error_reporting import log_current_exception
 
 
+# Cores do status (secondary_text_color) das linhas de favoritos
+_FAV_ONLINE_COLOR = (0.2, 0.75, 0.35, 1)
+_FAV_OFFLINE_COLOR = (0.95, 0.3, 0.3, 1)
+_FAV_PENDING_COLOR = (0.7, 0.7, 0.7, 1)
+
+
 class FavoritesControllerMixin:
     def _get_home_screen(self):
         root = getattr(self, "root", None)
@@ -35,11 +40,18 @@ class FavoritesControllerMixin:
         return ids if ids is not None else {}
 
     def _get_favorites_container(self):
+        # Chamado a cada tick de auto-atualização e a cada status recebido: a tela e o
+        # MDList não mudam depois do build, então a referência é resolvida uma vez.
+        cached = getattr(self, "_fav_container_ref", None)
+        if cached is not None:
+            return cached
         home = self._get_home_screen()
         if home is None:
             return None, None
         ids = self._get_home_ids(home)
         container = ids.get("fav_list") if hasattr(ids, "get") else None
+        if container is not None:
+            self._fav_container_ref = (home, container)
         return home, container
 
     def _favorite_names(self) -> list[str]:
@@ -94,9 +106,14 @@ class FavoritesControllerMixin:
         item.add_widget(IconLeftWidget(icon="account"))
         item.secondary_theme_text_color = "Custom"
         item.secondary_text_color = color
-        item.bind(on_release=lambda _item, n=name: self._fav_actions(n, _item))
+        item._url = character_page_url(name)
+        item.bind(on_release=self._on_fav_release)
         return item
 
+    def _on_fav_release(self, item) -> None:
+        # Um único handler para todas as linhas: o nome vem do próprio widget.
+        self._fav_actions(item.text, item)
+
     def _update_existing_fav_item(self, item, secondary: str, color) -> None:
         item.secondary_text = secondary
         item.secondary_text_color = color
@@ -111,6 +128,56 @@ class FavoritesControllerMixin:
             return True
         return any((name or "").strip().lower() not in items for name in names)
 
+    @staticmethod
+    def _fav_single_change(old: list[str], new: list[str]) -> Optional[tuple[str, int]]:
+        """("add"|"remove", índice) se `new` difere de `old` por exatamente 1 nome; senão None."""
+        if abs(len(old) - len(new)) != 1:
+            return None
+        if len(new) > len(old):
+            longer, shorter, op = new, old, "add"
+        else:
+            longer, shorter, op = old, new, "remove"
+        i = 0
+        while i < len(shorter) and shorter[i] == longer[i]:
+            i += 1
+        if longer[i + 1:] != shorter[i:]:
+            return None
+        return op, i
+
+    def _fav_row_presentation(self, name: str, key: str, service_last, force: bool):
+        svc = service_last.get(key) if isinstance(service_last, dict) else None
+        if isinstance(svc, dict) and self._service_entry_is_fresh(svc, max_age_s=90):
+            state, off_iso, seen_iso = self._sync_service_entry_to_cache(name, key, svc)
+        else:
+            state, off_iso, seen_iso = self._fallback_state_from_cache(name, force)
+        return self._fav_status_presentation(state, off_iso, seen_iso, None)
+
+    def _patch_fav_rows(self, container, names: list[str], signature: list[str], service_last) -> bool:
+        """Add/remove de um único favorito: mexe só naquela linha em vez de refazer a lista."""
+        items = getattr(self, "_fav_items", None)
+        old = getattr(self, "_fav_rendered_signature", None)
+        if not names or not items or not old:
+            return False
+        change = self._fav_single_change(old, signature)
+        if change is None:
+            return False
+        op, i = change
+        try:
+            if op == "remove":
+                container.remove_widget(items.pop(old[i]))
+            else:
+                name, key = names[i], signature[i]
+                secondary, color = self._fav_row_presentation(name, key, service_last, False)
+                item = self._build_fav_item(name, secondary, color)
+                # children do Kivy ficam em ordem inversa: índice conta a partir do fim.
+                container.add_widget(item, index=len(container.children) - i)
+                items[key] = item
+        except Exception:
+            log_current_exception(prefix="[fav] falha ao atualizar linha; refazendo a lista")
+            return False
+        self._fav_rendered_signature = signature
+        return True
+
     def _needs_status_check(self, name: str, service_last: dict, force: bool) -> bool:
         key = (name or "").strip().lower()
         svc = service_last.get(key) if isinstance(service_last, dict) else None
@@ -119,6 +186,32 @@ class FavoritesControllerMixin:
         state = None if force else self._get_cached_fav_status(name)
         return bool(force or state is None or self._fav_status_needs_refresh(name, ttl_seconds=45))
 
+    def _start_fav_refresh_timer(self) -> None:
+        if getattr(self, "_fav_refresh_event", None) is None:
+            self._fav_refresh_event = Clock.schedule_interval(self._fav_refresh_tick, 30)
+
+    def _stop_fav_refresh_timer(self) -> None:
+        ev = getattr(self, "_fav_refresh_event", None)
+        self._fav_refresh_event = None
+        if ev is not None:
+            ev.cancel()
+
+    def _fav_refresh_tick(self, _dt) -> None:
+        # Sem favoritos não há status a atualizar (o estado vazio já está na tela);
+        # com a lista escondida (outra aba ou outra tela) ela é atualizada ao voltar
+        # para ela (on_fav_tab_shown: toque na aba ou _navigate_to_route).
+        if not self.favorites:
+            return
+        if self._get_current_screen_name() != "home" or self._get_current_home_tab() != "tab_fav":
+            return
+        try:
+            self.refresh_favorites_list(silent=True)
+        except Exception:
+            log_current_exception(prefix="[fav] auto-atualização falhou")
+
+    def on_fav_tab_shown(self, *_args) -> None:
+        self._fav_refresh_tick(0)
+
     def refresh_favorites_list(self, silent: bool = False, force: bool = False):
         """Renderiza/atualiza a lista de Favoritos sem travar a UI."""
         _home, container = self._get_favorites_container()
@@ -134,6 +227,8 @@ class FavoritesControllerMixin:
             log_current_exception(prefix="[fav] snapshot do serviço falhou")
 
         need_rebuild = self._needs_fav_rebuild(signature, names, force)
+        if need_rebuild and not force and self._patch_fav_rows(container, names, signature, service_last):
+            need_rebuild = False
 
         if need_rebuild:
             try:
@@ -154,14 +249,8 @@ class FavoritesControllerMixin:
 
             for name in names:
                 key = name.lower()
-                svc = service_last.get(key) if isinstance(service_last, dict) else None
-                use_svc = isinstance(svc, dict) and self._service_entry_is_fresh(svc, max_age_s=90)
                 try:
-                    if use_svc:
-                        state, off_iso, seen_iso = self._sync_service_entry_to_cache(name, key, svc)
-                    else:
-                        state, off_iso, seen_iso = self._fallback_state_from_cache(name, force)
-                    secondary, color = self._fav_status_presentation(state, off_iso, seen_iso, None)
+                    secondary, color = self._fav_row_presentation(name, key, service_last, force)
                     item = self._build_fav_item(name, secondary, color)
                     self._fav_items[key] = item
                     container.add_widget(item)
@@ -173,14 +262,8 @@ class FavoritesControllerMixin:
                 item = getattr(self, "_fav_items", {}).get(key)
                 if item is None:
                     continue
-                svc = service_last.get(key) if isinstance(service_last, dict) else None
-                use_svc = isinstance(svc, dict) and self._service_entry_is_fresh(svc, max_age_s=90)
                 try:
-                    if use_svc:
-                        state, off_iso, seen_iso = self._sync_service_entry_to_cache(name, key, svc)
-                    else:
-                        state, off_iso, seen_iso = self._fallback_state_from_cache(name, force)
-                    secondary, color = self._fav_status_presentation(state, off_iso, seen_iso, None)
+                    secondary, color = self._fav_row_presentation(name, key, service_last, force)
                     self._update_existing_fav_item(item, secondary, color)
                 except Exception:
                     log_current_exception(prefix=f"[fav] falha ao atualizar favorito: {name}")
@@ -199,11 +282,7 @@ class FavoritesControllerMixin:
         self._fav_status_job_id = int(getattr(self, "_fav_status_job_id", 0)) + 1
         job_id = self._fav_status_job_id
         self._fav_refreshing = True
-        threading.Thread(
-            target=self._refresh_fav_statuses_worker,
-            args=(names_to_check, job_id),
-            daemon=True,
-        ).start()
+        self.run_bg(self._refresh_fav_statuses_worker, names_to_check, job_id)
 
     def _get_cached_fav_status(self, name: str) -> Optional[str]:
         key_clean = (name or "").strip().lower()
@@ -293,7 +372,7 @@ class FavoritesControllerMixin:
     ) -> tuple[str, tuple]:
         state_label = str(state).strip().lower() if state is not None else ""
         if state_label == "online" or state is True:
-            return "Online", (0.2, 0.75, 0.35, 1)
+            return "Online", _FAV_ONLINE_COLOR
         if state_label == "offline" or state is False:
             extra = ""
             iso = offline_since_iso or last_seen_online_iso or fallback_last_login_iso
@@ -304,8 +383,8 @@ class FavoritesControllerMixin:
                     ago = ""
                 if ago:
                     extra = f" • {ago}"
-            return f"Offline{extra}", (0.95, 0.3, 0.3, 1)
-        return "Atualizando...", (0.7, 0.7, 0.7, 1)
+            return f"Offline{extra}", _FAV_OFFLINE_COLOR
+        return "Atualizando...", _FAV_PENDING_COLOR
 
     def _set_fav_item_status(
         self,
@@ -375,11 +454,10 @@ class FavoritesControllerMixin:
 
     def _open_fav_on_site(self, name: str) -> None:
         self._dismiss_fav_menu()
-        url = (
-            "https://www.tibia.com/community/?subtopic=characters&name="
-            + urllib.parse.quote_plus(str(name or ""))
-        )
-        webbrowser.open(url)
+        # A URL já é montada junto com a linha da lista; só recalcula se não houver.
+        item = (getattr(self, "_fav_items", None) or {}).get((name or "").strip().lower())
+        url = getattr(item, "_url", None) or character_page_url(name)
+        open_url(url)
 
     def _remove_favorite(self, name: str) -> None:
         self._dismiss_fav_menu()
@@ -393,11 +471,11 @@ class FavoritesControllerMixin:
             return
 
         self.favorites = new_favorites
+        removed_during_load = getattr(self, "_fav_removed_during_load", None)
+        if removed_during_load is not None:
+            removed_during_load.add(key)
+        # save_favorites reavalia o serviço depois que o arquivo for gravado
         self.save_favorites()
-        try:
-            self._maybe_start_fav_monitor_service()
-        except Exception:
-            log_current_exception(prefix="[fav] falha ao sincronizar serviço após remover favorito")
         self._cache_set(f"fav_status:{key}", None)
         self._ensure_fav_status_cache().pop(key, None)
         self.refresh_favorites_list()
@@ -467,11 +545,11 @@ class FavoritesControllerMixin:
                     off_iso = None
                 updates.append((name, str(state), off_iso, seen_iso))
 
-            Clock.schedule_once(lambda _dt, ups=updates: self._apply_fav_status_updates(ups, job_id), 0)
+            self.post_ui(self._apply_fav_status_updates, updates, job_id)
         except Exception:
             log_current_exception(prefix="[fav] worker de refresh falhou")
         finally:
-            Clock.schedule_once(lambda _dt: setattr(self, "_fav_refreshing", False), 0)
+            self.post_ui(setattr, self, "_fav_refreshing", False)
 
     def _fetch_character_online_state(self, name: str) -> Optional[str]:
         try:
@@ -497,48 +575,52 @@ class FavoritesControllerMixin:
             log_current_exception(prefix="[fav] ação do menu falhou")
             self.show_snackbar("Erro ao executar ação.")
 
+    def _fav_menu_run(self, action, *_args) -> None:
+        name = getattr(self, "_fav_menu_target", "") or ""
+        self._run_fav_action(lambda: action(name))
+
+    def _fav_menu_items(self) -> list[dict]:
+        # Os itens não dependem do favorito: a ação lê `_fav_menu_target` na hora do toque.
+        actions = (
+            ("Ver no app", self._open_fav_in_app),
+            ("Abrir no site", self._open_fav_on_site),
+            ("Copiar nome", self._copy_fav_name),
+            ("Remover dos favoritos", self._remove_favorite),
+        )
+        return [
+            {
+                "viewclass": "OneLineListItem",
+                "text": text,
+                "height": dp(48),
+                "on_release": partial(self._fav_menu_run, action),
+            }
+            for text, action in actions
+        ]
+
     def _fav_actions(self, name: str, caller=None):
         caller = caller or getattr(self, "root", None)
         if caller is None:
             return
         self._dismiss_fav_menu()
+        self._fav_menu_target = name
 
-        menu_items = [
-            {
-                "viewclass": "OneLineListItem",
-                "text": "Ver no app",
-                "height": dp(48),
-                "on_release": lambda *_: self._run_fav_action(lambda: self._open_fav_in_app(name)),
-            },
-            {
-                "viewclass": "OneLineListItem",
-                "text": "Abrir no site",
-                "height": dp(48),
-                "on_release": lambda *_: self._run_fav_action(lambda: self._open_fav_on_site(name)),
-            },
-            {
-                "viewclass": "OneLineListItem",
-                "text": "Copiar nome",
-                "height": dp(48),
-                "on_release": lambda *_: self._run_fav_action(lambda: self._copy_fav_name(name)),
-            },
-            {
-                "viewclass": "OneLineListItem",
-                "text": "Remover dos favoritos",
-                "height": dp(48),
-                "on_release": lambda *_: self._run_fav_action(lambda: self._remove_favorite(name)),
-            },
-        ]
-
+        # Um único menu reaproveitado entre toques (só troca o caller).
+        menu = getattr(self, "_fav_menu_cached", None)
         try:
-            self._fav_menu = MDDropdownMenu(
-                caller=caller,
-                items=menu_items,
-                width_mult=4,
-                max_height=dp(240),
-            )
-            self._fav_menu.open()
+            if menu is None:
+                menu = MDDropdownMenu(
+                    caller=caller,
+                    items=self._fav_menu_items(),
+                    width_mult=4,
+                    max_height=dp(240),
+                )
+                self._fav_menu_cached = menu
+            else:
+                menu.caller = caller
+            self._fav_menu = menu
+            menu.open()
         except Exception:
+            self._fav_menu_cached = None
             log_current_exception(prefix="[fav] falha ao abrir menu")
             self.show_snackbar("Erro ao abrir opções.")
 
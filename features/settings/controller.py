@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import threading
-import webbrowser
-
-from kivy.clock import Clock
-
 from core import state as fav_state
+from services.browser import open_url
 from services.error_reporting import log_current_exception
 from services.release_service import (
     GithubReleaseLookupError,
@@ -50,7 +46,7 @@ class SettingsControllerMixin:
             if "/issues" not in url.lower():
                 url = url.rstrip("/") + "/issues/new"
             try:
-                webbrowser.open(url)
+                open_url(url)
                 return
             except Exception:
                 log_current_exception(prefix="[settings] falha ao abrir feedback")
@@ -58,7 +54,7 @@ class SettingsControllerMixin:
 
     def _apply_settings_to_ui(self):
         try:
-            scr = self.root.get_screen("settings")
+            scr = self._screen("settings")
         except Exception:
             return
         try:
@@ -87,7 +83,7 @@ class SettingsControllerMixin:
 
     def settings_save(self):
         try:
-            scr = self.root.get_screen("settings")
+            scr = self._screen("settings")
         except Exception:
             self.toast("Não consegui abrir as configurações.")
             return
@@ -116,7 +112,7 @@ class SettingsControllerMixin:
             self.toast("Defina a URL do repo nas configurações.")
             return
         try:
-            webbrowser.open(build_releases_url(url))
+            open_url(build_releases_url(url))
         except InvalidGithubRepoUrl:
             self.toast("URL do GitHub inválida.")
         except Exception:
@@ -125,7 +121,7 @@ class SettingsControllerMixin:
 
     def settings_check_updates(self):
         try:
-            scr = self.root.get_screen("settings")
+            scr = self._screen("settings")
         except Exception:
             self.toast("Não consegui abrir as configurações.")
             return
@@ -147,27 +143,18 @@ class SettingsControllerMixin:
             try:
                 result = fetch_latest_release_for_repo_url(url, timeout=15)
                 last_seen = str(self._prefs_get("last_release", "") or "")
-                Clock.schedule_once(
-                    lambda *_: self._updates_done(result.tag, result.html_url, last_seen),
-                    0,
-                )
+                self.post_ui(self._updates_done, result.tag, result.html_url, last_seen)
             except GithubReleaseLookupError as exc:
-                Clock.schedule_once(
-                    lambda *_: setattr(scr.ids.set_status, "text", str(exc)),
-                    0,
-                )
+                self.post_ui(setattr, scr.ids.set_status, "text", str(exc))
             except Exception:
                 log_current_exception(prefix="[settings] falha ao checar updates")
-                Clock.schedule_once(
-                    lambda *_: setattr(scr.ids.set_status, "text", "Erro ao checar releases."),
-                    0,
-                )
+                self.post_ui(setattr, scr.ids.set_status, "text", "Erro ao checar releases.")
 
-        threading.Thread(target=run, daemon=True).start()
+        self.run_bg(run)
 
     def _updates_done(self, tag: str, html_url: str, last_seen: str):
         try:
-            scr = self.root.get_screen("settings")
+            scr = self._screen("settings")
         except Exception:
             return
         self._prefs_set("last_release", tag)
@@ -175,7 +162,7 @@ class SettingsControllerMixin:
             scr.ids.set_status.text = f"Nova versão: {tag}"
             self._show_text_dialog("Update disponível", f"Nova versão encontrada: {tag}\n\nAbrir releases?")
             try:
-                webbrowser.open(html_url)
+                open_url(html_url)
             except Exception:
                 log_current_exception(prefix="[settings] falha ao abrir release encontrada")
         else:
@@ -185,7 +172,7 @@ class SettingsControllerMixin:
     def settings_clear_cache(self):
         self._cache_clear()
         try:
-            self.root.get_screen("settings").ids.set_status.text = "Cache limpo."
+            self._screen("settings").ids.set_status.text = "Cache limpo."
         except Exception:
             log_current_exception(prefix="[settings] falha ao atualizar status após limpar cache")
         self.toast("Cache limpo.")
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import json
 import re
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
-import requests
 from urllib.parse import quote
 
+from integrations.http import http_get
+
 # ExevoPan (Next.js) – algumas rotas variam por idioma.
 EXEVOPAN_URLS = [
     "https://www.exevopan.com/bosses/{world}",
@@ -135,7 +137,7 @@ def _find_best_list(data: Any) -> Optional[List[Dict[str, Any]]]:
     def score_list(lst: List[Any]) -> int:
         if not lst or not all(isinstance(x, dict) for x in lst):
             return 0
-        return sum(1 for x in lst[:300] if isinstance(x, dict) and is_boss_dict(x))  # type: ignore[arg-type]
+        return sum(1 for x in islice(lst, 300) if isinstance(x, dict) and is_boss_dict(x))  # type: ignore[arg-type]
 
     def walk(x: Any) -> None:
         nonlocal best, best_score
@@ -281,7 +283,7 @@ def fetch_exevopan_bosses(world: str, timeout: int = 20) -> List[Dict[str, str]]
     for tpl in EXEVOPAN_URLS:
         url = tpl.format(world=quote(world))
         try:
-            r = requests.get(url, headers=headers, timeout=timeout)
+            r = http_get(url, headers=headers, timeout=timeout)
             if r.status_code >= 400:
                 continue
             html = r.text or ""
@@ -0,0 +1,80 @@
+"""Sessão HTTP compartilhada pelas integrações.
+
+Reaproveita conexões (keep-alive) entre chamadas: no 4G o handshake TCP+TLS
+custa mais que a própria resposta dos endpoints pequenos (TibiaData, boosted...).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_SESSION: Optional[requests.Session] = None
+_LOCK = threading.Lock()
+
+# Limite de requisições simultâneas (evita rajadas que o servidor limita/bloqueia).
+MAX_CONCURRENT_REQUESTS = 4
+_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+class TokenBucket:
+    """Limitador simples (token bucket): `rate` req/s com rajadas de até `capacity`.
+
+    `acquire()` bloqueia a thread chamadora (worker), nunca a UI.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# TibiaData tem rate limit "soft": bursts de busca + worlds + boosted no startup geram 429.
+_HOST_LIMITS: Dict[str, TokenBucket] = {
+    "api.tibiadata.com": TokenBucket(rate=2.0, capacity=4),
+}
+
+
+def get_session() -> requests.Session:
+    """Retorna a sessão compartilhada (criada na primeira chamada, thread-safe)."""
+    global _SESSION
+    session = _SESSION
+    if session is not None:
+        return session
+    with _LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+            _SESSION = session
+        return _SESSION
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET pela sessão compartilhada, com no máx. MAX_CONCURRENT_REQUESTS em paralelo."""
+    bucket = _HOST_LIMITS.get(urlsplit(url).hostname or "")
+    if bucket is not None:
+        bucket.acquire()
+    with _SLOTS:
+        return get_session().get(url, **kwargs)
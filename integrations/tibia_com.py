@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import quote, quote_plus
 
-import requests
-from bs4 import BeautifulSoup
+from integrations.http import http_get
+
+
+def _soup(html: str):
+    # bs4 é pesado para importar no Android; só carrega quando o fallback HTML é usado.
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, "html.parser")
 
 TIBIADATA_CHAR = "https://api.tibiadata.com/v4/character/{name}"
 TIBIADATA_WORLD = "https://api.tibiadata.com/v4/world/{world}"
 TIBIA_CHAR_URL = "https://www.tibia.com/community/?subtopic=characters&name={name}"
 
+
+@lru_cache(maxsize=512)
+def character_page_url(name: str) -> str:
+    """URL da página do char no tibia.com (cacheada: é montada a cada linha/toque)."""
+    return TIBIA_CHAR_URL.format(name=quote_plus(str(name or "").strip()))
+
 _UA = {
     "User-Agent": (
         "Mozilla/5.0 (Linux; Android 13; Mobile) "
@@ -24,7 +37,7 @@ _UA = {
 
 def fetch_character_raw(name: str, timeout: int = 12) -> Dict[str, Any]:
     url = TIBIADATA_CHAR.format(name=quote(str(name)))
-    r = requests.get(url, timeout=timeout, headers=_UA)
+    r = http_get(url, timeout=timeout, headers=_UA)
     r.raise_for_status()
     return r.json() if r.text else {}
 
@@ -45,7 +58,7 @@ def fetch_world_online_players(world: str, timeout: int = 12) -> Optional[Set[st
     try:
         safe_world = quote(str(world).strip())
         url = TIBIADATA_WORLD.format(world=safe_world)
-        r = requests.get(url, timeout=timeout, headers=_UA)
+        r = http_get(url, timeout=timeout, headers=_UA)
         r.raise_for_status()
         data = r.json() if r.text else {}
         wb = (data or {}).get("world", {}) if isinstance(data, dict) else {}
@@ -133,9 +146,8 @@ def death_summary(deaths: List[Dict[str, Any]], max_killers: int = 2) -> str:
 def is_character_online_tibia_com(name: str, world: str, timeout: int = 12, *, light_only: bool = False) -> Optional[bool]:
     _ = world
     try:
-        safe_name = quote_plus(str(name))
-        url = TIBIA_CHAR_URL.format(name=safe_name)
-        r = requests.get(url, timeout=timeout, headers=_UA)
+        url = character_page_url(name)
+        r = http_get(url, timeout=timeout, headers=_UA)
         if r.status_code != 200:
             return None
         html = r.text or ""
@@ -149,7 +161,7 @@ def is_character_online_tibia_com(name: str, world: str, timeout: int = 12, *, l
             pass
         if light_only:
             return None
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
         for tr in soup.find_all("tr"):
             tds = tr.find_all("td")
             if len(tds) < 2:
@@ -220,15 +232,14 @@ def parse_tibia_datetime(raw: str) -> Optional[datetime]:
 
 def fetch_last_login_dt(name: str, timeout: int = 12) -> Optional[datetime]:
     try:
-        safe = quote_plus(str(name))
-        url = TIBIA_CHAR_URL.format(name=safe)
-        r = requests.get(url, timeout=timeout, headers=_UA)
+        url = character_page_url(name)
+        r = http_get(url, timeout=timeout, headers=_UA)
         if r.status_code != 200:
             return None
         html = r.text or ""
         if not html:
             return None
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
         for tr in soup.find_all("tr"):
             tds = tr.find_all("td")
             if len(tds) < 2:
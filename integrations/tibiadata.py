@@ -12,6 +12,7 @@ Também expomos:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 import re
 import time
@@ -19,7 +20,23 @@ import html as _html
 from urllib.parse import quote, quote_plus
 
 import requests
-from bs4 import BeautifulSoup
+
+from core.storage import loads_json
+from integrations.http import http_get
+from integrations.tibia_com import character_page_url
+
+
+def _soup(html: str, only: Optional[str] = None):
+    # bs4 é pesado para importar no Android; só carrega quando o fallback HTML é usado.
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # `only`: monta a árvore apenas das tags pedidas (ex.: "table"), bem mais barato.
+    return BeautifulSoup(html, "html.parser", parse_only=SoupStrainer(only) if only else None)
+
+
+# Fast path do GuildStats (mortes): células "-1.234.567" da coluna Exp lost.
+_GS_EXP_LOST_TD_RE = re.compile(r"<td[^>]*>\s*(-\s*[\d\.,]+)\s*</td>", re.I)
+_DIGITS_RE = re.compile(r"\d+")
 
 
 # TibiaData v4
@@ -33,9 +50,8 @@ GUILDSTATS_DEATHS_URL = "https://guildstats.eu/character?nick={name}&tab=5"
 # GuildStats (fansite) – histórico de experiência (tab=9)
 GUILDSTATS_EXP_URL = "https://guildstats.eu/character?nick={name}&tab=9"
 
-# Tibia.com (oficial) – fallback extra para detectar ONLINE
-# Preferimos a página do personagem (não é paginada como a lista do world).
-TIBIA_CHAR_URL = "https://www.tibia.com/community/?subtopic=characters&name={name}"
+# Tibia.com (oficial) – fallback extra para detectar ONLINE: a página do personagem
+# (não é paginada como a lista do world), montada por character_page_url.
 
 # Alguns sites (principalmente fansites) podem bloquear user-agent genérico.
 # Usamos um UA de navegador comum para reduzir falsos negativos.
@@ -50,16 +66,21 @@ UA = {
 }
 
 
+def guildstats_exp_url(name: str) -> str:
+    """URL do histórico de XP (tab=9) no GuildStats, com o nome em %20 (quote)."""
+    return GUILDSTATS_EXP_URL.format(name=quote(name, safe=""))
+
+
 def _get_json(url: str, timeout: int) -> Dict[str, Any]:
     last_exc: Exception | None = None
     for attempt in range(3):
         try:
-            r = requests.get(url, timeout=timeout, headers=UA)
+            r = http_get(url, timeout=timeout, headers=UA)
             # Alguns endpoints podem devolver 5xx temporariamente
             if int(getattr(r, "status_code", 0) or 0) >= 500:
                 raise requests.HTTPError(f"HTTP {r.status_code}", response=r)
             r.raise_for_status()
-            return r.json()
+            return loads_json(r.content)
         except Exception as e:
             last_exc = e
             if attempt < 2:
@@ -76,7 +97,7 @@ def _get_text(url: str, timeout: int, headers: Optional[dict] = None) -> str:
     last_exc: Exception | None = None
     for attempt in range(3):
         try:
-            r = requests.get(url, timeout=timeout, headers=hdr)
+            r = http_get(url, timeout=timeout, headers=hdr)
             if int(getattr(r, "status_code", 0) or 0) >= 500:
                 raise requests.HTTPError(f"HTTP {r.status_code}", response=r)
             if r.status_code != 200:
@@ -114,6 +135,130 @@ def fetch_character_tibiadata(name: str, timeout: int = 12) -> Dict[str, Any]:
     return _get_json(CHAR_URL.format(name=safe_name), timeout)
 
 
+def _find_other_characters(obj: Any) -> Any:
+    # alguns wrappers mudam o formato; procura "other_characters" em qualquer nível
+    if isinstance(obj, dict):
+        if "other_characters" in obj:
+            return obj.get("other_characters")
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = _find_other_characters(child)
+        if found is not None:
+            return found
+    return None
+
+
+def _normalize_houses(houses: Any) -> List[str]:
+    out: List[str] = []
+    if not isinstance(houses, list):
+        return out
+    for h in houses:
+        if isinstance(h, dict):
+            hn = str(h.get("name") or h.get("house") or "").strip()
+            ht = str(h.get("town") or "").strip()
+            if hn:
+                out.append(f"{hn} ({ht})" if ht else hn)
+        elif isinstance(h, str) and h.strip():
+            out.append(h.strip())
+    return out
+
+
+def _normalize_other_characters(raw: Any) -> List[Dict[str, str]]:
+    if isinstance(raw, dict) and "other_characters" in raw:
+        raw = raw.get("other_characters")
+    out: List[Dict[str, str]] = []
+    if not isinstance(raw, list):
+        return out
+    for oc in raw:
+        if isinstance(oc, dict):
+            nm = str(oc.get("name") or oc.get("character") or oc.get("title") or "").strip()
+            if nm:
+                out.append({
+                    "name": nm,
+                    "world": str(oc.get("world") or "").strip(),
+                    "status": str(oc.get("status") or "").strip().lower(),
+                })
+        elif isinstance(oc, str) and oc.strip():
+            out.append({"name": oc.strip(), "world": "", "status": ""})
+    return out
+
+
+@dataclass
+class CharView:
+    """Projeção validada de /v4/character (tipos garantidos; a UI não revalida)."""
+
+    __slots__ = (
+        "character", "name", "status", "vocation", "level", "world",
+        "guild_name", "guild_rank", "guild_line", "houses_list", "deaths", "other_characters",
+    )
+
+    character: Dict[str, Any]
+    name: str
+    status: str
+    vocation: str
+    level: str
+    world: str
+    guild_name: str
+    guild_rank: str
+    guild_line: str
+    houses_list: List[str]
+    deaths: List[Dict[str, Any]]
+    other_characters: List[Dict[str, str]]
+
+
+def normalize_character(data: Dict[str, Any]) -> CharView:
+    """Valida o JSON de /v4/character uma única vez e devolve um CharView."""
+    data = data if isinstance(data, dict) else {}
+    wrapper = data.get("character", {})
+    character = wrapper.get("character", wrapper) if isinstance(wrapper, dict) else {}
+    if not isinstance(character, dict):
+        character = {}
+    if not isinstance(wrapper, dict):
+        wrapper = {}
+
+    guild = character.get("guild") or {}
+    guild_name = guild_rank = ""
+    if isinstance(guild, dict) and guild.get("name"):
+        guild_name = str(guild.get("name") or "").strip()
+        guild_rank = str(guild.get("rank") or guild.get("title") or "").strip()
+    if guild_name:
+        guild_line = f"Guild: {guild_name} ({guild_rank})" if guild_rank else f"Guild: {guild_name}"
+    else:
+        guild_line = "Guild: N/A"
+
+    deaths = character.get("deaths") or wrapper.get("deaths") or data.get("deaths") or []
+    deaths = [d for d in deaths if isinstance(d, dict)] if isinstance(deaths, list) else []
+
+    other_raw = character.get("other_characters")
+    if other_raw is None:
+        other_raw = wrapper.get("other_characters")
+    if other_raw is None:
+        other_raw = _find_other_characters(data)
+    try:
+        other_chars = _normalize_other_characters(other_raw)
+    except Exception:
+        other_chars = []
+
+    return CharView(
+        character=character,
+        name=str(character.get("name") or "").strip(),
+        status=str(character.get("status") or "").strip().lower(),
+        vocation=str(character.get("vocation") or "N/A"),
+        level=str(character.get("level") or "N/A"),
+        world=str(character.get("world") or "N/A"),
+        guild_name=guild_name,
+        guild_rank=guild_rank,
+        guild_line=guild_line,
+        houses_list=_normalize_houses(character.get("houses") or []),
+        deaths=deaths,
+        other_characters=other_chars,
+    )
+
+
 def fetch_character_snapshot(name: str, timeout: int = 12) -> Dict[str, Any]:
     """Snapshot leve (compat).
 
@@ -132,7 +277,7 @@ def fetch_character_snapshot(name: str, timeout: int = 12) -> Dict[str, Any]:
         "level": ch.get("level"),
         "vocation": ch.get("vocation"),
         "status": ch.get("status"),
-        "url": f"https://www.tibia.com/community/?subtopic=characters&name={quote(name)}",
+        "url": character_page_url(name),
     }
 
 
@@ -202,8 +347,7 @@ def is_character_online_tibia_com(name: str, world: str, timeout: int = 12, *, l
     """
     _ = world  # mantemos o parâmetro por compatibilidade
     try:
-        safe_name = quote_plus(str(name))
-        url = TIBIA_CHAR_URL.format(name=safe_name)
+        url = character_page_url(name)
         html = _get_text(url, timeout=timeout, headers=UA)
         if not html:
             return None
@@ -218,7 +362,7 @@ def is_character_online_tibia_com(name: str, world: str, timeout: int = 12, *, l
         if light_only:
             return None
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
         # A página do char tem uma tabela com linhas "Label" / "Value".
         for tr in soup.find_all("tr"):
             tds = tr.find_all("td")
@@ -282,9 +426,9 @@ def fetch_guildstats_deaths_xp(name: str, timeout: int = 12, *, light_only: bool
                     chunk = html[pos:pos + 20000]  # limite defensivo
 
                 vals: List[str] = []
-                for m1 in re.finditer(r"<td[^>]*>\s*(-\s*[\d\.,]+)\s*</td>", chunk, flags=re.I):
+                for m1 in _GS_EXP_LOST_TD_RE.finditer(chunk):
                     raw = (m1.group(1) or "").strip()
-                    digits = re.findall(r"\d+", raw)
+                    digits = _DIGITS_RE.findall(raw)
                     if not digits:
                         continue
                     num = int("".join(digits))
@@ -299,7 +443,7 @@ def fetch_guildstats_deaths_xp(name: str, timeout: int = 12, *, light_only: bool
         if light_only:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html, only="table")
 
         def norm(s: str) -> str:
             return re.sub(r"\s+", " ", (s or "").strip()).lower()
@@ -382,12 +526,9 @@ def fetch_guildstats_exp_changes(name: str, timeout: int = 12, *, light_only: bo
         # não apenas por texto do cabeçalho.
 
         # Alguns chars só respondem bem com %20 (quote) em vez de + (quote_plus).
-        enc_quote = quote(name, safe="")
-        enc_plus = quote_plus(name)
-
         url_variants = [
-            GUILDSTATS_EXP_URL.format(name=enc_quote),
-            GUILDSTATS_EXP_URL.format(name=enc_plus),
+            guildstats_exp_url(name),
+            GUILDSTATS_EXP_URL.format(name=quote_plus(name)),
         ]
 
         # headers um pouco mais "browser-like" para reduzir bloqueios.
@@ -566,7 +707,7 @@ def fetch_guildstats_exp_changes(name: str, timeout: int = 12, *, light_only: bo
         if light_only:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
 
         def parse_exp_to_int(s: str) -> Optional[int]:
             # exemplos: "+33,820,426" | "-55,947,218" | "0" | "+200,710,181 👍"
@@ -15,16 +15,16 @@ try:
 except Exception:
     Config = None
 
+import calendar
 import os
 import sys
-import json
 import re
 import threading
 import time
-import urllib.parse
-import webbrowser
 import traceback
-import math
+import itertools
+from collections import deque
+from functools import lru_cache, partial
 from datetime import datetime, timedelta, timezone
 from urllib.parse import quote
 from typing import List, Optional
@@ -36,15 +36,13 @@ from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.properties import StringProperty
 from kivy.uix.screenmanager import ScreenManager
-from kivy.utils import platform
 from kivy.uix.behaviors import ButtonBehavior
 
 from kivymd.app import MDApp
 from kivymd.uix.dialog import MDDialog
-from kivymd.uix.button import MDFlatButton, MDRectangleFlatIconButton
+from kivymd.uix.button import MDFlatButton
 from kivymd.uix.list import (
     OneLineIconListItem,
-    OneLineListItem,
     TwoLineIconListItem,
     IconLeftWidget,
 )
@@ -52,27 +50,31 @@ from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDLabel
 from kivymd.uix.behaviors import RectangularRippleBehavior
-from kivymd.uix.scrollview import MDScrollView
+
+# Snackbar: a API mudou entre KivyMD 1.x (Snackbar) e 2.x (MDSnackbar + MDSnackbarText).
+# Resolvido uma vez aqui em vez de reimportar a cada toast.
+try:
+    from kivymd.uix.snackbar import Snackbar as _Snackbar  # type: ignore
+    _SnackbarText = None
+except Exception:
+    try:
+        from kivymd.uix.snackbar import MDSnackbar as _Snackbar, MDSnackbarText as _SnackbarText  # type: ignore
+    except Exception:
+        _Snackbar = _SnackbarText = None
 
 # ---- IMPORTS DO CORE (com proteção para não “fechar sozinho” no Android) ----
 _CORE_IMPORT_ERROR = None
 try:
-    from integrations.tibiadata import (
-        fetch_character_tibiadata,
-        fetch_worlds_tibiadata,
-        is_character_online_tibiadata,
-        fetch_guildstats_deaths_xp,
-        fetch_guildstats_exp_changes,
-    )
-    from integrations.tibia_com import is_character_online_tibia_com, fetch_last_login_dt, parse_tibia_datetime
+    from integrations.tibiadata import fetch_worlds_tibiadata
+    from integrations.tibia_com import character_page_url
     from integrations.exevopan import fetch_exevopan_bosses
-    from core.exp_loss import estimate_death_exp_lost
-    from core.storage import get_data_dir, safe_read_json, safe_write_json
+    from core.storage import get_data_dir
     from core.boosted import fetch_boosted
     from core.training import TrainingInput, compute_training_plan
     from core.hunt import parse_hunt_session_text
     from core.imbuements import fetch_imbuements_table, fetch_imbuement_details, ImbuementEntry
     from core.stamina import parse_hm_text, compute_offline_regen, format_hm
+    from core.utilities import format_int_pt
 except Exception:
     _CORE_IMPORT_ERROR = traceback.format_exc()
 
@@ -81,7 +83,8 @@ KV_FILE = "tibia_tools.kv"
 from services.infrastructure import InfrastructureMixin
 from services.persistence import PersistenceService
 from services.android_bridge import AndroidBridgeService
-from services.error_reporting import install_excepthook, log_current_exception
+from services.browser import open_url
+from services.error_reporting import flush_crash_log, install_excepthook, log_current_exception
 from features.char.controller import CharControllerMixin
 from features.favorites.controller import FavoritesControllerMixin
 from features.settings.controller import SettingsControllerMixin
@@ -95,6 +98,73 @@ install_excepthook(sys)
 
 
 
+@lru_cache(maxsize=512)
+def _boss_wiki_url_for(boss_name: str) -> str:
+    title = boss_name.strip().replace(" ", "_")
+    # index.php?title=... é o formato mais estável do MediaWiki.
+    return f"https://tibiawiki.com.br/index.php?title={quote(title)}"
+
+
+# Sequências literais (ex.: "\\n") vindas do JSON de imbuements -> caracteres reais, num passe só
+_ESC_RE = re.compile(r"\\r\\n|\\n|\\t")
+_ESC_MAP = {"\\r\\n": "\n", "\\n": "\n", "\\t": "\t"}
+
+
+def _clean_escapes(s: str) -> str:
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], s or "").strip()
+
+
+# Campo numérico (aceita vírgula decimal) e "12,5%" nas chances do ExevoPan
+_NUM_RE = re.compile(r"([+-]?(?:\d+(?:[.,]\d*)?|[.,]\d+))")
+# Remove só espaços e "%" (ex.: " 100 %") num único passe; o resto continua inválido
+_CLEAN_NUM_RE = re.compile(r"[\s%]")
+_CHANCE_PCT_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*%")
+
+
+def _parse_num(text: Optional[str], default: float) -> float:
+    """Vazio -> default; número inválido -> ValueError (igual ao float())."""
+    text = _CLEAN_NUM_RE.sub("", text or "")
+    if not text:
+        return default
+    m = _NUM_RE.fullmatch(text)
+    if m is None:
+        raise ValueError(f"número inválido: {text!r}")
+    return float(m.group(1).replace(",", "."))
+
+
+def _icon_list_item(text: str, icon: str, secondary: Optional[str] = None, on_release=None):
+    """Linha de lista com ícone à esquerda (uma ou duas linhas) usada nas telas de listas."""
+    if secondary is None:
+        item = OneLineIconListItem(text=text)
+    else:
+        item = TwoLineIconListItem(text=text, secondary_text=secondary)
+    item.add_widget(IconLeftWidget(icon=icon))
+    if on_release is not None:
+        item.bind(on_release=on_release)
+    return item
+
+
+# Data do tibia.com ("Jan 22 2026, 10:42:00 CET") e limites CET/CEST usados no parse
+_TIBIA_COM_DT_RE = re.compile(r"^([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4}),\s*(\d{2}:\d{2}:\d{2})(?:\s+([A-Za-z]{2,5}))?$")
+
+
+@lru_cache(maxsize=8)
+def _eu_dst_bounds(year: int):
+    """Início/fim do horário de verão europeu (CEST) em hora local, por ano."""
+
+    def last_sunday(month: int) -> datetime:
+        last_day = calendar.monthrange(year, month)[1]
+        d = datetime(year, month, last_day)
+        # weekday: Monday=0 ... Sunday=6
+        return d - timedelta(days=(d.weekday() - 6) % 7)
+
+    return last_sunday(3).replace(hour=2), last_sunday(10).replace(hour=3)
+
+
+# Tier do filtro de imbuements -> atributo do ImbuementEntry que precisa estar preenchido
+_IMBU_TIER_ATTR = {"Basic": "basic", "Intricate": "intricate", "Powerful": "powerful"}
+
+
 class RootSM(ScreenManager):
     pass
 
@@ -128,6 +198,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self._boosted_lock = threading.Lock()
         self._boosted_inflight = False
         self._boosted_last_fetch_mono = 0.0
+        self._boosted_loaded = False
+
+        # Fila de callbacks para a UI vindos de workers (ver post_ui)
+        self._ui_queue = deque()
+        self._ui_lock = threading.Lock()
+        self._ui_flush_scheduled = False
 
         # Android background service handle (favorites monitor)
         self._bg_service = None
@@ -180,18 +256,36 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self.prefs = {}
         self.cache = {}
         self._bosses_filter_debounce_ev = None
+        self._imb_filter_debounce_ev = None
+        self._bosses_render_seq = 0
+        self._imbu_render_seq = 0
+        self._hunt_cache = ("", None)  # (texto analisado, HuntResult) da última análise OK
+        self._hunt_future = None  # análise em andamento no pool
+        self._hunt_pending_raw = ""  # texto da análise mais recente (descarta respostas antigas)
+        self._imbu_load_future = None
         self._menu_boss_filter = None
         self._menu_boss_sort = None
         self._menu_imb_tier = None
 
         self._menu_world: Optional[MDDropdownMenu] = None
+        self._worlds_cache: List[str] = []
         self._menu_skill: Optional[MDDropdownMenu] = None
         self._menu_vocation: Optional[MDDropdownMenu] = None
         self._menu_weapon: Optional[MDDropdownMenu] = None
+        self._training_refs: Optional[dict] = None
+
+        # Diálogo de detalhes de imbuement (reaproveitado entre toques)
+        self._imbu_dialog: Optional[MDDialog] = None
+        self._imbu_fav_btn = None
+        self._imbu_dialog_seq = 0
 
         # Char search history menu
         self._menu_char_history: Optional[MDDropdownMenu] = None
 
+        # Gravação dos favoritos com debounce (ver save_favorites)
+        self._fav_dirty = False
+        self._fav_flush_ev = None
+
         # Favorites (chars) UI/status helpers
         self._fav_items = {}  # lower(char_name) -> list item
         self._fav_status_cache = {}  # lower(char_name) -> last known "online"/"offline"
@@ -238,7 +332,6 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         # Se algum import do core falhar no Android, mostre na tela em vez de fechar.
         if _CORE_IMPORT_ERROR is not None:
             print(_CORE_IMPORT_ERROR)
-            from kivymd.uix.label import MDLabel
             return MDLabel(
                 text="Erro ao importar módulos (core).\nVeja o logcat (Traceback).",
                 halign="center",
@@ -259,32 +352,41 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             kv_ok = True
         except Exception:
             traceback.print_exc()
-            from kivymd.uix.label import MDLabel
             root = MDLabel(text="Erro ao iniciar. Veja o logcat (Traceback).", halign="center")
 
         # ✅ MUITO IMPORTANTE:
         # só agenda funções que usam telas/ids se o KV carregou de verdade.
         if kv_ok and isinstance(root, ScreenManager):
-            self.load_favorites()
+            self._prime_list_screens(root)
+            self.load_favorites_async()
             self._load_prefs_cache()
-            Clock.schedule_once(lambda *_: self._safe_call(self._apply_settings_to_ui), 0)
             # (disabled) background monitor service auto-start for stability
-            Clock.schedule_once(lambda *_: self._safe_call(self._set_initial_home_tab), 0)
+            Clock.schedule_once(self._post_build_init, 0)
             Clock.schedule_once(lambda *_: self._safe_call(self._sync_nav_with_ui), 0.05)
-            Clock.schedule_once(lambda *_: self._safe_call(self.dashboard_refresh), 0)
-
-            Clock.schedule_once(lambda *_: self._safe_call(self.refresh_favorites_list, silent=True), 0)
             # Auto-atualização do status dos favoritos (não faz sentido ficar "travado")
-            if self._fav_refresh_event is None:
-                self._fav_refresh_event = Clock.schedule_interval(
-                    lambda dt: self._safe_call(self.refresh_favorites_list, silent=True),
-                    30,
-                )
-            Clock.schedule_once(lambda *_: self._safe_call(self.update_boosted), 0)
+            self._start_fav_refresh_timer()
+            self.run_bg(self._warm_heavy_imports)
 
         self._bind_android_back()
         return root
 
+    def _post_build_init(self, *_args) -> None:
+        """Inicialização do primeiro frame num único callback do Clock."""
+        self._safe_call(self._apply_settings_to_ui)
+        self._safe_call(self._set_initial_home_tab)
+        self._safe_call(self.dashboard_refresh)
+
+    @staticmethod
+    def _warm_heavy_imports() -> None:
+        """Importa em background o parser HTML (bs4), usado só nos fallbacks de scraping.
+
+        Assim a UI abre sem esperar o bs4 e a primeira busca não paga o import.
+        """
+        try:
+            import bs4  # noqa: F401
+        except Exception:
+            pass
+
     def _safe_call(self, fn, *args, **kwargs):
         """Executa fn e captura exceções, evitando fechar o app no Android."""
         try:
@@ -309,10 +411,14 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         Isso ajuda a não perder dados caso o sistema mate o processo.
         """
         try:
+            self._flush_favorites(sync=True)
             self._flush_prefs_to_disk(force=True)
             self._flush_cache_to_disk(force=True)
+            flush_crash_log()
         except Exception:
             pass
+        # Em background quem acompanha os favoritos é o serviço: o timer da UI para.
+        self._stop_fav_refresh_timer()
         # Garante que o monitor em segundo plano continue rodando mesmo com o app fechado.
         # (Alguns usuários abrem e fecham rápido; isso assegura que o serviço seja iniciado no background.)
         try:
@@ -337,7 +443,13 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 self._disk_event.set()
             except Exception:
                 pass
-            # flush final
+            # flush final (favoritos antes de desligar o pool: nada pendente fica na fila)
+            self._flush_favorites(sync=True)
+            try:
+                self._shutdown_bg_pool()
+                self._shutdown_guildstats_pool()
+            except Exception:
+                pass
             self._flush_prefs_to_disk(force=True)
             self._flush_cache_to_disk(force=True)
         except Exception:
@@ -440,7 +552,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def _set_home_tab_current(self, tab_name: str) -> bool:
         try:
-            home = self.root.get_screen("home")
+            home = self._screen("home")
             bottom_nav = home.ids.get("bottom_nav")
             if bottom_nav is None:
                 return False
@@ -485,6 +597,9 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
         if changed:
             self._nav_current_route = target
+            if target == ("home", "tab_fav"):
+                # troca programática (voltar, deep-link) não dispara on_tab_release
+                self.on_fav_tab_shown()
         return changed
 
     def _go_home_dashboard(self, *, record: bool = True):
@@ -580,7 +695,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     # --------------------
     # Deep-link / Notification click handling (Android)
     # --------------------
-    def _handle_android_intent(self) -> None:
+    def _handle_android_intent(self, *_args) -> None:
         """Se o app foi aberto por uma notificação do serviço, abre a aba Char e (opcionalmente) dispara a busca.
 
         O serviço envia extras no Intent:
@@ -642,7 +757,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
             def apply_and_search(*_):
                 try:
-                    home = self.root.get_screen("home")
+                    home = self._screen("home")
                     if char_name and "char_name" in home.ids:
                         home.ids.char_name.text = str(char_name)
                     if auto_search and char_name:
@@ -681,7 +796,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     def on_start(self):
         # Startup: handle deep-link intents (if any) + request notification permission (Android 13+).
         try:
-            Clock.schedule_once(lambda *_: self._handle_android_intent(), 0.6)
+            Clock.schedule_once(self._handle_android_intent, 0.6)
         except Exception:
             pass
 
@@ -699,9 +814,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             pass
 
     def on_resume(self):
+        self._start_fav_refresh_timer()
+        Clock.schedule_once(self._fav_refresh_tick, 0)
+
         # Quando o usuário toca na notificação com o app em background, isso garante o deep-link.
         try:
-            Clock.schedule_once(lambda *_: self._handle_android_intent(), 0.2)
+            Clock.schedule_once(self._handle_android_intent, 0.2)
         except Exception:
             pass
 
@@ -733,9 +851,10 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         except Exception:
             return
 
-        # garante que os dados estejam atualizados ao entrar
+        # garante que os dados estejam atualizados ao entrar (boosted muda 1x/dia:
+        # resultado com menos de 1h no cache é reaproveitado sem rede)
         try:
-            self.update_boosted(silent=False)
+            self.update_boosted(silent=False, use_cache=True)
         except Exception:
             pass
 
@@ -761,6 +880,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             self._bosses_refresh_worlds()
         elif target == "imbuements":
             self._imbuements_load()
+        elif target == "boosted":
+            # Sem fetch no startup: a tela Boosted carrega na 1ª visita (o card da
+            # Home já se atualiza via dashboard_refresh quando o cache está velho).
+            if not self._boosted_loaded:
+                self._boosted_loaded = True
+                self.update_boosted(use_cache=True)
         elif target == "training":
             self._ensure_training_menus()
         elif target == "settings":
@@ -769,7 +894,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     def dashboard_refresh(self, *_):
         """Atualiza o resumo do Dashboard usando cache e, se possível, dados ao vivo."""
         try:
-            home = self.root.get_screen("home")
+            home = self._screen("home")
             ids = home.ids
         except Exception:
             return
@@ -885,9 +1010,9 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         for _, b in high[:6]:
             name = str(b.get("boss") or b.get("name") or "Boss")
             chance = str(b.get("chance") or "").strip()
-            it = OneLineIconListItem(text=f"{name} ({chance})")
-            it.add_widget(IconLeftWidget(icon="star"))
-            it.bind(on_release=lambda _it, bb=b: self.bosses_open_dialog(bb))
+            it = _icon_list_item(f"{name} ({chance})", "star")
+            it._boss = b
+            it.bind(on_release=self._on_boss_item_release)
             try:
                 ids.dash_boss_list.add_widget(it)
             except Exception:
@@ -910,7 +1035,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             self.toast("Nenhum char salvo ainda.")
             return
         try:
-            webbrowser.open(f"https://www.tibia.com/community/?subtopic=characters&name={last_char.replace(' ', '+')}")
+            open_url(character_page_url(last_char))
         except Exception:
             self.toast("Não consegui abrir o navegador.")
 
@@ -919,14 +1044,14 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     # --------------------
     def copy_deaths_to_clipboard(self):
         try:
-            home = self.root.get_screen("home")
+            home = self._screen("home")
             title = (home.ids.char_title.text or "").strip()
             payload = getattr(home, "_last_char_payload", None)
             deaths = []
             if isinstance(payload, dict):
                 deaths = payload.get("deaths") or []
             lines = [f"Mortes - {title}"]
-            for d in deaths[:30]:
+            for d in itertools.islice(deaths, 30):
                 if not isinstance(d, dict):
                     continue
                 when = str(d.get("time") or d.get("date") or "")
@@ -942,7 +1067,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def hunt_copy(self):
         try:
-            scr = self.root.get_screen("hunt")
+            scr = self._screen("hunt")
             Clipboard.copy(scr.ids.hunt_output.text or "")
             self.toast("Copiado.")
         except Exception:
@@ -950,7 +1075,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def hunt_share(self):
         try:
-            scr = self.root.get_screen("hunt")
+            scr = self._screen("hunt")
             txt = (scr.ids.hunt_output.text or "").strip()
             if not txt:
                 self.toast("Nada para compartilhar.")
@@ -993,18 +1118,8 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         Usado quando a API não informa timezone.
         """
         try:
-            y = dt_local.year
-            # last Sunday of March
-            import calendar
-            def last_sunday(year: int, month: int) -> datetime:
-                last_day = calendar.monthrange(year, month)[1]
-                d = datetime(year, month, last_day)
-                # weekday: Monday=0 ... Sunday=6
-                delta = (d.weekday() - 6) % 7
-                return d - timedelta(days=delta)
-
-            start = last_sunday(y, 3).replace(hour=2, minute=0, second=0, microsecond=0)  # 02:00 local
-            end = last_sunday(y, 10).replace(hour=3, minute=0, second=0, microsecond=0)   # 03:00 local
+            # último domingo de março 02:00 -> último domingo de outubro 03:00 (local)
+            start, end = _eu_dst_bounds(dt_local.year)
             if start <= dt_local < end:
                 return 2  # CEST
             return 1      # CET
@@ -1052,8 +1167,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
         # Formato típico do tibia.com: "Jan 22 2026, 10:42:00 CET"
         # Vamos remover o timezone e aplicar CET/CEST.
-        import re
-        m = re.match(r"^([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4}),\s*(\d{2}:\d{2}:\d{2})(?:\s+([A-Za-z]{2,5}))?$", s2)
+        m = _TIBIA_COM_DT_RE.match(s2)
         if m:
             mon, day, year, hhmmss, tz = m.groups()
             try:
@@ -1111,13 +1225,6 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
         return None
 
-    def _fetch_last_login_dt_tibia_com(self, name: str, timeout: int = 12) -> Optional[datetime]:
-        """Fallback: delega a leitura de Last Login para integrations.tibia_com."""
-        try:
-            return fetch_last_login_dt(name, timeout=timeout)
-        except Exception:
-            return None
-
     def _get_cached_fav_last_login_iso(self, name: str) -> Optional[str]:
         key = (name or "").strip().lower()
         if not key:
@@ -1280,27 +1387,6 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         except Exception:
             return ""
 
-    def _fetch_last_login_iso_for_char(self, name: str) -> Optional[str]:
-        """Busca o last_login (UTC ISO) do char.
-
-        1) tenta TibiaData /v4/character
-        2) fallback tibia.com
-        """
-        try:
-            data = fetch_character_tibiadata(name, timeout=12)
-            dt = self._extract_last_login_dt_from_tibiadata(data)
-            if dt:
-                return dt.isoformat()
-        except Exception:
-            pass
-        try:
-            dt = self._fetch_last_login_dt_tibia_com(name, timeout=12)
-            if dt:
-                return dt.isoformat()
-        except Exception:
-            pass
-        return None
-
     def _set_initial_home_tab(self, *_):
         # abre direto no Dashboard
         self.select_home_tab("tab_dashboard", record=False)
@@ -1310,20 +1396,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     def toast(self, message: str):
         """Mostra uma mensagem rápida sem derrubar o app."""
         try:
-            from kivymd.uix.snackbar import Snackbar  # type: ignore
-            try:
-                Snackbar(text=message).open()
+            if _SnackbarText is not None:
+                _Snackbar(_SnackbarText(text=message)).open()
+                return
+            if _Snackbar is not None:
+                _Snackbar(text=message).open()
                 return
-            except Exception:
-                pass
-        except Exception:
-            pass
-
-        try:
-            from kivymd.uix.snackbar import MDSnackbar, MDSnackbarText  # type: ignore
-            sb = MDSnackbar(MDSnackbarText(text=message))
-            sb.open()
-            return
         except Exception:
             pass
 
@@ -1381,7 +1459,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
 
     def calc_shared_xp(self):
-        home = self.root.get_screen("home")
+        home = self._screen("home")
         try:
             level = int((home.ids.share_level.text or "0").strip())
         except ValueError:
@@ -1392,8 +1470,9 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             self.toast("Digite um level maior que 0.")
             return
 
-        min_level = int(math.ceil(level * 2.0 / 3.0))
-        max_level = int(math.floor(level * 3.0 / 2.0))
+        # Aritmética inteira: ceil(2L/3) e floor(3L/2) sem passar por float.
+        min_level = (level * 2 + 2) // 3
+        max_level = (level * 3) // 2
 
         home.ids.share_result.text = (
             f"Seu level: {level}\n"
@@ -1411,11 +1490,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         - até 39:00: 1 min stamina / 3 min offline;
         - de 39:00 a 42:00: 1 min stamina / 6 min offline.
         """
-        scr = self.root.get_screen("stamina")
+        scr = self._screen("stamina")
+        ids = scr.ids
 
         try:
-            cur_min = parse_hm_text(scr.ids.stam_cur_h.text, scr.ids.stam_cur_m.text)
-            tgt_min = parse_hm_text(scr.ids.stam_tgt_h.text, scr.ids.stam_tgt_m.text)
+            cur_min = parse_hm_text(ids.stam_cur_h.text, ids.stam_cur_m.text)
+            tgt_min = parse_hm_text(ids.stam_tgt_h.text, ids.stam_tgt_m.text)
         except Exception as e:
             self.toast(str(e))
             return
@@ -1424,7 +1504,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         now = datetime.now()
 
         if res.offline_needed_min <= 0:
-            scr.ids.stam_result.text = (
+            ids.stam_result.text = (
                 f"Stamina atual: {format_hm(res.current_min)}\n"
                 f"Stamina alvo: {format_hm(res.target_min)}\n\n"
                 "Você já está no alvo."
@@ -1441,7 +1521,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
         reached_at = now + timedelta(minutes=offline_total)
 
-        scr.ids.stam_result.text = (
+        ids.stam_result.text = (
             f"Stamina atual: {format_hm(res.current_min)}\n"
             f"Stamina alvo: {format_hm(res.target_min)}\n\n"
             f"Tempo offline necessário: {offline_h}h {offline_m:02d}min\n"
@@ -1456,9 +1536,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def _boss_wiki_url(self, boss_name: str) -> str:
         """Gera URL do boss no TibiaWiki (BR)."""
-        title = (boss_name or "").strip().replace(" ", "_")
-        # index.php?title=... é o formato mais estável do MediaWiki.
-        return f"https://tibiawiki.com.br/index.php?title={quote(title)}"
+        return _boss_wiki_url_for(boss_name or "")
 
     def _boss_open_prompt(self, boss_name: str) -> None:
         """Pergunta ao usuário se quer abrir a página do boss."""
@@ -1468,7 +1546,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
         def go(*_):
             try:
-                webbrowser.open(self._boss_wiki_url(boss_name))
+                open_url(self._boss_wiki_url(boss_name))
             finally:
                 dlg.dismiss()
 
@@ -1487,7 +1565,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         c = (chance or "").strip().lower()
         if not c:
             return 0.0
-        m = re.search(r"(\d+(?:[.,]\d+)?)\s*%", c)
+        m = _CHANCE_PCT_RE.search(c)
         if m:
             try:
                 return float(m.group(1).replace(",", "."))
@@ -1539,7 +1617,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         cur = not cur
         self._prefs_set("boss_fav_only", cur)
         try:
-            scr = self.root.get_screen("bosses")
+            scr = self._screen("bosses")
             if "boss_fav_toggle" in scr.ids:
                 scr.ids.boss_fav_toggle.icon = "star" if cur else "star-outline"
         except Exception:
@@ -1547,29 +1625,31 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self.bosses_apply_filters()
 
     def bosses_apply_filters_debounced(self):
-        try:
-            if self._bosses_filter_debounce_ev:
-                self._bosses_filter_debounce_ev.cancel()
-        except Exception:
-            pass
-        self._bosses_filter_debounce_ev = Clock.schedule_once(lambda *_: self.bosses_apply_filters(), 0.15)
+        # Um único ClockEvent reaproveitado: cancel + novo disparo reinicia a espera.
+        ev = self._bosses_filter_debounce_ev
+        if ev is None:
+            ev = self._bosses_filter_debounce_ev = Clock.create_trigger(self.bosses_apply_filters, 0.15)
+        ev.cancel()
+        ev()
+
+    _BOSS_FILTER_OPTIONS = ("All", "High", "Medium+", "Low+", "No chance", "Unknown")
+    _BOSS_SORT_OPTIONS = ("Chance", "Name", "Favorites first")
 
     def open_boss_filter_menu(self):
-        scr = self.root.get_screen("bosses")
+        scr = self._screen("bosses")
         caller = scr.ids.get("boss_filter_btn")
         if caller is None:
             return
-        options = ["All", "High", "Medium+", "Low+", "No chance", "Unknown"]
-        items = [{"text": opt, "on_release": (lambda x=opt: self._set_boss_filter(x))} for opt in options]
-        if self._menu_boss_filter:
-            self._menu_boss_filter.dismiss()
-        self._menu_boss_filter = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(320))
+        # Opções fixas: o menu é montado na primeira abertura e reaproveitado.
+        if self._menu_boss_filter is None:
+            items = self._menu_items(self._BOSS_FILTER_OPTIONS, self._set_boss_filter)
+            self._menu_boss_filter = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(320))
         self._menu_boss_filter.open()
 
     def _set_boss_filter(self, value: str):
         self._prefs_set("boss_filter", value)
         try:
-            scr = self.root.get_screen("bosses")
+            scr = self._screen("bosses")
             if "boss_filter_label" in scr.ids:
                 scr.ids.boss_filter_label.text = value
         except Exception:
@@ -1579,21 +1659,20 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self.bosses_apply_filters()
 
     def open_boss_sort_menu(self):
-        scr = self.root.get_screen("bosses")
+        scr = self._screen("bosses")
         caller = scr.ids.get("boss_sort_btn")
         if caller is None:
             return
-        options = ["Chance", "Name", "Favorites first"]
-        items = [{"text": opt, "on_release": (lambda x=opt: self._set_boss_sort(x))} for opt in options]
-        if self._menu_boss_sort:
-            self._menu_boss_sort.dismiss()
-        self._menu_boss_sort = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(260))
+        # Opções fixas: o menu é montado na primeira abertura e reaproveitado.
+        if self._menu_boss_sort is None:
+            items = self._menu_items(self._BOSS_SORT_OPTIONS, self._set_boss_sort)
+            self._menu_boss_sort = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(260))
         self._menu_boss_sort.open()
 
     def _set_boss_sort(self, value: str):
         self._prefs_set("boss_sort", value)
         try:
-            scr = self.root.get_screen("bosses")
+            scr = self._screen("bosses")
             if "boss_sort_label" in scr.ids:
                 scr.ids.boss_sort_label.text = value
         except Exception:
@@ -1606,6 +1685,12 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self.go("boss_favorites")
         self.boss_favorites_refresh()
 
+    def _on_boss_item_release(self, item):
+        # Handler único das linhas de boss (Dashboard e lista): o dict fica no widget.
+        b = getattr(item, "_boss", None)
+        if b is not None:
+            self.bosses_open_dialog(b)
+
     def bosses_open_dialog(self, boss_dict):
         """Dialog de ações do boss (favoritar/copiar/abrir) com layout que não quebra em telas pequenas."""
         try:
@@ -1649,9 +1734,9 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 self.toast("Não consegui copiar.")
             close()
 
-        def open_url(*_):
+        def open_in_browser(*_):
             try:
-                webbrowser.open(url)
+                open_url(url)
             except Exception:
                 self.toast("Não consegui abrir o navegador.")
             close()
@@ -1659,14 +1744,11 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         actions = [
             (("Remover dos favoritos" if is_fav else "Adicionar aos favoritos"), ("star" if is_fav else "star-outline"), toggle),
             ("Copiar link", "content-copy", copy),
-            ("Abrir no navegador", "open-in-new", open_url),
+            ("Abrir no navegador", "open-in-new", open_in_browser),
         ]
 
         for label, icon, cb in actions:
-            it = OneLineIconListItem(text=label)
-            it.add_widget(IconLeftWidget(icon=icon))
-            it.bind(on_release=cb)
-            content.add_widget(it)
+            content.add_widget(_icon_list_item(label, icon, on_release=cb))
 
         dlg = MDDialog(
             title=name,
@@ -1676,15 +1758,16 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         )
         dlg.open()
 
-    def bosses_apply_filters(self):
-        scr = self.root.get_screen("bosses")
-        bosses = getattr(scr, "bosses_raw", []) or []
+    def bosses_apply_filters(self, *_args):
+        scr = self._screen("bosses")
+        ids = scr.ids
+        bosses = scr.bosses_raw or []
         if not isinstance(bosses, list):
             bosses = []
 
         q = ""
         if "boss_search" in scr.ids:
-            q = (scr.ids.boss_search.text or "").strip().lower()
+            q = (ids.boss_search.text or "").strip().lower()
 
         bf = str(self._prefs_get("boss_filter", "All") or "All")
         bs = str(self._prefs_get("boss_sort", "Chance") or "Chance")
@@ -1728,63 +1811,99 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         else:
             filtered.sort(key=lambda b: self._boss_chance_score(str(b.get("chance") or "")), reverse=True)
 
-        scr.ids.boss_list.clear_widgets()
-        scr.ids.boss_status.text = f"Bosses: {len(filtered)} (de {len(bosses)})"
+        ids.boss_status.text = f"Bosses: {len(filtered)} (de {len(bosses)})"
+
+        rows = filtered[:200]
+        fav_set = frozenset(favs)
+        # Mesmo conteúdo (nome/chance/status e favoritos) da última renderização: nada a refazer.
+        render_key = (
+            tuple((b.get("boss") or b.get("name"), b.get("chance"), b.get("status")) for b in rows),
+            fav_set,
+        )
+        if render_key == scr.boss_render_key:
+            return
+        scr.boss_render_key = render_key
+
+        self._bosses_render_seq += 1
+        ids.boss_list.clear_widgets()
 
         if not filtered:
-            item = OneLineIconListItem(text="Nada encontrado com esses filtros.")
-            item.add_widget(IconLeftWidget(icon="magnify"))
-            scr.ids.boss_list.add_widget(item)
+            item = _icon_list_item("Nada encontrado com esses filtros.", "magnify")
+            ids.boss_list.add_widget(item)
             return
 
-        for b in filtered[:200]:
+        self._bosses_render_batch(ids.boss_list, rows, 0, self._bosses_render_seq, fav_set)
+
+    # Linhas criadas por frame: a 1ª leva aparece na hora e o resto entra nos
+    # frames seguintes, sem travar a UI montando 200 widgets de uma vez.
+    _BOSS_ROWS_PER_FRAME = 30
+
+    def _bosses_render_batch(self, container, rows, start: int, seq: int, favs: frozenset):
+        if seq != self._bosses_render_seq:
+            return  # filtro mudou: outra renderização já assumiu a lista
+        end = start + self._BOSS_ROWS_PER_FRAME
+        on_release = self._on_boss_item_release
+        for b in rows[start:end]:
             name = str(b.get("boss") or b.get("name") or "Boss")
             chance = str(b.get("chance") or "").strip()
             status = str(b.get("status") or "").strip()
             sec = " • ".join([x for x in [chance, status] if x]) or " "
-            item = TwoLineIconListItem(text=name, secondary_text=sec)
-            icon = "star" if self.boss_is_favorite(name) else "skull"
-            item.add_widget(IconLeftWidget(icon=icon))
-            item.bind(on_release=lambda _it, bb=b: self.bosses_open_dialog(bb))
-            scr.ids.boss_list.add_widget(item)
+            icon = "star" if name.strip() in favs else "skull"
+            item = _icon_list_item(name, icon, sec)
+            item._boss = b
+            item.bind(on_release=on_release)
+            container.add_widget(item)
+        if end < len(rows):
+            Clock.schedule_once(lambda *_: self._bosses_render_batch(container, rows, end, seq, favs), 0)
 
     def boss_favorites_refresh(self):
-        scr = self.root.get_screen("boss_favorites")
+        scr = self._screen("boss_favorites")
+        ids = scr.ids
         favs = self._prefs_get("boss_favorites", []) or []
         if not isinstance(favs, list):
             favs = []
-        scr.ids.boss_fav_list.clear_widgets()
+        ids.boss_fav_list.clear_widgets()
         if not favs:
-            scr.ids.boss_fav_status.text = "Sem favoritos. Favorite bosses na tela Bosses."
-            it = OneLineIconListItem(text="Sem favoritos ainda.")
-            it.add_widget(IconLeftWidget(icon="star-outline"))
-            scr.ids.boss_fav_list.add_widget(it)
+            ids.boss_fav_status.text = "Sem favoritos. Favorite bosses na tela Bosses."
+            it = _icon_list_item("Sem favoritos ainda.", "star-outline")
+            ids.boss_fav_list.add_widget(it)
             return
 
         world = str(self._prefs_get("boss_last_world", "") or "")
         cache_key = f"bosses:{world.lower()}" if world else ""
         bosses = self._cache_get(cache_key, ttl_seconds=6 * 3600) if cache_key else None
 
-        scr.ids.boss_fav_status.text = f"Favoritos: {len(favs)}" + (f" • World: {world}" if world else "")
-        for name in favs[:200]:
-            chance_txt = ""
-            if isinstance(bosses, list):
-                for b in bosses:
-                    if str(b.get("boss") or b.get("name") or "") == name:
-                        chance_txt = str(b.get("chance") or "").strip()
-                        break
-            item = OneLineIconListItem(text=f"{name}{(' ('+chance_txt+')') if chance_txt else ''}")
-            item.add_widget(IconLeftWidget(icon="star"))
-            item.bind(on_release=lambda _it, n=name: self.bosses_open_dialog({"boss": n, "chance": chance_txt}))
-            scr.ids.boss_fav_list.add_widget(item)
+        ids.boss_fav_status.text = f"Favoritos: {len(favs)}" + (f" • World: {world}" if world else "")
+        # Chance por nome montada uma vez (em vez de varrer a lista de bosses a cada favorito).
+        chances = {}
+        if isinstance(bosses, list):
+            for b in bosses:
+                bname = str(b.get("boss") or b.get("name") or "")
+                if bname and bname not in chances:
+                    chances[bname] = str(b.get("chance") or "").strip()
+        on_release = self._on_boss_item_release
+        for name in itertools.islice(favs, 200):
+            chance_txt = chances.get(name, "")
+            item = _icon_list_item(f"{name}{(' ('+chance_txt+')') if chance_txt else ''}", "star")
+            item._boss = {"boss": name, "chance": chance_txt}
+            item.bind(on_release=on_release)
+            ids.boss_fav_list.add_widget(item)
 
     def _bosses_refresh_worlds(self):
-        scr = self.root.get_screen("bosses")
-        scr.ids.boss_status.text = "Carregando worlds..."
+        scr = self._screen("bosses")
+        ids = scr.ids
+        ids.boss_status.text = "Carregando worlds..."
 
         def worker():
+            # Lista de worlds muda raramente: cache em disco por 24h (cache.json).
+            cached = self._cache_get("worlds", ttl_seconds=24 * 3600)
+            if isinstance(cached, list) and cached:
+                return cached
             data = fetch_worlds_tibiadata()
-            return sorted([w.get("name") for w in data.get("worlds", {}).get("regular_worlds", []) if w.get("name")])
+            names = sorted([w.get("name") for w in data.get("worlds", {}).get("regular_worlds", []) if w.get("name")])
+            if names:
+                self._cache_set("worlds", names)
+            return names
 
         def done(worlds):
             """Update Bosses world list/menu on the main thread.
@@ -1801,10 +1920,10 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                         worlds = []
 
                 if "boss_status" in scr.ids:
-                    scr.ids.boss_status.text = f"Worlds: {len(worlds)}"
+                    ids.boss_status.text = f"Worlds: {len(worlds)}"
 
                 # Restore last selected world (if field exists)
-                field = getattr(scr.ids, "world_field", None)
+                field = getattr(ids, "world_field", None)
                 try:
                     last = str(self._prefs_get("boss_last_world", "") or "").strip()
                     if field is not None and last:
@@ -1812,27 +1931,36 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 except Exception:
                     pass
 
-                arrow = getattr(scr.ids, "world_drop", None)
-                row = getattr(scr.ids, "world_row", None)
+                arrow = getattr(ids, "world_drop", None)
+                row = getattr(ids, "world_row", None)
                 caller = row or field or arrow
                 if caller is None:
                     return
 
                 # Build dropdown items (cap to avoid very tall/heavy menus)
-                items = [
-                    {"text": w, "on_release": (lambda x=w: self._select_world(x))}
-                    for w in (worlds or [])[:400]
-                ]
+                worlds = list(worlds or [])[:400]
+                # Mesma lista do último carregamento: o menu atual já serve como está.
+                if self._menu_world is not None and worlds == self._worlds_cache:
+                    return
+                self._worlds_cache = worlds
 
-                # Recreate menu safely
-                if getattr(self, "_menu_world", None):
+                select = self._select_world
+                items = [{"text": w, "on_release": partial(select, w)} for w in worlds]
+
+                # Altura pela quantidade de worlds (até 420dp): lista curta não reserva área vazia.
+                max_h = min(dp(420), dp(48) * len(items) + dp(16))
+
+                # Reaproveita o menu existente: só troca os itens (evita recriar o widget).
+                if self._menu_world is not None:
                     try:
-                        self._menu_world.dismiss()
+                        self._menu_world.items = items
+                        self._menu_world.max_height = max_h
+                        return
                     except Exception:
-                        pass
-
-                from kivymd.uix.menu import MDDropdownMenu
-                from kivy.metrics import dp
+                        try:
+                            self._menu_world.dismiss()
+                        except Exception:
+                            pass
 
                 base_w = getattr(caller, "width", 0) or dp(280)
                 menu_w = max(dp(220), min(dp(360), base_w))
@@ -1844,7 +1972,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                         caller=caller,
                         items=items,
                         width=menu_w,
-                        max_height=dp(420),
+                        max_height=max_h,
                         position="auto",
                         border_margin=dp(12),
                     )
@@ -1853,7 +1981,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                         caller=caller,
                         items=items,
                         width=menu_w,
-                        max_height=dp(420),
+                        max_height=max_h,
                     )
 
                 # Extra safety: force the menu to grow inside the screen when supported.
@@ -1871,23 +1999,22 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                     Logger.exception("Bosses: failed to build worlds menu")
                 except Exception:
                     pass
-        def run():
-            try:
-                worlds = worker()
-                Clock.schedule_once(lambda *_: done(worlds), 0)
-            except Exception as e:
-                Clock.schedule_once(lambda *_: setattr(scr.ids.boss_status, "text", f"Erro: {e}"), 0)
+        def failed(e):
+            ids.boss_status.text = f"Erro: {e}"
 
-        threading.Thread(target=run, daemon=True).start()
+        # Worlds já em memória (cache.json carregado, < 24h): sem ida ao pool nem à rede.
+        cached = self._cache_get("worlds", ttl_seconds=24 * 3600)
+        if isinstance(cached, list) and cached:
+            done(cached)
+            return
+        self.submit_bg(worker, done, failed)
 
 
 
     def open_world_menu(self):
         # Open the World dropdown and keep it inside screen bounds.
         try:
-            from kivy.metrics import dp
-
-            screen = self.root.get_screen("bosses")
+            screen = self._screen("bosses")
             field = getattr(screen.ids, "world_field", None)
             arrow = getattr(screen.ids, "world_drop", None)
             row = getattr(screen.ids, "world_row", None)
@@ -1930,9 +2057,6 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
             # Final safety clamp (some Android devices ignore border_margin/hor_growth).
             try:
-                from kivy.core.window import Window
-                from kivy.clock import Clock
-
                 def _clamp_menu_pos(*_a):
                     try:
                         margin = dp(8)
@@ -1962,7 +2086,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             pass
 
     def _select_world(self, world: str):
-        scr = self.root.get_screen("bosses")
+        scr = self._screen("bosses")
         scr.ids.world_field.text = world
         try:
             self._prefs_set("boss_last_world", world)
@@ -1972,8 +2096,9 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             self._menu_world.dismiss()
 
     def bosses_fetch(self):
-        scr = self.root.get_screen("bosses")
-        world = (scr.ids.world_field.text or "").strip()
+        scr = self._screen("bosses")
+        ids = scr.ids
+        world = (ids.world_field.text or "").strip()
         if not world:
             self.toast("Digite o world.")
             return
@@ -1982,44 +2107,44 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             self._prefs_set("boss_last_world", world)
         except Exception:
             pass
-        scr.ids.boss_status.text = "Buscando bosses..."
-        scr.ids.boss_list.clear_widgets()
+        ids.boss_status.text = "Buscando bosses..."
+        self._bosses_render_seq += 1  # descarta levas pendentes da lista anterior
+        scr.boss_render_key = None
+        ids.boss_list.clear_widgets()
         for _ in range(6):
-            it = OneLineIconListItem(text="Carregando...")
-            it.add_widget(IconLeftWidget(icon="cloud-download"))
-            scr.ids.boss_list.add_widget(it)
+            it = _icon_list_item("Carregando...", "cloud-download")
+            ids.boss_list.add_widget(it)
 
 
-        def run():
-            try:
-                bosses = fetch_exevopan_bosses(world)
-                Clock.schedule_once(lambda *_: self._bosses_done(bosses), 0)
-            except Exception as e:
-                Clock.schedule_once(lambda *_: setattr(scr.ids.boss_status, "text", f"Erro: {e}"), 0)
+        def failed(e):
+            ids.boss_status.text = f"Erro: {e}"
 
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_bg(fetch_exevopan_bosses, self._bosses_done, failed, world)
 
     def _bosses_done(self, bosses):
-        scr = self.root.get_screen("bosses")
+        scr = self._screen("bosses")
+        ids = scr.ids
         if not bosses:
-            scr.ids.boss_list.clear_widgets()
-            scr.ids.boss_status.text = "Nada encontrado (ou ExevoPan indisponível)."
+            self._bosses_render_seq += 1
+            scr.boss_render_key = None
+            ids.boss_list.clear_widgets()
+            ids.boss_status.text = "Nada encontrado (ou ExevoPan indisponível)."
             return
 
         # guarda raw para filtros e salva cache (TTL 6h)
         scr.bosses_raw = bosses
-        world = (scr.ids.world_field.text or "").strip()
+        world = (ids.world_field.text or "").strip()
         if world:
             self._cache_set(f"bosses:{world.lower()}", bosses)
 
         # aplica prefs e UI labels
         try:
             if "boss_filter_label" in scr.ids:
-                scr.ids.boss_filter_label.text = str(self._prefs_get("boss_filter", "All") or "All")
+                ids.boss_filter_label.text = str(self._prefs_get("boss_filter", "All") or "All")
             if "boss_sort_label" in scr.ids:
-                scr.ids.boss_sort_label.text = str(self._prefs_get("boss_sort", "Chance") or "Chance")
+                ids.boss_sort_label.text = str(self._prefs_get("boss_sort", "Chance") or "Chance")
             if "boss_fav_toggle" in scr.ids:
-                scr.ids.boss_fav_toggle.icon = "star" if bool(self._prefs_get("boss_fav_only", False)) else "star-outline"
+                ids.boss_fav_toggle.icon = "star" if bool(self._prefs_get("boss_fav_only", False)) else "star-outline"
         except Exception:
             pass
 
@@ -2030,15 +2155,25 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     # Boosted
 
     # --------------------
-    def update_boosted(self, silent: bool = False, force: bool = False):
+    def update_boosted(self, silent: bool = False, force: bool = False, use_cache: bool = False):
         """Atualiza Boosted Creature/Boss sem travar a UI.
 
         IMPORTANTE: em versões anteriores havia um loop de refresh que criava
         threads infinitas e deixava o app lento. Aqui adicionamos:
         - in-flight guard (não iniciar outro worker se já existe um rodando)
         - throttling (em updates silenciosos, não fazer fetch em sequência)
+
+        Com use_cache=True (abertura do app), um resultado de menos de 1h no
+        cache.json é usado direto, sem rede.
         """
-        scr = self.root.get_screen("boosted")
+        scr = self._screen("boosted")
+        ids = scr.ids
+
+        if use_cache and not force:
+            cached = self._cache_get("boosted", ttl_seconds=3600)
+            if isinstance(cached, dict) and cached:
+                self._boosted_done(cached, silent=silent, from_cache=True)
+                return
 
         # Evita disparar vários downloads em cascata (principal causa do "travamento")
         now_mono = time.monotonic()
@@ -2056,11 +2191,11 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             pass
 
         if not silent:
-            scr.ids.boost_status.text = "Atualizando..."
+            ids.boost_status.text = "Atualizando..."
         else:
             # não suja o status se for atualização usada pelo dashboard
-            if not (scr.ids.boost_status.text or "").strip():
-                scr.ids.boost_status.text = "Atualizando..."
+            if not (ids.boost_status.text or "").strip():
+                ids.boost_status.text = "Atualizando..."
 
         def run():
             data = None
@@ -2081,45 +2216,48 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 if err is not None:
                     if not silent:
                         try:
-                            scr.ids.boost_status.text = f"Erro: {err}"
+                            ids.boost_status.text = f"Erro: {err}"
                         except Exception:
                             pass
                     return
 
                 self._boosted_done(data, silent=silent)
 
-            Clock.schedule_once(finish, 0)
+            self.post_ui(finish)
 
-        threading.Thread(target=run, daemon=True).start()
+        self.run_bg(run)
 
-    def _boosted_done(self, data, silent: bool = False):
-        scr = self.root.get_screen("boosted")
+    def _boosted_done(self, data, silent: bool = False, from_cache: bool = False):
+        scr = self._screen("boosted")
+        ids = scr.ids
         if not data:
             if not silent:
-                scr.ids.boost_status.text = "Falha ao buscar Boosted."
+                ids.boost_status.text = "Falha ao buscar Boosted."
             return
-        scr.ids.boost_status.text = "OK"
-        scr.ids.boost_creature.text = data.get("creature", "N/A")
-        scr.ids.boost_boss.text = data.get("boss", "N/A")
+        ids.boost_status.text = "OK"
+        ids.boost_creature.text = data.get("creature", "N/A")
+        ids.boost_boss.text = data.get("boss", "N/A")
 
         # sprites (quando disponíveis)
         try:
             if "boost_creature_sprite" in scr.ids:
-                scr.ids.boost_creature_sprite.source = data.get("creature_image") or ""
+                ids.boost_creature_sprite.source = data.get("creature_image") or ""
             if "boost_boss_sprite" in scr.ids:
-                scr.ids.boost_boss_sprite.source = data.get("boss_image") or ""
+                ids.boost_boss_sprite.source = data.get("boss_image") or ""
         except Exception:
             pass
 
         # cache + histórico (7 dias)
-        try:
-            self._cache_set("boosted", data)
-        except Exception:
-            pass
+        # (vindo do próprio cache: não regrava, senão o TTL nunca expiraria)
+        if not from_cache:
+            try:
+                self._cache_set("boosted", data)
+            except Exception:
+                pass
 
         # também atualiza o card do Dashboard (Home)
         try:
-            home = self.root.get_screen("home")
+            home = self._screen("home")
             hids = home.ids
             if "dash_boost_creature" in hids:
                 hids.dash_boost_creature.text = data.get("creature", "-") or "-"
@@ -2136,24 +2274,26 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             pass
 
 
-        try:
-            hist = self._prefs_get("boosted_history", []) or []
-            if not isinstance(hist, list):
-                hist = []
-            today = datetime.utcnow().date().isoformat()
-            entry = {"date": today, "creature": data.get("creature"), "boss": data.get("boss")}
-            # remove do mesmo dia e reinsere no topo
-            hist = [h for h in hist if isinstance(h, dict) and h.get("date") != today]
-            hist.insert(0, entry)
-            hist = hist[:7]
-            self._prefs_set("boosted_history", hist)
-        except Exception:
-            pass
+        # histórico já foi registrado quando o dado (do cache) foi buscado
+        if not from_cache:
+            try:
+                hist = self._prefs_get("boosted_history", []) or []
+                if not isinstance(hist, list):
+                    hist = []
+                today = datetime.utcnow().date().isoformat()
+                entry = {"date": today, "creature": data.get("creature"), "boss": data.get("boss")}
+                # remove do mesmo dia e reinsere no topo
+                hist = [h for h in hist if isinstance(h, dict) and h.get("date") != today]
+                hist.insert(0, entry)
+                hist = hist[:7]
+                self._prefs_set("boosted_history", hist)
+            except Exception:
+                pass
 
         # UI: histórico
         try:
             if "boost_hist_list" in scr.ids:
-                scr.ids.boost_hist_list.clear_widgets()
+                ids.boost_hist_list.clear_widgets()
                 hist = self._prefs_get("boosted_history", []) or []
                 if isinstance(hist, list) and hist:
                     for h in hist:
@@ -2162,9 +2302,8 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                         dt = str(h.get("date") or "")
                         cr = str(h.get("creature") or "-")
                         bb = str(h.get("boss") or "-")
-                        it = TwoLineIconListItem(text=f"{dt}", secondary_text=f"{cr} • {bb}")
-                        it.add_widget(IconLeftWidget(icon="history"))
-                        scr.ids.boost_hist_list.add_widget(it)
+                        it = _icon_list_item(f"{dt}", "history", f"{cr} • {bb}")
+                        ids.boost_hist_list.add_widget(it)
         except Exception:
             pass
 
@@ -2209,11 +2348,6 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def _clamp_dropdown_to_window(self, menu, _tries: int = 3):
         """Garante que o dropdown não fique fora da tela (extra p/ Android)."""
-        try:
-            from kivy.core.window import Window
-        except Exception:
-            return
-
         try:
             w = float(getattr(menu, "width", 0) or 0)
             h = float(getattr(menu, "height", 0) or 0)
@@ -2238,8 +2372,8 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
 
     def training_open_menu(self, which: str):
         """Abre menus do Treino sem deixar o menu/selection sair da tela."""
-        scr = self.root.get_screen("training")
         self._ensure_training_menus()
+        f = self._training_fields()
 
         # Evita o menu de contexto do Android (Select All / Paste) em campos readonly.
         for _id in (
@@ -2251,7 +2385,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             "to_level",
             "loyalty",
         ):
-            w = scr.ids.get(_id)
+            w = f[_id]
             if w is not None:
                 try:
                     w.focus = False
@@ -2273,45 +2407,83 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         # Ajusta posição no próximo frame (quando o tamanho do menu já foi calculado).
         Clock.schedule_once(lambda *_: self._clamp_dropdown_to_window(menu), 0)
 
+    _TRAINING_FIELD_IDS = (
+        "skill_field",
+        "skill_drop",
+        "voc_field",
+        "voc_drop",
+        "weapon_field",
+        "weapon_drop",
+        "from_level",
+        "percent_left",
+        "to_level",
+        "loyalty",
+        "private_dummy",
+        "double_event",
+        "train_status",
+        "train_result",
+    )
+
+    def _training_fields(self) -> dict:
+        """Referências dos widgets do Treino, resolvidas uma única vez.
+
+        Evita repetir `scr.ids.get(...)` / `"x" in scr.ids` a cada toque.
+        Ids ausentes (KV antigo) ficam como None.
+        """
+        refs = self._training_refs
+        if refs is not None:
+            return refs
+        scr = self._screen("training")
+        ids = scr.ids
+        refs = {k: ids.get(k) for k in self._TRAINING_FIELD_IDS}
+        self._training_refs = refs
+        return refs
+
+    _TRAINING_SKILLS = ("Sword", "Axe", "Club", "Distance", "Fist Fighting", "Shielding", "Magic Level")
+    _TRAINING_VOCS = ("Knight", "Paladin", "Sorcerer", "Druid", "Monk", "None")
+    _TRAINING_WEAPONS = ("Standard (500)", "Enhanced (1800)", "Lasting (14400)")
+
+    @staticmethod
+    def _menu_items(options, on_pick) -> list:
+        """Itens de MDDropdownMenu (on_release é chamado sem argumentos)."""
+        return [{"text": opt, "on_release": partial(on_pick, opt)} for opt in options]
+
     def _ensure_training_menus(self):
-        scr = self.root.get_screen("training")
+        f = self._training_fields()
 
         # ⚠️ Em telas menores, o dropdown pode "vazar" para fora da tela.
         # Aqui o melhor caller é o botão de seta (menu-down) + hor_growth="left".
         # Assim o menu cresce para a esquerda e fica visível.
-        skill_caller = scr.ids.get("skill_drop") or scr.ids.get("skill_field")
-        voc_caller = scr.ids.get("voc_drop") or scr.ids.get("voc_field")
-        weapon_caller = scr.ids.get("weapon_drop") or scr.ids.get("weapon_field")
+        skill_caller = f["skill_drop"] or f["skill_field"]
+        voc_caller = f["voc_drop"] or f["voc_field"]
+        weapon_caller = f["weapon_drop"] or f["weapon_field"]
 
         if self._menu_skill is None:
-            skills = ["Sword", "Axe", "Club", "Distance", "Fist Fighting", "Shielding", "Magic Level"]
             self._menu_skill = MDDropdownMenu(
                 caller=skill_caller,
-                items=[{"text": s, "on_release": (lambda x=s: self._set_training_skill(x))} for s in skills],
+                items=self._menu_items(self._TRAINING_SKILLS, self._set_training_skill),
                 width_mult=4,
                 max_height=dp(320),
                 position="auto",
             )
             self._menu_fix_position(self._menu_skill)
 
-        if 'voc_drop' in scr.ids and 'voc_field' in scr.ids:
+        if f["voc_drop"] is not None and f["voc_field"] is not None:
             if self._menu_vocation is None:
-                vocs = ["Knight", "Paladin", "Sorcerer", "Druid", "Monk", "None"]
                 self._menu_vocation = MDDropdownMenu(
                     caller=voc_caller,
-                    items=[{"text": v, "on_release": (lambda x=v: self._set_training_voc(x))} for v in vocs],
+                    items=self._menu_items(self._TRAINING_VOCS, self._set_training_voc),
                     width_mult=4,
                     max_height=dp(260),
                     position="auto",
                 )
                 self._menu_fix_position(self._menu_vocation)
 
-        if 'weapon_drop' in scr.ids and 'weapon_field' in scr.ids:
+        if f["weapon_drop"] is not None and f["weapon_field"] is not None:
             if self._menu_weapon is None:
-                weapons = ["Standard (500)", "Enhanced (1800)", "Lasting (14400)"]
                 self._menu_weapon = MDDropdownMenu(
                     caller=weapon_caller,
-                    items=[{"text": w, "on_release": (lambda x=w: self._set_training_weapon(x))} for w in weapons],
+                    items=self._menu_items(self._TRAINING_WEAPONS, self._set_training_weapon),
                     width_mult=4,
                     max_height=dp(260),
                     position="auto",
@@ -2319,46 +2491,45 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 self._menu_fix_position(self._menu_weapon)
 
     def _set_training_skill(self, skill: str):
-        scr = self.root.get_screen("training")
-        scr.ids.skill_field.text = skill
+        w = self._training_fields()["skill_field"]
+        if w is not None:
+            w.text = skill
         if self._menu_skill:
             self._menu_skill.dismiss()
 
     def _set_training_voc(self, voc: str):
-        scr = self.root.get_screen("training")
-        w = scr.ids.get("voc_field")
+        w = self._training_fields()["voc_field"]
         if w is not None:
             w.text = voc
         if self._menu_vocation:
             self._menu_vocation.dismiss()
 
     def _set_training_weapon(self, weapon: str):
-        scr = self.root.get_screen("training")
-        w = scr.ids.get("weapon_field")
+        w = self._training_fields()["weapon_field"]
         if w is not None:
             w.text = weapon
         if self._menu_weapon:
             self._menu_weapon.dismiss()
 
     def training_calculate(self):
-        scr = self.root.get_screen("training")
+        f = self._training_fields()
         try:
-            frm = int((scr.ids.from_level.text or "").strip())
-            to = int((scr.ids.to_level.text or "").strip())
-            pct_w = scr.ids.get("percent_left")
-            pct = float(((pct_w.text if pct_w else "100") or "100").replace(",", ".").strip() or 100)
-            loyalty = float((scr.ids.loyalty.text or "0").replace(",", ".").strip() or 0)
+            frm = int(_CLEAN_NUM_RE.sub("", f["from_level"].text or ""))
+            to = int(_CLEAN_NUM_RE.sub("", f["to_level"].text or ""))
+            pct_w = f["percent_left"]
+            pct = _parse_num(pct_w.text if pct_w else "", 100.0)
+            loyalty = _parse_num(f["loyalty"].text, 0.0)
         except ValueError:
             self.toast("Verifique os campos numéricos.")
             return
 
-        skill = (scr.ids.skill_field.text or "Sword").strip()
-        voc_w = scr.ids.get("voc_field")
-        weapon_w = scr.ids.get("weapon_field")
+        skill = (f["skill_field"].text or "Sword").strip()
+        voc_w = f["voc_field"]
+        weapon_w = f["weapon_field"]
         voc = ((voc_w.text if voc_w else "") or "Knight").strip()
         weapon = ((weapon_w.text if weapon_w else "") or "Enhanced (1800)").strip()
 
-        if "voc_field" not in scr.ids:
+        if voc_w is None:
             if skill == "Magic Level":
                 voc = "Sorcerer"
             elif skill == "Distance":
@@ -2374,58 +2545,73 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
             weapon_kind=weapon,
             percent_left=pct,
             loyalty_percent=loyalty,
-            private_dummy=scr.ids.private_dummy.active,
-            double_event=scr.ids.double_event.active,
+            private_dummy=f["private_dummy"].active,
+            double_event=f["double_event"].active,
         )
 
-        scr.ids.train_status.text = "Calculando..."
-        scr.ids.train_result.text = ""
+        f["train_status"].text = "Calculando..."
+        f["train_result"].text = ""
 
-        def run():
-            plan = compute_training_plan(inp)
-            Clock.schedule_once(lambda *_: self._training_done(plan), 0)
-
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_bg(compute_training_plan, self._training_done, None, inp)
 
     def _training_done(self, plan):
-        scr = self.root.get_screen("training")
+        f = self._training_fields()
         if not plan.ok:
-            scr.ids.train_status.text = plan.error or "Erro"
+            f["train_status"].text = plan.error or "Erro"
             return
-        scr.ids.train_status.text = "OK"
-        scr.ids.train_result.text = (
+        f["train_status"].text = "OK"
+        f["train_result"].text = (
             f"Weapons: {plan.weapons}\n"
-            f"Charges necessárias: {plan.total_charges:,}\n"
+            f"Charges necessárias: {format_int_pt(plan.total_charges)}\n"
             f"Tempo: {plan.hours:.2f} h\n"
-            f"Custo total: {plan.total_cost_gp:,} gp\n"
-        ).replace(",", ".")
+            f"Custo total: {format_int_pt(plan.total_cost_gp)} gp\n"
+        )
 
     # --------------------
     # Hunt Analyzer
     # --------------------
     def hunt_parse(self):
-        scr = self.root.get_screen("hunt")
-        raw = (scr.ids.hunt_input.text or "").strip()
+        scr = self._screen("hunt")
+        ids = scr.ids
+        raw = (ids.hunt_input.text or "").strip()
         if not raw:
             self.toast("Cole o texto do Session Data.")
             return
-        scr.ids.hunt_status.text = "Analisando..."
-        scr.ids.hunt_output.text = ""
 
-        def run():
-            res = parse_hunt_session_text(raw)
-            Clock.schedule_once(lambda *_: self._hunt_done(res), 0)
+        # Novo toque: a análise anterior (se ainda na fila) é cancelada e, se já estiver
+        # rodando, a resposta dela é ignorada em _hunt_done (raw != _hunt_pending_raw).
+        prev = self._hunt_future
+        if prev is not None and not prev.done():
+            prev.cancel()
+        self._hunt_pending_raw = raw
+
+        # Mesmo texto da última análise (ex.: toque duplo em "Analisar"): reusa o resultado.
+        last_raw, last_res = self._hunt_cache
+        if last_res is not None and raw == last_raw:
+            self._hunt_future = None
+            self._hunt_done(last_res)
+            return
+
+        ids.hunt_status.text = "Analisando..."
+        ids.hunt_output.text = ""
 
-        threading.Thread(target=run, daemon=True).start()
+        self._hunt_future = self.submit_bg(
+            parse_hunt_session_text, partial(self._hunt_done, raw=raw), None, raw.splitlines()
+        )
 
-    def _hunt_done(self, res):
-        scr = self.root.get_screen("hunt")
+    def _hunt_done(self, res, raw: Optional[str] = None):
+        if raw is not None and raw != self._hunt_pending_raw:
+            return  # resultado de uma análise substituída
+        scr = self._screen("hunt")
+        ids = scr.ids
         if not res.ok:
-            scr.ids.hunt_status.text = res.error or "Erro"
-            scr.ids.hunt_output.text = ""
+            ids.hunt_status.text = res.error or "Erro"
+            ids.hunt_output.text = ""
             return
-        scr.ids.hunt_status.text = "OK"
-        scr.ids.hunt_output.text = res.pretty
+        if raw is not None:
+            self._hunt_cache = (raw, res)
+        ids.hunt_status.text = "OK"
+        ids.hunt_output.text = res.pretty
 
     # --------------------
     # Imbuements
@@ -2450,22 +2636,23 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         self._prefs_set("imb_favorites", favs)
         return True
 
+    _IMB_TIER_OPTIONS = ("All", "Basic", "Intricate", "Powerful")
+
     def open_imb_tier_menu(self):
-        scr = self.root.get_screen("imbuements")
+        scr = self._screen("imbuements")
         caller = scr.ids.get("imb_tier_btn")
         if caller is None:
             return
-        options = ["All", "Basic", "Intricate", "Powerful"]
-        items = [{"text": opt, "on_release": (lambda x=opt: self._set_imb_tier(x))} for opt in options]
-        if self._menu_imb_tier:
-            self._menu_imb_tier.dismiss()
-        self._menu_imb_tier = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(220))
+        # Opções fixas: o menu é montado na primeira abertura e reaproveitado.
+        if self._menu_imb_tier is None:
+            items = self._menu_items(self._IMB_TIER_OPTIONS, self._set_imb_tier)
+            self._menu_imb_tier = MDDropdownMenu(caller=caller, items=items, width_mult=4, max_height=dp(220))
         self._menu_imb_tier.open()
 
     def _set_imb_tier(self, value: str):
         self._prefs_set("imb_tier", value)
         try:
-            scr = self.root.get_screen("imbuements")
+            scr = self._screen("imbuements")
             scr.ids.imb_tier_label.text = value
         except Exception:
             pass
@@ -2478,7 +2665,7 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
         cur = not cur
         self._prefs_set("imb_fav_only", cur)
         try:
-            scr = self.root.get_screen("imbuements")
+            scr = self._screen("imbuements")
             scr.ids.imb_fav_toggle.icon = "star" if cur else "star-outline"
         except Exception:
             pass
@@ -2487,100 +2674,200 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
     def imbuements_copy_selected_hint(self):
         self.toast("Abra um imbuement e use o botão COPIAR no dialog.")
 
+    @staticmethod
+    def _prime_list_screens(root) -> None:
+        """Atributos de estado das telas de lista sempre presentes (sem getattr com default no filtro)."""
+        try:
+            imb = root.get_screen("imbuements")
+            imb.entries = []
+            imb.names_lc = []
+            imb.imb_query = ("", None)
+            imb.imb_render_key = None
+        except Exception:
+            log_current_exception(prefix="[imbuements] falha ao preparar a tela")
+        try:
+            bosses = root.get_screen("bosses")
+            bosses.bosses_raw = []
+            bosses.boss_render_key = None
+        except Exception:
+            log_current_exception(prefix="[bosses] falha ao preparar a tela")
+
     def _imbuements_load(self):
-        scr = self.root.get_screen("imbuements")
+        fut = self._imbu_load_future
+        if fut is not None and not fut.done():
+            return  # a tabela já está sendo carregada
+        scr = self._screen("imbuements")
         scr.entries = []
+        scr.names_lc = []
+        scr.imb_query = ("", None)
         scr.ids.imb_status.text = "Carregando (offline)..."
+        self._imbu_render_seq += 1  # descarta levas pendentes da lista anterior
+        scr.imb_render_key = None
         scr.ids.imb_list.clear_widgets()
 
-        def run():
-            ok, data = fetch_imbuements_table()
-            Clock.schedule_once(lambda *_: self._imbuements_done(ok, data), 0)
-
-        threading.Thread(target=run, daemon=True).start()
+        self._imbu_load_future = self.submit_bg(fetch_imbuements_table, lambda res: self._imbuements_done(*res))
 
     def _imbuements_done(self, ok: bool, data):
-        scr = self.root.get_screen("imbuements")
+        scr = self._screen("imbuements")
+        ids = scr.ids
         if not ok:
-            scr.ids.imb_status.text = f"Erro: {data}"
+            ids.imb_status.text = f"Erro: {data}"
             return
         scr.entries = data
-        scr.ids.imb_status.text = f"Imbuements: {len(data)}"
+        # Nomes em minúsculas, paralelos a `entries`: o filtro por texto só varre esta lista.
+        scr.names_lc = [e.name.lower() for e in data]
+        scr.imb_query = ("", None)
+        ids.imb_status.text = f"Imbuements: {len(data)}"
         try:
-            scr.ids.imb_tier_label.text = str(self._prefs_get("imb_tier", "All") or "All")
-            scr.ids.imb_fav_toggle.icon = "star" if bool(self._prefs_get("imb_fav_only", False)) else "star-outline"
+            ids.imb_tier_label.text = str(self._prefs_get("imb_tier", "All") or "All")
+            ids.imb_fav_toggle.icon = "star" if bool(self._prefs_get("imb_fav_only", False)) else "star-outline"
         except Exception:
             pass
         self.imbuements_refresh_list()
 
-    def imbuements_refresh_list(self):
-        scr = self.root.get_screen("imbuements")
-        q = (scr.ids.imb_search.text or "").strip().lower()
+    def imbuements_refresh_list_debounced(self):
+        # Um único ClockEvent reaproveitado: cancel + novo disparo reinicia a espera.
+        ev = self._imb_filter_debounce_ev
+        if ev is None:
+            ev = self._imb_filter_debounce_ev = Clock.create_trigger(self.imbuements_refresh_list, 0.12)
+        ev.cancel()
+        ev()
+
+    def imbuements_refresh_list(self, *_args):
+        scr = self._screen("imbuements")
+        ids = scr.ids
+        q = (ids.imb_search.text or "").strip().lower()
         tier = str(self._prefs_get("imb_tier", "All") or "All")
         fav_only = bool(self._prefs_get("imb_fav_only", False))
         favs = self._prefs_get("imb_favorites", []) or []
         if not isinstance(favs, list):
             favs = []
 
-        scr.ids.imb_list.clear_widgets()
-        entries: List[ImbuementEntry] = getattr(scr, "entries", [])
-
-        def matches(ent: ImbuementEntry) -> bool:
-            if q and q not in ent.name.lower():
-                return False
-            if fav_only and ent.name not in favs:
-                return False
-            if tier == "Basic" and not (ent.basic or "").strip():
-                return False
-            if tier == "Intricate" and not (ent.intricate or "").strip():
-                return False
-            if tier == "Powerful" and not (ent.powerful or "").strip():
-                return False
-            return True
+        entries = scr.entries
+        names_lc = scr.names_lc
+        if len(names_lc) != len(entries):
+            names_lc = [e.name.lower() for e in entries]
+            scr.names_lc = names_lc
+            scr.imb_query = ("", None)
+
+        candidates = iter(entries)
+        if q:
+            # Filtro incremental: se a busca só cresceu ("dra" -> "drag"), varre apenas
+            # os índices que já casavam com a busca anterior.
+            last_q, last_idx = scr.imb_query
+            if last_idx is not None and last_q and q.startswith(last_q):
+                idx = [i for i in last_idx if q in names_lc[i]]
+            else:
+                idx = [i for i, nm in enumerate(names_lc) if q in nm]
+            scr.imb_query = (q, idx)
+            candidates = (entries[i] for i in idx)
+        else:
+            scr.imb_query = ("", None)
+
+        fav_set = frozenset(favs)
+        if fav_only:
+            candidates = (e for e in candidates if e.name in fav_set)
+        tier_attr = _IMBU_TIER_ATTR.get(tier)
+        if tier_attr:
+            candidates = (e for e in candidates if (getattr(e, tier_attr) or "").strip())
+
+        # Só as 200 primeiras viram lista; o resto é apenas contado (sem materializar).
+        rows = list(itertools.islice(candidates, 200))
+        total = len(rows) + sum(1 for _ in candidates)
+        ids.imb_status.text = f"Imbuements: {total}"
+
+        # Mesmas linhas (e mesmos ícones de favorito) da última renderização: nada a refazer.
+        render_key = (tuple(map(id, rows)), fav_set)
+        if render_key == scr.imb_render_key:
+            return
+        scr.imb_render_key = render_key
+
+        # Mesmo esquema da lista de bosses: primeiras linhas já, resto em levas por frame.
+        ids.imb_list.clear_widgets()
+        self._imbu_render_seq += 1
+        self._imbu_render_batch(ids.imb_list, rows, 0, self._imbu_render_seq, fav_set)
+
+    _IMBU_ROWS_PER_FRAME = 30
+
+    def _imbu_render_batch(self, container, rows, start: int, seq: int, favs: frozenset):
+        if seq != self._imbu_render_seq:
+            return  # busca mudou: outra renderização já assumiu a lista
+        end = start + self._IMBU_ROWS_PER_FRAME
+        on_release = self._on_imbu_item_release
+        for e in rows[start:end]:
+            icon = "star" if (e.name or "").strip() in favs else "flash"
+            item = _icon_list_item(e.name, icon)
+            item._entry = e
+            item.bind(on_release=on_release)
+            container.add_widget(item)
+        if end < len(rows):
+            Clock.schedule_once(lambda *_: self._imbu_render_batch(container, rows, end, seq, favs), 0)
+
+    def _on_imbu_item_release(self, item):
+        ent = getattr(item, "_entry", None)
+        if ent is not None:
+            self._imbu_show(ent)
+
+    def _imbu_dialog_copy(self, *_):
+        try:
+            Clipboard.copy(getattr(self._imbu_dialog, "_last_text", "") or "")
+            self.toast("Copiado.")
+        except Exception:
+            self.toast("Ainda não carregou.")
 
-        filtered = [e for e in entries if matches(e)]
-        scr.ids.imb_status.text = f"Imbuements: {len(filtered)}"
+    def _imbu_dialog_toggle_fav(self, *_):
+        dlg = self._imbu_dialog
+        title = getattr(dlg, "title", "") or ""
+        fav = self.imbuement_toggle_favorite(title)
+        self.toast("Favoritado." if fav else "Removido dos favoritos.")
+        try:
+            dlg.dismiss()
+        except Exception:
+            pass
+        self.imbuements_refresh_list()
 
-        for e in filtered[:200]:
-            icon = "star" if self.imbuement_is_favorite(e.name) else "flash"
-            item = OneLineIconListItem(text=e.name)
-            item.add_widget(IconLeftWidget(icon=icon))
-            item.bind(on_release=lambda _item, ent=e: self._imbu_show(ent))
-            scr.ids.imb_list.add_widget(item)
+    def _imbu_dialog_close(self, *_):
+        try:
+            self._imbu_dialog.dismiss()
+        except Exception:
+            pass
 
     def _imbu_show(self, ent: ImbuementEntry):
         # Abre primeiro com placeholder e depois carrega os itens (sob demanda)
         title = (ent.name or "").strip()
-
-        def copy_now(*_):
-            try:
-                Clipboard.copy(getattr(dlg, "_last_text", "") or "")
-                self.toast("Copiado.")
-            except Exception:
-                self.toast("Ainda não carregou.")
-
-        def toggle_fav(*_):
-            fav = self.imbuement_toggle_favorite(title)
-            self.toast("Favoritado." if fav else "Removido dos favoritos.")
-            try:
-                dlg.dismiss()
-            except Exception:
-                pass
-            self.imbuements_refresh_list()
-
         fav_txt = "REMOVER ⭐" if self.imbuement_is_favorite(title) else "FAVORITAR ⭐"
 
-        dlg = MDDialog(
-            title=title,
-            text="Carregando detalhes...",
-            buttons=[
-                MDFlatButton(text=fav_txt, on_release=toggle_fav),
-                MDFlatButton(text="COPIAR", on_release=copy_now),
-                MDFlatButton(text="FECHAR", on_release=lambda *_: dlg.dismiss()),
-            ],
-        )
+        # Um único diálogo reaproveitado: só troca título/texto/rótulo do favorito.
+        dlg = self._imbu_dialog
+        if dlg is None:
+            self._imbu_fav_btn = MDFlatButton(text=fav_txt, on_release=self._imbu_dialog_toggle_fav)
+            dlg = MDDialog(
+                title=title,
+                text="Carregando detalhes...",
+                buttons=[
+                    self._imbu_fav_btn,
+                    MDFlatButton(text="COPIAR", on_release=self._imbu_dialog_copy),
+                    MDFlatButton(text="FECHAR", on_release=self._imbu_dialog_close),
+                ],
+            )
+            self._imbu_dialog = dlg
+        else:
+            dlg.title = title
+            dlg.text = "Carregando detalhes..."
+            self._imbu_fav_btn.text = fav_txt
+        dlg._last_text = ""
+        self._imbu_dialog_seq += 1
+        seq = self._imbu_dialog_seq
         dlg.open()
 
+        def _set_if_current(value: str, *, last: bool = False) -> None:
+            # Ignora respostas atrasadas de um imbuement aberto antes.
+            if seq != self._imbu_dialog_seq:
+                return
+            dlg.text = value
+            if last:
+                dlg._last_text = value
+
         def run():
             try:
                 page = (ent.page or "").strip()
@@ -2590,48 +2877,35 @@ class TibiaToolsApp(CharControllerMixin, FavoritesControllerMixin, SettingsContr
                 ok, data = fetch_imbuement_details(page)
                 if not ok:
                     msg = f"Erro ao carregar detalhes:\n{data}"
-                    Clock.schedule_once(lambda *_: setattr(dlg, "text", msg), 0)
+                    self.post_ui(_set_if_current, msg)
                     return
 
-                tiers = data  # dict com basic/intricate/powerful
-
-                def fmt(tkey: str, label: str) -> str:
-                    tier = tiers.get(tkey, {}) if isinstance(tiers, dict) else {}
+                tiers = data if isinstance(data, dict) else {}  # basic/intricate/powerful
 
-                    def clean(s: str) -> str:
-                        # Converte sequências literais (ex.: "\\n") em quebras de linha reais
-                        return (s or "").replace("\\r\\n", "\n").replace("\\n", "\n").replace("\\t", "\t").strip()
-
-                    effect = clean(str(tier.get("effect", "")))
+                # Uma lista só para os 3 tiers + fonte, unida em um único join.
+                out = []
+                for label, tkey in _IMBU_TIER_ATTR.items():
+                    tier = tiers.get(tkey) or {}
+                    effect = _clean_escapes(str(tier.get("effect", "")))
                     items = tier.get("items", []) or []
 
-                    out_lines = [f"{label}:"]
+                    out.append(f"{label}:")
                     if effect:
-                        out_lines.append(f"Efeito: {effect}")
+                        out.append(f"Efeito: {effect}")
                     if items:
-                        out_lines.append("Itens:")
-                        for it in items[:50]:
-                            out_lines.append(f"• {clean(str(it))}")
+                        out.append("Itens:")
+                        out.extend(f"• {_clean_escapes(str(it))}" for it in itertools.islice(items, 50))
                     else:
-                        out_lines.append("Itens: (não encontrado)")
-                    return "\n".join(out_lines)
-
-                text = (
-                    fmt("basic", "Basic")
-                    + "\n\n"
-                    + fmt("intricate", "Intricate")
-                    + "\n\n"
-                    + fmt("powerful", "Powerful")
-                    + "\n\n(Fonte: TibiaWiki BR)"
-                )
-                def _set_text(*_):
-                    setattr(dlg, "text", text)
-                    setattr(dlg, "_last_text", text)
-                Clock.schedule_once(_set_text, 0)
+                        out.append("Itens: (não encontrado)")
+                    out.append("")
+                out.append("(Fonte: TibiaWiki BR)")
+                text = "\n".join(out)
+                self.post_ui(partial(_set_if_current, text, last=True))
             except Exception as e:
-                Clock.schedule_once(lambda *_: setattr(dlg, "text", f"Erro: {e}"), 0)
+                err = f"Erro: {e}"
+                self.post_ui(_set_if_current, err)
 
-        threading.Thread(target=run, daemon=True).start()
+        self.run_bg(run)
 
 
 if __name__ == "__main__":
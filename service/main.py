@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import time
 import json
 import traceback
@@ -20,12 +21,20 @@ def _try_get_storage_dir() -> str:
 _CRASH_DIR = _try_get_storage_dir()
 _CRASH_FILE = os.path.join(_CRASH_DIR, "tibia_tools_service_crash.log")
 
+_CRASH_LOCK = threading.Lock()
+_CRASH_FH = None  # aberto na 1ª gravação e mantido (sem open/close por linha)
+
 def _append_crash_log(text: str) -> None:
+    global _CRASH_FH
+    if not text.endswith("\n"):
+        text += "\n"
     try:
-        with open(_CRASH_FILE, "a", encoding="utf-8") as f:
-            f.write(text)
-            if not text.endswith("\n"):
-                f.write("\n")
+        with _CRASH_LOCK:
+            if _CRASH_FH is None:
+                # line-buffered: cada mensagem vai ao disco num único write(); o Android
+                # pode matar o serviço sem atexit, então não seguramos nada em buffer.
+                _CRASH_FH = open(_CRASH_FILE, "a", encoding="utf-8", buffering=1)
+            _CRASH_FH.write(text)
     except Exception:
         pass
 
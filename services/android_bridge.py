@@ -330,17 +330,9 @@ class AndroidBridgeService:
             return
 
         try:
-            st = fav_state.load_state(self.app.data_dir)
-            if not isinstance(st, dict):
-                st = {}
-            st["favorites"] = [str(x) for x in (self.app.favorites or [])]
-            st["monitoring"] = monitoring
-            st["notify_fav_online"] = notify_online
-            st["notify_fav_level"] = notify_level
-            st["notify_fav_death"] = notify_death
-            st["autostart_on_boot"] = autostart
-            st["interval_seconds"] = max(20, min(600, int(interval)))
-            fav_state.save_state(self.app.data_dir, st)
+            # mesmo lock da gravação dos favoritos: os dois fazem read-modify-write do arquivo
+            with self.app._fav_write_lock:
+                self._write_bg_monitor_state(monitoring, notify_online, notify_level, notify_death, autostart, interval)
         except Exception:
             pass
 
@@ -348,3 +340,21 @@ class AndroidBridgeService:
             self.maybe_start_fav_monitor_service()
         except Exception:
             pass
+
+    def _write_bg_monitor_state(self, monitoring, notify_online, notify_level, notify_death, autostart, interval):
+        st = fav_state.load_state(self.app.data_dir)
+        if not isinstance(st, dict):
+            st = {}
+        updates = {
+            "favorites": [str(x) for x in (self.app.favorites or [])],
+            "monitoring": monitoring,
+            "notify_fav_online": notify_online,
+            "notify_fav_level": notify_level,
+            "notify_fav_death": notify_death,
+            "autostart_on_boot": autostart,
+            "interval_seconds": max(20, min(600, int(interval))),
+        }
+        # Só regrava o arquivo compartilhado se algo mudou de fato.
+        if any(st.get(k) != v for k, v in updates.items()):
+            st.update(updates)
+            fav_state.save_state(self.app.data_dir, st)
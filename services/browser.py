@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import webbrowser
+from functools import lru_cache
+
+from services.error_reporting import log_current_exception
+
+
+def _is_android() -> bool:
+    try:
+        from kivy.utils import platform  # type: ignore
+    except Exception:
+        return False
+    return platform == "android"
+
+
+@lru_cache(maxsize=1)
+def _android_view_classes():
+    """(Intent, Uri, PythonActivity) resolvidos uma vez (autoclass faz reflexão JNI)."""
+    from jnius import autoclass  # type: ignore
+
+    return (
+        autoclass("android.content.Intent"),
+        autoclass("android.net.Uri"),
+        autoclass("org.kivy.android.PythonActivity"),
+    )
+
+
+def open_url(url: str) -> None:
+    """Abre a URL no navegador.
+
+    No Android dispara um Intent.ACTION_VIEW direto; o módulo webbrowser só é
+    usado no desktop ou se o Intent falhar.
+    """
+    if _is_android():
+        try:
+            Intent, Uri, PythonActivity = _android_view_classes()
+            PythonActivity.mActivity.startActivity(Intent(Intent.ACTION_VIEW, Uri.parse(url)))
+            return
+        except Exception:
+            log_current_exception(prefix="[browser] Intent ACTION_VIEW falhou; usando webbrowser")
+    webbrowser.open(url)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import os
+import queue
 import sys
+import threading
 import traceback
 from pathlib import Path
 from types import TracebackType
@@ -55,9 +58,18 @@ def _try_running_app_data_dir() -> str | None:
     return str(data_dir)
 
 
+_WRITABLE_DIR: str | None = None
+
+
 def get_writable_dir() -> str:
+    # Só memoriza diretórios reais do app: antes do App subir cai no cwd e
+    # a próxima chamada tenta de novo.
+    global _WRITABLE_DIR
+    if _WRITABLE_DIR is not None:
+        return _WRITABLE_DIR
     for candidate in (_try_android_app_storage(), _try_running_app_data_dir()):
         if candidate:
+            _WRITABLE_DIR = candidate
             return candidate
     return os.getcwd()
 
@@ -66,12 +78,17 @@ def get_crash_file_path(filename: str = CRASH_FILE_NAME) -> str:
     return str(Path(get_writable_dir()) / filename)
 
 
+_READY_DIRS: set[Path] = set()  # diretórios já criados neste processo
+
+
 def write_crash_log(text: str, *, filename: str = CRASH_FILE_NAME) -> None:
     if text is None:
         return
     try:
         crash_file = Path(get_crash_file_path(filename))
-        crash_file.parent.mkdir(parents=True, exist_ok=True)
+        if crash_file.parent not in _READY_DIRS:
+            crash_file.parent.mkdir(parents=True, exist_ok=True)
+            _READY_DIRS.add(crash_file.parent)
         payload = text if text.endswith("\n") else f"{text}\n"
         with crash_file.open("a", encoding="utf-8") as handle:
             handle.write(payload)
@@ -79,13 +96,73 @@ def write_crash_log(text: str, *, filename: str = CRASH_FILE_NAME) -> None:
         pass
 
 
-def log_current_exception(*, prefix: str | None = None, filename: str = CRASH_FILE_NAME) -> None:
-    text = traceback.format_exc()
+# Formatar o traceback lê os fontes de cada frame (linecache); isso fica numa
+# thread própria para não travar a UI a cada exceção capturada. Na thread de quem
+# chamou só se tira um resumo (TracebackException sem ler linhas): a fila não
+# segura frames (widgets, payloads) vivos.
+_LOG_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_LOG_WORKER_LOCK = threading.Lock()
+_LOG_WORKER: threading.Thread | None = None
+
+
+def _format_and_write(prefix: str | None, summary: traceback.TracebackException, filename: str) -> None:
+    text = "".join(summary.format())
     if prefix:
         text = f"{prefix}\n{text}"
     write_crash_log(text, filename=filename)
 
 
+def flush_crash_log() -> None:
+    """Grava agora o que ainda está na fila (on_pause: o Android pode matar sem atexit)."""
+    _drain_log_queue()
+
+
+def _drain_log_queue() -> None:
+    while True:
+        try:
+            item = _LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            return
+        _format_and_write(*item)
+
+
+def _log_worker_loop() -> None:
+    while True:
+        item = _LOG_QUEUE.get()
+        try:
+            _format_and_write(*item)
+        except Exception:
+            pass
+
+
+def _ensure_log_worker() -> bool:
+    global _LOG_WORKER
+    if _LOG_WORKER is not None:
+        return True
+    with _LOG_WORKER_LOCK:
+        if _LOG_WORKER is None:
+            try:
+                worker = threading.Thread(target=_log_worker_loop, name="tt-crashlog", daemon=True)
+                worker.start()
+            except Exception:
+                return False
+            _LOG_WORKER = worker
+            atexit.register(_drain_log_queue)
+    return True
+
+
+def log_current_exception(*, prefix: str | None = None, filename: str = CRASH_FILE_NAME) -> None:
+    exc_info = sys.exc_info()
+    if exc_info[0] is None or not _ensure_log_worker():
+        text = traceback.format_exc()
+        if prefix:
+            text = f"{prefix}\n{text}"
+        write_crash_log(text, filename=filename)
+        return
+    summary = traceback.TracebackException(*exc_info, lookup_lines=False)
+    _LOG_QUEUE.put((prefix, summary, filename))
+
+
 def install_excepthook(target_sys=None) -> None:
     module_sys = target_sys or sys
     default_hook = getattr(module_sys, "__excepthook__", None)
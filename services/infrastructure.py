@@ -1,17 +1,199 @@
 from __future__ import annotations
 
+import bisect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
 from repositories.favorites_repo import load_favorites as repo_load_favorites, save_favorites as repo_save_favorites
+from services.error_reporting import log_current_exception
+
+
+# A concorrência de rede já é limitada em integrations.http (slots + token bucket);
+# o pool só precisa de folga para parse/IO de disco.
+BG_MAX_WORKERS = min(8, (os.cpu_count() or 2) * 2)
 
 
 class InfrastructureMixin:
-    def load_favorites(self):
-        self.favorites = repo_load_favorites(self.data_dir, self.fav_path)
+    _bg_pool: Optional[ThreadPoolExecutor] = None
+    _bg_pool_lock = threading.Lock()
+    # Serializa o read-modify-write do favorites.json (gravação dos favoritos e
+    # sync das configurações do monitor em android_bridge).
+    _fav_write_lock = threading.Lock()
+    # Protege só a troca de _fav_pending_snapshot (curto: não espera o disco).
+    _fav_snapshot_lock = threading.Lock()
+    _fav_pending_snapshot: Optional[list] = None
+    # Nomes (minúsculos) removidos enquanto load_favorites_async lê o arquivo; None fora da carga.
+    _fav_removed_during_load: Optional[set] = None
+
+    def load_favorites_async(self):
+        """Lê os favoritos no pool; a lista é desenhada quando a leitura termina."""
+        self._fav_removed_during_load = set()
+        return self.submit_bg(repo_load_favorites, self._favorites_loaded, self._favorites_load_failed,
+                              self.data_dir, self.fav_path)
+
+    def _favorites_load_failed(self, exc: BaseException) -> None:
+        self._fav_removed_during_load = None
+        self._log_bg_error(exc)
+
+    def _favorites_loaded(self, favorites) -> None:
+        # Preserva o que o usuário adicionou/removeu enquanto o arquivo era lido.
+        removed = self._fav_removed_during_load or set()
+        self._fav_removed_during_load = None
+        merged = [name for name in favorites if name.lower() not in removed]
+        changed = len(merged) != len(favorites)
+        # O arquivo (inclusive o formato legado) pode vir em qualquer ordem; a lista em
+        # memória fica ordenada (case-insensitive) para o bisect.insort dos próximos adds.
+        merged.sort(key=str.lower)
+        present = {name.lower() for name in merged}
+        for name in self.favorites:
+            if name.lower() not in present:
+                # mesma ordem case-insensitive usada em add_current_to_favorites
+                bisect.insort(merged, name, key=str.lower)
+                present.add(name.lower())
+                changed = True
+        self.favorites = merged
+        if changed:
+            self.save_favorites()
+        self.refresh_favorites_list(silent=True)
 
     def save_favorites(self):
-        repo_save_favorites(self.data_dir, self.fav_path, [str(x) for x in (self.favorites or [])])
+        """Agenda a gravação dos favoritos (rajadas de add/remove viram 1 escrita)."""
+        self._fav_dirty = True
+        if getattr(self, "_fav_flush_ev", None) is not None:
+            return
+        try:
+            from kivy.clock import Clock
+            self._fav_flush_ev = Clock.schedule_once(self._flush_favorites, 1.0)
+        except Exception:
+            self._flush_favorites(sync=True)
+
+    def _flush_favorites(self, *_args, sync: bool = False) -> None:
+        """Grava os favoritos pendentes.
+
+        Pelo Clock a escrita vai para o pool (JSON + disco fora da thread da UI);
+        on_pause/on_stop usam sync=True para gravar antes do processo morrer.
+        """
+        ev = getattr(self, "_fav_flush_ev", None)
+        self._fav_flush_ev = None
+        if ev is not None:
+            try:
+                ev.cancel()
+            except Exception:
+                pass
+        if getattr(self, "_fav_dirty", False):
+            self._fav_dirty = False
+            snap = [str(x) for x in (self.favorites or [])]
+            with self._fav_snapshot_lock:
+                self._fav_pending_snapshot = snap
+        elif not sync:
+            return
+        if sync:
+            # Também grava uma foto que ficou na fila do pool (ex.: cancelada no shutdown).
+            self._write_favorites_snapshot()
+        else:
+            self.run_bg(self._write_favorites_snapshot)
+
+    def _write_favorites_snapshot(self) -> None:
+        # Sempre grava a foto mais recente; escritas enfileiradas depois dela viram no-op.
+        with self._fav_write_lock:
+            with self._fav_snapshot_lock:
+                snap, self._fav_pending_snapshot = self._fav_pending_snapshot, None
+            if snap is None:
+                return
+            try:
+                repo_save_favorites(self.data_dir, self.fav_path, snap)
+            except Exception:
+                log_current_exception(prefix="[fav] falha ao gravar favoritos")
+                return
+        # O serviço decide (e lê a lista) pelo arquivo: só reavalia depois da gravação.
+        try:
+            self.post_ui(self._maybe_start_fav_monitor_service)
+        except Exception:
+            log_current_exception(prefix="[fav] falha ao agendar sync do serviço")
+
+    def post_ui(self, fn, *args) -> None:
+        """Enfileira fn(*args) para a thread da UI (pode ser chamado de workers).
+
+        Várias chamadas antes do próximo frame viram um único callback do Clock.
+        """
+        self._ui_queue.append(partial(fn, *args) if args else fn)
+        with self._ui_lock:
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
+        from kivy.clock import Clock
+        Clock.schedule_once(self._flush_ui, 0)
+
+    def _screen(self, name: str):
+        """root.get_screen(name) memoizado (get_screen varre a lista de telas a cada chamada)."""
+        cache = getattr(self, "_screen_cache", None)
+        if cache is None:
+            cache = self._screen_cache = {}
+        scr = cache.get(name)
+        if scr is None:
+            scr = self.root.get_screen(name)
+            cache[name] = scr
+        return scr
+
+    def run_bg(self, fn, *args):
+        """Executa fn(*args) no pool compartilhado de I/O (evita criar 1 thread por ação)."""
+        pool = self._bg_pool
+        if pool is None:
+            with self._bg_pool_lock:
+                pool = self._bg_pool
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=BG_MAX_WORKERS, thread_name_prefix="tt-io")
+                    self._bg_pool = pool
+        return pool.submit(fn, *args)
+
+    def submit_bg(self, fn, on_done, on_error=None, *args):
+        """run_bg + retorno na thread da UI: on_done(resultado) ou on_error(exceção).
+
+        Sem on_error, a exceção só é registrada no log.
+        """
+
+        def _finished(fut) -> None:
+            if fut.cancelled():
+                return
+            exc = fut.exception()
+            if exc is None:
+                self.post_ui(on_done, fut.result())
+            elif on_error is not None:
+                self.post_ui(on_error, exc)
+            else:
+                self.post_ui(self._log_bg_error, exc)
+
+        fut = self.run_bg(fn, *args)
+        fut.add_done_callback(_finished)
+        return fut
+
+    @staticmethod
+    def _log_bg_error(exc: BaseException) -> None:
+        try:
+            raise exc
+        except BaseException:
+            log_current_exception(prefix="[bg] tarefa falhou")
+
+    def _shutdown_bg_pool(self) -> None:
+        with self._bg_pool_lock:
+            pool, self._bg_pool = self._bg_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _flush_ui(self, *_args) -> None:
+        with self._ui_lock:
+            self._ui_flush_scheduled = False
+        queue = self._ui_queue
+        while queue:
+            fn = queue.popleft()
+            try:
+                fn()
+            except Exception:
+                log_current_exception(prefix="[ui] callback falhou")
 
     def _load_prefs_cache(self):
         self.persistence.load_prefs_cache()
@@ -158,6 +158,19 @@ class BackNavigationEventsTests(unittest.TestCase):
         self.assertTrue(second)
         self.assertEqual(app.toast_messages, ["Pressione voltar novamente para sair"])
 
+    def test_back_to_favorites_tab_refreshes_the_list(self):
+        app = self.make_app()
+        shown = []
+        app.on_fav_tab_shown = lambda *args: shown.append(True)
+        app._set_screen_current = lambda name: True
+        app._set_home_tab_current = lambda tab: True
+        app._nav_history = [("home", "tab_fav")]
+        app._nav_current_route = ("bosses", "")
+        self.assertTrue(app.navigate_back())
+        self.assertEqual(shown, [True])
+        app._navigate_to_route(("home", "tab_char"), record=False)
+        self.assertEqual(shown, [True])
+
 
 if __name__ == "__main__":
     unittest.main()
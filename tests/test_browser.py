@@ -0,0 +1,35 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from services import browser
+
+
+class BrowserTests(unittest.TestCase):
+    def test_open_url_uses_webbrowser_off_android(self):
+        with patch.object(browser, "_is_android", return_value=False), \
+                patch("services.browser.webbrowser.open") as mock_open:
+            browser.open_url("https://example.com")
+        mock_open.assert_called_once_with("https://example.com")
+
+    def test_open_url_fires_view_intent_on_android(self):
+        started = []
+
+        class _Intent:
+            ACTION_VIEW = "VIEW"
+
+            def __init__(self, action, uri):
+                self.args = (action, uri)
+
+        uri = SimpleNamespace(parse=lambda url: f"uri:{url}")
+        activity = SimpleNamespace(mActivity=SimpleNamespace(startActivity=lambda i: started.append(i.args)))
+        with patch.object(browser, "_is_android", return_value=True), \
+                patch.object(browser, "_android_view_classes", return_value=(_Intent, uri, activity)), \
+                patch("services.browser.webbrowser.open") as mock_open:
+            browser.open_url("https://example.com")
+        self.assertEqual(started, [("VIEW", "uri:https://example.com")])
+        mock_open.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
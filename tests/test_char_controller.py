@@ -99,6 +99,9 @@ class DummyCharApp(CharControllerMixin):
         self.prefs = {}
         self.favorites = ["Knight One", "mage two"]
 
+    def _screen(self, name):
+        return self.root.get_screen(name)
+
     def search_character(self, *args, **kwargs):
         self.search_calls += 1
 
@@ -120,6 +123,33 @@ class CharControllerTests(unittest.TestCase):
         self.assertEqual(app.char_field.text, "")
         self.assertTrue(app.char_field.focus)
 
+    def test_guildstats_pool_is_created_once(self):
+        app = DummyCharApp()
+        pool = app._guildstats_pool()
+        try:
+            self.assertIs(app._guildstats_pool(), pool)
+        finally:
+            app._shutdown_guildstats_pool()
+        self.assertIsNone(app._gs_pool)
+
+    def test_char_search_release_keeps_newer_owner_claim(self):
+        app = DummyCharApp()
+        self.assertTrue(app._char_search_claim("knight one", 1))
+        app._char_search_release("knight one", 1)
+        self.assertTrue(app._char_search_claim("knight one", 2))
+        app._char_search_release("knight one", 1)  # busca antiga terminando depois
+        self.assertFalse(app._char_search_claim("knight one", 3))
+        app._char_search_release("knight one", 2)
+        self.assertTrue(app._char_search_claim("knight one", 3))
+
+    def test_char_search_claim_blocks_duplicates_until_released(self):
+        app = DummyCharApp()
+        self.assertTrue(app._char_search_claim("knight one"))
+        self.assertFalse(app._char_search_claim("knight one"))
+        self.assertTrue(app._char_search_claim("mage two"))
+        app._char_search_release("knight one")
+        self.assertTrue(app._char_search_claim("knight one"))
+
     def test_open_char_from_account_list_populates_field_and_searches(self):
         app = DummyCharApp()
         app.open_char_from_account_list("Sorcerer X")
@@ -127,6 +157,23 @@ class CharControllerTests(unittest.TestCase):
         self.assertFalse(app.char_field.focus)
         self.assertEqual(app.search_calls, 1)
 
+    def test_account_char_release_searches_row_name(self):
+        app = DummyCharApp()
+        app._on_account_char_release(SimpleNamespace(text="Paladin Z"))
+        self.assertEqual(app.char_field.text, "Paladin Z")
+        self.assertEqual(app.search_calls, 1)
+
+    def test_add_current_to_favorites_keeps_case_insensitive_order(self):
+        app = DummyCharApp()
+        app.save_favorites = lambda: None
+        app._maybe_start_fav_monitor_service = lambda: None
+        app.refresh_favorites_list = lambda: None
+        app.char_field.text = "Lancer"
+        app.add_current_to_favorites()
+        self.assertEqual(app.favorites, ["Knight One", "Lancer", "mage two"])
+        app.add_current_to_favorites()
+        self.assertEqual(app.last_toast, "Já está nos favoritos.")
+
     def test_get_and_add_char_history_normalize_values(self):
         app = DummyCharApp()
         app.prefs["char_history"] = [" Alpha ", "", None, 123]
@@ -139,6 +186,17 @@ class CharControllerTests(unittest.TestCase):
         app = DummyCharApp()
         reason = "Slain at Level 100 by Dragon, Demon and Hero."
         self.assertEqual(app._shorten_death_reason(reason), "Slain by Dragon +2")
+        self.assertEqual(app._shorten_death_reason("Died at Level 8 by a rat."), "Died by a rat")
+        self.assertEqual(app._shorten_death_reason("  "), "")
+        self.assertEqual(app._shorten_death_reason("x" * 90), "x" * 80 + "…")
+
+    def test_death_row_release_builds_dialog_text_on_tap(self):
+        app = DummyCharApp()
+        shown = []
+        app._show_text_dialog = lambda title, text: shown.append((title, text))
+        app._on_char_death_release(SimpleNamespace(_death=("Slain by a dragon.", "2026-03-06 • lvl 100")))
+        app._on_char_death_release(SimpleNamespace())
+        self.assertEqual(shown, [("Morte", "Slain by a dragon.\n\n2026-03-06 • lvl 100")])
 
     def test_safe_helpers(self):
         app = DummyCharApp()
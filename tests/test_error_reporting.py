@@ -0,0 +1,56 @@
+import queue
+import unittest
+from unittest.mock import patch
+
+from services import error_reporting
+
+
+class ErrorReportingTests(unittest.TestCase):
+    def test_log_current_exception_formats_off_the_caller(self):
+        written = []
+        with patch.object(error_reporting, "_LOG_QUEUE", queue.SimpleQueue()), \
+                patch.object(error_reporting, "_ensure_log_worker", return_value=True), \
+                patch.object(error_reporting, "write_crash_log", lambda text, filename: written.append(text)):
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                error_reporting.log_current_exception(prefix="[test] falhou")
+            self.assertEqual(written, [])
+            error_reporting._drain_log_queue()
+        self.assertEqual(len(written), 1)
+        self.assertTrue(written[0].startswith("[test] falhou\nTraceback"))
+        self.assertIn("ValueError: boom", written[0])
+
+    def test_queued_entry_does_not_hold_frames(self):
+        q = queue.SimpleQueue()
+        with patch.object(error_reporting, "_LOG_QUEUE", q), \
+                patch.object(error_reporting, "_ensure_log_worker", return_value=True):
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                error_reporting.log_current_exception()
+            _prefix, summary, _filename = q.get_nowait()
+        self.assertNotIsInstance(summary, BaseException)
+        self.assertFalse(any(f.locals for f in summary.stack))
+        self.assertIsNone(getattr(summary, "exc_traceback", None))
+
+    def test_writable_dir_is_memoized_only_for_app_dirs(self):
+        calls = []
+
+        def _android():
+            calls.append("android")
+            return None
+
+        with patch.object(error_reporting, "_WRITABLE_DIR", None), \
+                patch.object(error_reporting, "_try_android_app_storage", _android), \
+                patch.object(error_reporting, "_try_running_app_data_dir", return_value=None) as app_dir, \
+                patch("services.error_reporting.os.getcwd", return_value="/cwd"):
+            self.assertEqual(error_reporting.get_writable_dir(), "/cwd")
+            app_dir.return_value = "/data/app"
+            self.assertEqual(error_reporting.get_writable_dir(), "/data/app")
+            self.assertEqual(error_reporting.get_writable_dir(), "/data/app")
+        self.assertEqual(calls, ["android", "android"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -118,6 +118,8 @@ class DummyFavoritesApp(FavoritesControllerMixin):
         self.service_sync = 0
         self.toasts = []
         self.search_calls = 0
+        self.current_tab = "tab_fav"
+        self.current_screen = "home"
 
     def toast(self, message: str):
         self.toasts.append(message)
@@ -155,6 +157,12 @@ class DummyFavoritesApp(FavoritesControllerMixin):
     def _format_ago_short(self, dt):
         return "há pouco"
 
+    def _get_current_home_tab(self):
+        return self.current_tab
+
+    def _get_current_screen_name(self):
+        return self.current_screen
+
 
 class FavoritesControllerTests(unittest.TestCase):
     def test_status_presentation_uses_offline_duration(self):
@@ -163,13 +171,20 @@ class FavoritesControllerTests(unittest.TestCase):
         self.assertEqual(label, "Offline • há pouco")
         self.assertEqual(color, (0.95, 0.3, 0.3, 1))
 
-    @patch("features.favorites.controller.webbrowser.open")
+    @patch("services.browser.webbrowser.open")
     def test_open_fav_on_site_quotes_name(self, mock_open):
         app = DummyFavoritesApp()
         app._open_fav_on_site("Knight One")
         mock_open.assert_called_once()
         self.assertIn("Knight+One", mock_open.call_args.args[0])
 
+    @patch("services.browser.webbrowser.open")
+    def test_open_fav_on_site_uses_cached_row_url(self, mock_open):
+        app = DummyFavoritesApp()
+        app._fav_items["knight one"] = SimpleNamespace(_url="https://example.invalid/cached")
+        app._open_fav_on_site("Knight One")
+        mock_open.assert_called_once_with("https://example.invalid/cached")
+
     @patch("features.favorites.controller.Clipboard.copy")
     def test_copy_fav_name_calls_clipboard_and_toast(self, mock_copy):
         app = DummyFavoritesApp()
@@ -182,10 +197,49 @@ class FavoritesControllerTests(unittest.TestCase):
         app._remove_favorite("knight one")
         self.assertEqual(app.favorites, ["Mage Two"])
         self.assertEqual(app.saved, 1)
-        self.assertEqual(app.service_sync, 1)
+        # o serviço só é reavaliado depois que save_favorites gravar o arquivo
+        self.assertEqual(app.service_sync, 0)
         self.assertEqual(app.refreshed, 1)
         self.assertEqual(app.toasts[-1], "Removido dos favoritos.")
 
+    def test_remove_favorite_is_recorded_while_loading(self):
+        app = DummyFavoritesApp()
+        app._fav_removed_during_load = set()
+        app._remove_favorite("Mage Two")
+        self.assertEqual(app._fav_removed_during_load, {"mage two"})
+
+    def test_fav_item_release_opens_actions_for_row_name(self):
+        app = DummyFavoritesApp()
+        calls = []
+        app._fav_actions = lambda name, caller=None: calls.append((name, caller))
+        item = SimpleNamespace(text="Knight One")
+        app._on_fav_release(item)
+        self.assertEqual(calls, [("Knight One", item)])
+
+    def test_fav_actions_reuses_menu_and_targets_latest_name(self):
+        class _Menu:
+            def __init__(self, **kwargs):
+                self.caller = kwargs.get("caller")
+                self.items = kwargs.get("items")
+
+            def open(self):
+                pass
+
+            def dismiss(self):
+                pass
+
+        app = DummyFavoritesApp()
+        removed = []
+        app._remove_favorite = removed.append
+        with patch("features.favorites.controller.MDDropdownMenu", _Menu):
+            app._fav_actions("Knight One", caller="row1")
+            first = app._fav_menu
+            app._fav_actions("Mage Two", caller="row2")
+        self.assertIs(app._fav_menu, first)
+        self.assertEqual(first.caller, "row2")
+        first.items[3]["on_release"]()
+        self.assertEqual(removed, ["Mage Two"])
+
     def test_open_fav_in_app_switches_tab_and_searches(self):
         app = DummyFavoritesApp()
         app._open_fav_in_app("Knight One")
@@ -193,6 +247,71 @@ class FavoritesControllerTests(unittest.TestCase):
         self.assertEqual(app.home.ids.char_name.text, "Knight One")
         self.assertEqual(app.search_calls, 1)
 
+    def test_fav_single_change_detects_one_insert_or_removal(self):
+        change = FavoritesControllerMixin._fav_single_change
+        self.assertEqual(change(["a", "c"], ["a", "b", "c"]), ("add", 1))
+        self.assertEqual(change(["a", "b", "c"], ["a", "c"]), ("remove", 1))
+        self.assertEqual(change(["a"], ["a", "z"]), ("add", 1))
+        self.assertIsNone(change(["a", "b"], ["c", "d", "e"]))
+        self.assertIsNone(change(["a", "b"], ["b", "a"]))
+
+    def test_patch_fav_rows_touches_only_changed_row(self):
+        app = DummyFavoritesApp()
+        app._fav_row_presentation = lambda name, key, svc, force: ("Offline", None)
+        app._build_fav_item = lambda name, secondary, color: SimpleNamespace(text=name)
+
+        class _Container:
+            def __init__(self, children):
+                self.children = list(children)
+
+            def add_widget(self, widget, index=0):
+                self.children.insert(index, widget)
+
+            def remove_widget(self, widget):
+                self.children.remove(widget)
+
+        knight, mage = SimpleNamespace(text="Knight One"), SimpleNamespace(text="Mage Two")
+        container = _Container([mage, knight])  # ordem de children do Kivy: invertida
+        app._fav_items = {"knight one": knight, "mage two": mage}
+        app._fav_rendered_signature = ["knight one", "mage two"]
+
+        names = ["Knight One", "Lancer", "Mage Two"]
+        self.assertTrue(app._patch_fav_rows(container, names, [n.lower() for n in names], {}))
+        self.assertEqual([w.text for w in reversed(container.children)], names)
+
+        names = ["Knight One", "Lancer"]
+        self.assertTrue(app._patch_fav_rows(container, names, [n.lower() for n in names], {}))
+        self.assertEqual([w.text for w in reversed(container.children)], names)
+        self.assertEqual(set(app._fav_items), {"knight one", "lancer"})
+
+    def test_favorites_container_is_resolved_once(self):
+        app = DummyFavoritesApp()
+        home, container = app._get_favorites_container()
+        self.assertIs(container, app.home.ids.fav_list)
+        app.root = None
+        self.assertEqual(app._get_favorites_container(), (home, container))
+
+    def test_fav_refresh_tick_skips_when_idle_and_timer_stops(self):
+        app = DummyFavoritesApp()
+        app.favorites = []
+        app._fav_refresh_tick(0)
+        self.assertEqual(app.refreshed, 0)
+        app.favorites = ["Knight One"]
+        app._fav_refresh_tick(0)
+        self.assertEqual(app.refreshed, 1)
+        app.current_tab = "tab_char"
+        app._fav_refresh_tick(0)
+        self.assertEqual(app.refreshed, 1)
+        app.current_tab, app.current_screen = "tab_fav", "bosses"
+        app._fav_refresh_tick(0)
+        self.assertEqual(app.refreshed, 1)
+
+        cancelled = []
+        app._fav_refresh_event = SimpleNamespace(cancel=lambda: cancelled.append(True))
+        app._stop_fav_refresh_timer()
+        self.assertEqual(cancelled, [True])
+        self.assertIsNone(app._fav_refresh_event)
+
 
 if __name__ == "__main__":
     unittest.main()
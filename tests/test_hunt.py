@@ -17,6 +17,21 @@ Session Time: 01:30h"""
         self.assertIn("XP/h", result.pretty)
         self.assertIn("1.000.000 gp", result.pretty)
 
+    def test_parse_hunt_session_lines(self):
+        lines = [
+            "Session data: From 2024-01-01, 10:00:00 to 2024-01-01, 11:00:00",
+            "Session: 01:00h",
+            "Raw XP Gain: 2,000,000",
+            "XP Gain: 3,000,000",
+            "Loot: 500,000",
+            "Supplies: 100,000",
+            "Balance: 400,000",
+        ]
+        result = parse_hunt_session_text(lines)
+        self.assertTrue(result.ok)
+        self.assertIn("400.000 gp", result.pretty)
+        self.assertIn("Raw XP Gain: 2.000.000", result.pretty)
+
     def test_invalid_hunt_text(self):
         result = parse_hunt_session_text("nada util aqui")
         self.assertFalse(result.ok)
@@ -0,0 +1,170 @@
+import sys
+import threading
+import types
+import unittest
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from services.infrastructure import InfrastructureMixin
+
+
+class _FakeApp(InfrastructureMixin):
+    def __init__(self):
+        self._ui_queue = deque()
+        self._ui_lock = threading.Lock()
+        self._ui_flush_scheduled = False
+
+
+class InfrastructureTests(unittest.TestCase):
+    def test_post_ui_coalesces_into_single_clock_callback(self):
+        scheduled = []
+        clock_mod = types.ModuleType("kivy.clock")
+        clock_mod.Clock = SimpleNamespace(schedule_once=lambda fn, dt=0: scheduled.append(fn))
+        app = _FakeApp()
+        calls = []
+
+        with patch.dict(sys.modules, {"kivy.clock": clock_mod}):
+            app.post_ui(calls.append, 1)
+            app.post_ui(calls.append, 2)
+            app.post_ui(lambda: calls.append(3))
+
+        self.assertEqual(len(scheduled), 1)
+        scheduled[0](0)
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertFalse(app._ui_flush_scheduled)
+
+    def test_run_bg_reuses_shared_pool(self):
+        app = _FakeApp()
+        self.assertEqual(app.run_bg(lambda a, b: a + b, 2, 3).result(timeout=5), 5)
+        pool = app._bg_pool
+        names = {app.run_bg(lambda: threading.current_thread().name).result(timeout=5) for _ in range(3)}
+        self.assertIs(app._bg_pool, pool)
+        self.assertTrue(all(name.startswith("tt-io") for name in names))
+        app._shutdown_bg_pool()
+        self.assertIsNone(app._bg_pool)
+
+    def test_submit_bg_delivers_result_or_error_on_ui(self):
+        flushed = threading.Event()
+
+        def _schedule(fn, dt=0):
+            fn(0)
+            flushed.set()
+
+        clock_mod = types.ModuleType("kivy.clock")
+        clock_mod.Clock = SimpleNamespace(schedule_once=_schedule)
+        app = _FakeApp()
+        done, errors = [], []
+
+        def _boom():
+            raise ValueError("x")
+
+        with patch.dict(sys.modules, {"kivy.clock": clock_mod}):
+            app.submit_bg(lambda a: a * 2, done.append, errors.append, 21)
+            self.assertTrue(flushed.wait(5))
+            flushed.clear()
+            app.submit_bg(_boom, done.append, errors.append)
+            self.assertTrue(flushed.wait(5))
+        app._shutdown_bg_pool()
+
+        self.assertEqual(done, [42])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_flush_favorites_writes_latest_snapshot_off_ui(self):
+        app = _FakeApp()
+        app.data_dir, app.fav_path = "d", "f.json"
+        queued, writes = [], []
+        app.run_bg = queued.append
+        with patch("services.infrastructure.repo_save_favorites", lambda _d, _p, favs: writes.append(favs)):
+            app.favorites, app._fav_dirty = ["A"], True
+            app._flush_favorites()
+            app.favorites, app._fav_dirty = ["A", "B"], True
+            app._flush_favorites()
+            self.assertEqual(writes, [])
+            for fn in queued:
+                fn()
+            app.favorites, app._fav_dirty = ["C"], True
+            app._flush_favorites(sync=True)
+        self.assertEqual(writes, [["A", "B"], ["C"]])
+
+    def test_service_is_reevaluated_only_after_favorites_are_written(self):
+        app = _FakeApp()
+        app.data_dir, app.fav_path = "d", "f.json"
+        events = []
+        app._maybe_start_fav_monitor_service = lambda: events.append("service")
+        app.post_ui = lambda fn, *args: fn(*args)
+        with patch("services.infrastructure.repo_save_favorites", lambda _d, _p, favs: events.append(("write", favs))):
+            app.favorites, app._fav_dirty = ["A"], True
+            app._flush_favorites(sync=True)
+        self.assertEqual(events, [("write", ["A"]), "service"])
+
+    def test_snapshot_stored_during_a_write_is_written_next(self):
+        app = _FakeApp()
+        app.data_dir, app.fav_path = "d", "f.json"
+        app.post_ui = lambda fn, *args: None
+        queued, writes = [], []
+        app.run_bg = queued.append
+
+        def _save(_d, _p, favs):
+            writes.append(favs)
+            if len(writes) == 1:
+                # UI adiciona outro favorito enquanto o pool ainda grava o primeiro
+                app.favorites, app._fav_dirty = ["A", "B"], True
+                app._flush_favorites()
+
+        with patch("services.infrastructure.repo_save_favorites", _save):
+            app.favorites, app._fav_dirty = ["A"], True
+            app._flush_favorites()
+            while queued:
+                queued.pop(0)()
+        self.assertEqual(writes, [["A"], ["A", "B"]])
+
+    def test_sync_flush_writes_snapshot_left_on_cancelled_pool(self):
+        app = _FakeApp()
+        app.data_dir, app.fav_path = "d", "f.json"
+        queued, writes = [], []
+        app.run_bg = queued.append
+        with patch("services.infrastructure.repo_save_favorites", lambda _d, _p, favs: writes.append(favs)):
+            app.favorites, app._fav_dirty = ["X"], True
+            app._flush_favorites()
+            queued.clear()  # shutdown com cancel_futures=True: a escrita nunca roda
+            app._flush_favorites(sync=True)
+        self.assertEqual(writes, [["X"]])
+        self.assertIsNone(app._fav_pending_snapshot)
+
+    def test_favorites_loaded_merges_changes_made_during_load(self):
+        app = _FakeApp()
+        app._fav_removed_during_load = {"druid zero"}
+        app.favorites = ["zed four", "Knight One", "Bard Three"]
+        saves, refreshes = [], []
+        app.save_favorites = lambda: saves.append(list(app.favorites))
+        app.refresh_favorites_list = lambda silent=False: refreshes.append(silent)
+        app._favorites_loaded(["Druid Zero", "knight one", "Mage Two"])
+        self.assertEqual(app.favorites, ["Bard Three", "knight one", "Mage Two", "zed four"])
+        self.assertEqual(saves, [app.favorites])
+        self.assertEqual(refreshes, [True])
+        self.assertIsNone(app._fav_removed_during_load)
+
+    def test_favorites_loaded_sorts_an_unsorted_file(self):
+        app = _FakeApp()
+        app.favorites = []
+        app.save_favorites = lambda: None
+        app.refresh_favorites_list = lambda silent=False: None
+        app._favorites_loaded(["Zed Four", "alpha One", "Mage Two"])
+        self.assertEqual(app.favorites, ["alpha One", "Mage Two", "Zed Four"])
+
+    def test_screen_lookup_is_memoized(self):
+        app = _FakeApp()
+        calls = []
+        screens = {"home": object()}
+        app.root = SimpleNamespace(get_screen=lambda name: calls.append(name) or screens[name])
+        self.assertIs(app._screen("home"), screens["home"])
+        self.assertIs(app._screen("home"), screens["home"])
+        self.assertEqual(calls, ["home"])
+        with self.assertRaises(KeyError):
+            app._screen("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
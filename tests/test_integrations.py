@@ -2,6 +2,9 @@ import unittest
 from unittest.mock import Mock, patch
 
 from integrations.github_releases import fetch_latest_release, parse_github_repo
+from integrations.http import TokenBucket, get_session
+from integrations.tibiadata import fetch_guildstats_deaths_xp, guildstats_exp_url, normalize_character
+from integrations.tibia_com import character_page_url
 from integrations.tibia_com import parse_tibia_datetime
 
 
@@ -25,6 +28,78 @@ class IntegrationTests(unittest.TestCase):
         self.assertEqual(info.tag, "v1.2.3")
         self.assertIn("releases/tag", info.html_url)
 
+    def test_get_session_is_shared(self):
+        session = get_session()
+        self.assertIs(session, get_session())
+        self.assertEqual(session.headers.get("Connection"), "keep-alive")
+
+    def test_token_bucket_waits_after_burst(self):
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("integrations.http.time.monotonic", lambda: clock[0]), patch("integrations.http.time.sleep", fake_sleep):
+            bucket = TokenBucket(rate=2.0, capacity=2)
+            bucket.acquire()
+            bucket.acquire()
+            self.assertEqual(sleeps, [])
+            bucket.acquire()
+        self.assertEqual(sleeps, [0.5])
+
+    @patch("integrations.tibiadata._get_text")
+    def test_guildstats_deaths_xp_fast_path_and_table_fallback(self, mock_get_text):
+        row = "<tr><td>2026-01-01</td><td>{}</td></tr>"
+        table = "<table><tr><th>Quando</th><th>Exp lost</th></tr>{}</table>"
+        mock_get_text.return_value = table.format(row.format("-1.234.567") + row.format("- 20,000"))
+        self.assertEqual(fetch_guildstats_deaths_xp("Knight One"), ["-1,234,567", "-20,000"])
+
+        mock_get_text.return_value = "<p>intro</p>" + table.format(row.format("-5.000"))
+        self.assertEqual(fetch_guildstats_deaths_xp("Knight One"), ["-5.000"])
+        self.assertEqual(fetch_guildstats_deaths_xp("Knight One", light_only=True), [])
+
+    def test_normalize_character_projects_ui_fields(self):
+        data = {
+            "character": {
+                "character": {
+                    "name": "Knight One",
+                    "guild": {"name": " Red Rose ", "rank": "Leader"},
+                    "houses": [{"name": "Loot Lane 1", "town": "Thais"}, {"house": "Depot 2"}, " ", "Street 3"],
+                },
+                "deaths": [{"level": 100}],
+                "other_characters": [{"name": "Mage Two", "world": "Antica", "status": "Online"}, "Druid Three", {"name": ""}],
+            }
+        }
+        view = normalize_character(data)
+        self.assertEqual(view.name, "Knight One")
+        self.assertEqual((view.vocation, view.level, view.status), ("N/A", "N/A", ""))
+        self.assertEqual(view.guild_line, "Guild: Red Rose (Leader)")
+        self.assertEqual(view.houses_list, ["Loot Lane 1 (Thais)", "Depot 2", "Street 3"])
+        self.assertEqual(view.deaths, [{"level": 100}])
+        self.assertEqual(
+            view.other_characters,
+            [
+                {"name": "Mage Two", "world": "Antica", "status": "online"},
+                {"name": "Druid Three", "world": "", "status": ""},
+            ],
+        )
+        self.assertEqual(normalize_character({}).guild_line, "Guild: N/A")
+        self.assertEqual(normalize_character({"character": {"deaths": ["x", {"level": 1}]}}).deaths, [{"level": 1}])
+
+    def test_character_page_url_encodes_name(self):
+        self.assertEqual(
+            character_page_url(" Knight O'Neil "),
+            "https://www.tibia.com/community/?subtopic=characters&name=Knight+O%27Neil",
+        )
+
+    def test_guildstats_exp_url_quotes_spaces(self):
+        self.assertEqual(
+            guildstats_exp_url("Knight O'Neil"),
+            "https://guildstats.eu/character?nick=Knight%20O%27Neil&tab=9",
+        )
+
     def test_parse_tibia_datetime(self):
         dt = parse_tibia_datetime("Jan 22 2026, 10:42:00 CET")
         self.assertIsNotNone(dt)
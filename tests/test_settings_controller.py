@@ -60,6 +60,9 @@ class DummySettingsApp(SettingsControllerMixin):
         self.cache_cleared = False
         self.bg_synced = False
 
+    def _screen(self, name):
+        return self.root.get_screen(name)
+
     def _prefs_get(self, key, default=None):
         return self.prefs.get(key, default)
 
@@ -82,13 +85,13 @@ class DummySettingsApp(SettingsControllerMixin):
 class SettingsControllerTests(unittest.TestCase):
     def test_settings_open_releases(self):
         app = DummySettingsApp()
-        with patch('features.settings.controller.webbrowser.open') as mock_open:
+        with patch('services.browser.webbrowser.open') as mock_open:
             app.settings_open_releases()
         mock_open.assert_called_once_with('https://github.com/openai/example-repo/releases')
 
     def test_updates_done_with_new_release(self):
         app = DummySettingsApp()
-        with patch('features.settings.controller.webbrowser.open') as mock_open:
+        with patch('services.browser.webbrowser.open') as mock_open:
             app._updates_done('v1.1.0', 'https://github.com/openai/example-repo/releases/tag/v1.1.0', 'v1.0.0')
         self.assertEqual(app.screen.ids.set_status.text, 'Nova versão: v1.1.0')
         self.assertTrue(app.dialogs)
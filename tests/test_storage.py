@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from core.storage import safe_read_json, safe_write_json
+from core.storage import loads_json, safe_read_json, safe_write_json
 
 
 class StorageTests(unittest.TestCase):
@@ -18,6 +18,15 @@ class StorageTests(unittest.TestCase):
             path.write_text('{oops', encoding='utf-8')
             self.assertEqual(safe_read_json(str(path), default=[]), [])
 
+    def test_loads_json_accepts_bytes_and_keeps_unicode(self):
+        self.assertEqual(loads_json('{"nome": "Ação"}'.encode('utf-8')), {'nome': 'Ação'})
+        with self.assertRaises(ValueError):
+            loads_json(b'{oops')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'favs.json'
+            self.assertTrue(safe_write_json(str(path), ['Ação']))
+            self.assertIn('Ação', path.read_text(encoding='utf-8'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 KV_PARTS = ['ui/kv/common.kv', 'ui/kv/home.kv', 'ui/kv/bosses.kv', 'ui/kv/boosted.kv', 'ui/kv/training.kv', 'ui/kv/imbuements.kv', 'ui/kv/hunt.kv', 'ui/kv/stamina.kv', 'ui/kv/settings.kv', 'ui/kv/bossfavorites.kv', 'ui/kv/root.kv']
 
-FALLBACK_KV = '# --- ui/kv/common.kv ---\n#:import dp kivy.metrics.dp\n\n# ---------- UI defaults (polish) ----------\n<MDCard>:\n    radius: [dp(16), dp(16), dp(16), dp(16)]\n    elevation: 1\n\n<MDRaisedButton>:\n    size_hint_y: None\n    height: dp(44)\n\n<AppCard@MDCard>:\n    padding: dp(14)\n    radius: [dp(18), dp(18), dp(18), dp(18)]\n    elevation: 1\n\n<SectionTitle@MDLabel>:\n    font_style: "Subtitle1"\n    bold: True\n    size_hint_y: None\n    height: self.texture_size[1] + dp(8)\n\n<HintText@MDLabel>:\n    theme_text_color: "Hint"\n    font_style: "Caption"\n    size_hint_y: None\n    height: self.texture_size[1] + dp(6)\n\n<ActionRow@MDBoxLayout>:\n    size_hint_y: None\n    height: dp(44)\n    spacing: dp(10)\n\n<MoreItem>:\n    icon: "chevron-right"\n    IconLeftWidget:\n        icon: root.icon\n\n\n# --- ui/kv/home.kv ---\n<HomeScreen@MDScreen>:\n    char_last_url: ""\n\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Tibia Tools"\n            elevation: 2\n\n        MDBottomNavigation:\n            id: bottom_nav\n            panel_color: app.theme_cls.bg_normal\n\n\n            MDBottomNavigationItem:\n                name: "tab_dashboard"\n                text: "Home"\n                icon: "home"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Boosted hoje"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "refresh"\n                                        on_release: app.dashboard_refresh()\n\n                                ClickableRow:\n                                    orientation: "horizontal"\n                                    spacing: dp(10)\n                                    size_hint_y: None\n                                    height: dp(56)\n                                    on_release: app.open_boosted_from_home("creature")\n                                    AnchorLayout:\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        anchor_x: "center"\n                                        anchor_y: "center"\n                                        AsyncImage:\n                                            id: dash_boost_creature_sprite\n                                            source: ""\n                                            size_hint: None, None\n                                            size: dp(48), dp(48)\n                                            allow_stretch: True\n                                            keep_ratio: True\n                                            opacity: 1 if self.source else 0\n                                    MDLabel:\n                                        id: dash_boost_creature\n                                        text: "-"\n                                        valign: "middle"\n                                        halign: "left"\n                                        text_size: self.size\n\n                                ClickableRow:\n                                    orientation: "horizontal"\n                                    spacing: dp(10)\n                                    size_hint_y: None\n                                    height: dp(56)\n                                    on_release: app.open_boosted_from_home("boss")\n                                    AnchorLayout:\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        anchor_x: "center"\n                                        anchor_y: "center"\n                                        AsyncImage:\n                                            id: dash_boost_boss_sprite\n                                            source: ""\n                                            size_hint: None, None\n                                            size: dp(48), dp(48)\n                                            allow_stretch: True\n                                            keep_ratio: True\n                                            opacity: 1 if self.source else 0\n                                    MDLabel:\n                                        id: dash_boost_boss\n                                        text: "-"\n                                        valign: "middle"\n                                        halign: "left"\n                                        text_size: self.size\n\n                                MDLabel:\n                                    id: dash_boost_updated\n                                    text: ""\n                                    theme_text_color: "Hint"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Último char"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "account-search"\n                                        on_release: app.select_home_tab("tab_char")\n\n                                MDLabel:\n                                    id: dash_last_char\n                                    text: "-"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                                MDRaisedButton:\n                                    text: "Abrir último no Tibia.com"\n                                    on_release: app.dashboard_open_last_char()\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Bosses favoritos (High)"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "skull"\n                                        on_release: app.open_more_target("bosses")\n\n                                MDLabel:\n                                    id: dash_boss_hint\n                                    text: "Configure favoritos na tela Bosses."\n                                    theme_text_color: "Hint"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                                MDList:\n                                    id: dash_boss_list\n\n            MDBottomNavigationItem:\n                name: "tab_char"\n                text: "Char"\n                icon: "account-search"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        MDBoxLayout:\n                            id: world_row\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: char_name\n                                hint_text: "Nome do personagem"\n                                mode: "rectangle"\n                                multiline: False\n                                on_text_validate: app.search_character()\n\n                            MDIconButton:\n                                icon: "history"\n                                on_release: app.open_char_history_menu()\n\n                            MDIconButton:\n                                icon: "close"\n                                on_release: app.clear_char_search()\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Buscar"\n                                on_release: app.search_character()\n\n                            MDRectangleFlatIconButton:\n                                icon: "open-in-new"\n                                text: "Tibia.com"\n                                on_release: app.open_last_in_browser()\n\n                            MDRectangleFlatIconButton:\n                                icon: "star-plus-outline"\n                                text: "Favoritar"\n                                on_release: app.add_current_to_favorites()\n\n                        MDCard:\n                            id: char_result_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                size_hint_y: None\n                                height: self.minimum_height\n                                spacing: dp(8)\n\n                                MDLabel:\n                                    id: char_title\n                                    text: "Faça uma busca"\n                                    font_style: "H6"\n                                    bold: True\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(4)\n\n                                MDLabel:\n                                    id: char_badge\n                                    text: ""\n                                    markup: True\n                                    halign: "right"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(4)\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_details_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Digite o nome e toque em Buscar."\n                                    IconLeftWidget:\n                                        icon: "information-outline"\n\n                        MDCard:\n                            id: char_xp_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "XP últimos 30 dias"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                                Widget:\n                                    size_hint_x: 1\n\n                                MDIconButton:\n                                    icon: "open-in-new"\n                                    on_release: app.open_char_xp_source()\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDLabel:\n                                id: char_xp_total\n                                text: "—"\n                                theme_text_color: "Hint"\n                                size_hint_y: None\n                                height: self.texture_size[1] + dp(6)\n\n                            MDList:\n                                id: char_xp_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Faça uma busca para ver o histórico."\n                                    IconLeftWidget:\n                                        icon: "chart-line"\n\n                        MDCard:\n                            id: char_deaths_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "Últimas mortes"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                                Widget:\n                                    size_hint_x: 1\n\n                                MDIconButton:\n                                    icon: "content-copy"\n                                    on_release: app.copy_deaths_to_clipboard()\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_deaths_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Nenhuma informação ainda."\n                                    IconLeftWidget:\n                                        icon: "skull-outline"\n\n                        MDCard:\n                            id: char_account_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "Outros chars na conta"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_account_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Faça uma busca para ver os outros personagens."\n                                    IconLeftWidget:\n                                        icon: "account-multiple"\n\n            MDBottomNavigationItem:\n                name: "tab_share"\n                text: "Share XP"\n                icon: "account-group"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                SectionTitle:\n                                    text: "Calculadora de Shared XP"\n\n                                HintText:\n                                    text: "Informe seu level e veja a faixa permitida para shared."\n\n                                MDTextField:\n                                    id: share_level\n                                    hint_text: "Seu level"\n                                    mode: "rectangle"\n                                    input_filter: "int"\n\n                                ActionRow:\n                                    MDRaisedButton:\n                                        text: "Calcular"\n                                        on_release: app.calc_shared_xp()\n\n                                MDLabel:\n                                    id: share_result\n                                    text: ""\n                                    halign: "left"\n                                    valign: "top"\n                                    text_size: self.width, None\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(20)\n\n\n            MDBottomNavigationItem:\n                name: "tab_fav"\n                text: "Favoritos"\n                icon: "star"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    SectionTitle:\n                                        text: "Favoritos"\n\n                                    MDIconButton:\n                                        icon: "refresh"\n                                        on_release: app.refresh_favorites_list(force=True)\n\n                                HintText:\n                                    text: "Toque em um favorito para opções."\n\n                                MDSeparator:\n                                    height: dp(1)\n\n                                MDList:\n                                    id: fav_list\n                                    size_hint_y: None\n                                    height: self.minimum_height\n            MDBottomNavigationItem:\n                name: "tab_more"\n                text: "Mais"\n                icon: "dots-horizontal"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                SectionTitle:\n                                    text: "Ferramentas"\n\n                                MDSeparator:\n                                    height: dp(1)\n\n                                MDList:\n                                    MoreItem:\n                                        text: "Bosses (ExevoPan)"\n                                        icon: "skull"\n                                        on_release: app.open_more_target("bosses")\n                                    MoreItem:\n                                        text: "Boosted"\n                                        icon: "star-four-points"\n                                        on_release: app.open_more_target("boosted")\n                                    MoreItem:\n                                        text: "Treino (Exercise)"\n                                        icon: "dumbbell"\n                                        on_release: app.open_more_target("training")\n                                    MoreItem:\n                                        text: "Imbuements"\n                                        icon: "flash"\n                                        on_release: app.open_more_target("imbuements")\n                                    MoreItem:\n                                        text: "Stamina"\n                                        icon: "timer-outline"\n                                        on_release: app.open_more_target("stamina")\n                                    MoreItem:\n                                        text: "Hunt Analyzer"\n                                        icon: "chart-bar"\n                                        on_release: app.open_more_target("hunt")\n                                    MoreItem:\n                                        text: "Novidades"\n                                        icon: "new-box"\n                                        on_release: app.open_more_target("changelog")\n                                    MoreItem:\n                                        text: "Sobre"\n                                        icon: "information-outline"\n                                        on_release: app.open_more_target("about")\n                                    MoreItem:\n                                        text: "Feedback"\n                                        icon: "message-text"\n                                        on_release: app.open_more_target("feedback")\n                                    MoreItem:\n                                        text: "Configurações"\n                                        icon: "cog"\n                                        on_release: app.open_more_target("settings")\n\n\n# --- ui/kv/bosses.kv ---\n<BossesScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Bosses (ExevoPan)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "World"\n\n                        MDBoxLayout:\n                            id: world_row\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: world_field\n                                hint_text: "World"\n                                mode: "rectangle"\n\n                            MDIconButton:\n                                id: world_drop\n                                icon: "menu-down"\n                                on_release:\n                                    app.open_world_menu()\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Buscar"\n                                on_release: app.bosses_fetch()\n\n                            MDRectangleFlatIconButton:\n                                icon: "star-box-multiple-outline"\n                                text: "Favoritos"\n                                on_release: app.open_boss_favorites()\n\n                        HintText:\n                            id: boss_status\n                            text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Filtros"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: boss_search\n                                hint_text: "Buscar boss..."\n                                mode: "rectangle"\n                                on_text: app.bosses_apply_filters_debounced()\n\n                            MDIconButton:\n                                id: boss_filter_btn\n                                icon: "filter-variant"\n                                on_release: app.open_boss_filter_menu()\n\n                            MDIconButton:\n                                id: boss_sort_btn\n                                icon: "sort"\n                                on_release: app.open_boss_sort_menu()\n\n                            MDIconButton:\n                                id: boss_fav_toggle\n                                icon: "star-outline"\n                                on_release: app.bosses_toggle_fav_only()\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(22)\n                            spacing: dp(12)\n\n                            MDLabel:\n                                id: boss_filter_label\n                                text: "All"\n                                theme_text_color: "Hint"\n                                size_hint_x: .5\n\n                            MDLabel:\n                                id: boss_sort_label\n                                text: "Chance"\n                                theme_text_color: "Hint"\n                                halign: "right"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boss_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/boosted.kv ---\n<BoostedScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Boosted"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            right_action_items: [["refresh", lambda x: app.update_boosted()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                HintText:\n                    id: boost_status\n                    text: ""\n\n                MDBoxLayout:\n                    orientation: "horizontal"\n                    spacing: dp(12)\n                    size_hint_y: None\n                    height: dp(138)\n\n                    AppCard:\n                        size_hint_x: 0.5\n                        size_hint_y: None\n                        height: dp(138)\n\n                        MDBoxLayout:\n                            orientation: "vertical"\n                            spacing: dp(10)\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            SectionTitle:\n                                text: "Criatura Boosted"\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: dp(64)\n\n                                AnchorLayout:\n                                    size_hint: None, None\n                                    size: dp(64), dp(64)\n                                    anchor_x: "center"\n                                    anchor_y: "center"\n\n                                    AsyncImage:\n                                        id: boost_creature_sprite\n                                        source: ""\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        allow_stretch: True\n                                        keep_ratio: True\n                                        opacity: 1 if self.source else 0\n\n                                MDLabel:\n                                    id: boost_creature\n                                    text: "-"\n                                    valign: "middle"\n                                    halign: "left"\n                                    text_size: self.size\n\n                    AppCard:\n                        size_hint_x: 0.5\n                        size_hint_y: None\n                        height: dp(138)\n\n                        MDBoxLayout:\n                            orientation: "vertical"\n                            spacing: dp(10)\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            SectionTitle:\n                                text: "Boss Boosted"\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: dp(64)\n\n                                AnchorLayout:\n                                    size_hint: None, None\n                                    size: dp(64), dp(64)\n                                    anchor_x: "center"\n                                    anchor_y: "center"\n\n                                    AsyncImage:\n                                        id: boost_boss_sprite\n                                        source: ""\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        allow_stretch: True\n                                        keep_ratio: True\n                                        opacity: 1 if self.source else 0\n\n                                MDLabel:\n                                    id: boost_boss\n                                    text: "-"\n                                    valign: "middle"\n                                    halign: "left"\n                                    text_size: self.size\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Histórico (7 dias)"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boost_hist_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/training.kv ---\n<TrainingScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Treino (Exercise)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Configuração"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: skill_field\n                                hint_text: "Skill"\n                                text: "Sword"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: skill_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("skill")\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: voc_field\n                                hint_text: "Vocação"\n                                text: "Knight"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: voc_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("voc")\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: weapon_field\n                                hint_text: "Arma de treino"\n                                text: "Enhanced (1800)"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: weapon_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("weapon")\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Níveis"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: from_level\n                                hint_text: "De"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: percent_left\n                                hint_text: "% restante (1-100)"\n                                mode: "rectangle"\n                                input_filter: "float"\n                                text: "100"\n\n                            MDTextField:\n                                id: to_level\n                                hint_text: "Até"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        MDTextField:\n                            id: loyalty\n                            hint_text: "Loyalty (%) (0-50)"\n                            mode: "rectangle"\n                            input_filter: "float"\n                            text: "0"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Bônus"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Private dummy (+10%)"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: private_dummy\n                                active: False\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Double event (x2)"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: double_event\n                                active: False\n\n                ActionRow:\n                    MDRaisedButton:\n                        text: "Calcular"\n                        on_release: app.training_calculate()\n\n                HintText:\n                    id: train_status\n                    text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Resultado"\n\n                        MDLabel:\n                            id: train_result\n                            text: ""\n                            halign: "left"\n                            valign: "top"\n                            size_hint_y: None\n                            height: self.texture_size[1] + dp(20)\n\n\n# --- ui/kv/imbuements.kv ---\n<ImbuementsScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Imbuements (TibiaWiki)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            right_action_items: [["refresh", lambda x: app._imbuements_load()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Filtros"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(44)\n                            spacing: dp(8)\n\n                            MDIconButton:\n                                id: imb_tier_btn\n                                icon: "tag-outline"\n                                on_release: app.open_imb_tier_menu()\n\n                            MDLabel:\n                                id: imb_tier_label\n                                text: "All"\n                                theme_text_color: "Hint"\n                                size_hint_x: None\n                                width: dp(60)\n\n                            MDIconButton:\n                                id: imb_fav_toggle\n                                icon: "star-outline"\n                                on_release: app.imbuements_toggle_fav_only()\n\n                            MDIconButton:\n                                icon: "content-copy"\n                                on_release: app.imbuements_copy_selected_hint()\n\n                        MDTextField:\n                            id: imb_search\n                            hint_text: "Buscar (ex: Vampirism, Strike...)"\n                            mode: "rectangle"\n                            on_text: app.imbuements_refresh_list()\n\n                        HintText:\n                            id: imb_status\n                            text: "Toque em refresh para carregar."\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: imb_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/hunt.kv ---\n<HuntScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Hunt Analyzer"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Entrada"\n\n                        HintText:\n                            text: "Cole aqui o texto do Session Data do Tibia."\n\n                        MDTextField:\n                            id: hunt_input\n                            hint_text: "Session Data"\n                            mode: "rectangle"\n                            multiline: True\n                            size_hint_y: None\n                            height: dp(220)\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Analisar"\n                                on_release: app.hunt_parse()\n\n                ActionRow:\n                    MDRaisedButton:\n                        id: hunt_copy_btn\n                        text: "Copiar"\n                        on_release: app.hunt_copy()\n\n                    MDRectangleFlatIconButton:\n                        icon: "share-variant"\n                        text: "Compartilhar"\n                        on_release: app.hunt_share()\n\n                HintText:\n                    id: hunt_status\n                    text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Resultado"\n\n                        MDTextField:\n                            id: hunt_output\n                            hint_text: "Resultado"\n                            mode: "rectangle"\n                            multiline: True\n                            readonly: True\n                            size_hint_y: None\n                            height: dp(260)\n\n\n# --- ui/kv/stamina.kv ---\n<StaminaScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Stamina"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Calculadora de Stamina (offline)"\n\n                        HintText:\n                            text: "A regeneração começa 10 min após deslogar. Até 39:00 é mais rápida; de 39:00 a 42:00 (verde) é mais lenta."\n\n                        MDLabel:\n                            text: "Stamina atual"\n                            size_hint_y: None\n                            height: dp(20)\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: stam_cur_h\n                                hint_text: "Horas"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: stam_cur_m\n                                hint_text: "Min"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        MDLabel:\n                            text: "Stamina desejada"\n                            size_hint_y: None\n                            height: dp(20)\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: stam_tgt_h\n                                hint_text: "Horas"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: stam_tgt_m\n                                hint_text: "Min"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Calcular"\n                                on_release: app.stamina_calculate()\n\n                        MDLabel:\n                            id: stam_result\n                            text: ""\n                            halign: "left"\n                            valign: "top"\n                            text_size: self.width, None\n                            size_hint_y: None\n                            height: self.texture_size[1] + dp(20)\n\n\n# --- ui/kv/settings.kv ---\n<SettingsScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Configurações"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Aparência"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Tema claro"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_theme_light\n                                active: False\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Notificações (ao abrir o app)"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Boosted mudou"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_notify_boosted\n                                active: False\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Boss favorito High"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_notify_boss_high\n                                active: False\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Favoritos (segundo plano)"\n\n                        HintText:\n                            text: "Notificações mesmo com o app fechado. Isso roda como serviço em primeiro plano (pode aparecer um aviso fixo do Android)."\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Monitorar favoritos"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_monitor\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Iniciar automaticamente ao ligar"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_autostart\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando ficar online"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_online\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando upar level"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_level\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando morrer"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_death\n                                active: True\n\n                        MDTextField:\n                            id: set_bg_interval\n                            hint_text: "Intervalo do monitor (segundos) - ex: 30"\n                            text: "30"\n                            mode: "rectangle"\n                            input_filter: "int"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Updates (GitHub)"\n\n                        MDTextField:\n                            id: set_repo_url\n                            hint_text: "URL do repo (ex: https://github.com/user/repo)"\n                            mode: "rectangle"\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Salvar"\n                                on_release: app.settings_save()\n\n                            MDRectangleFlatIconButton:\n                                icon: "cloud-download-outline"\n                                text: "Checar"\n                                on_release: app.settings_check_updates()\n\n                        ActionRow:\n                            MDRectangleFlatIconButton:\n                                icon: "github"\n                                text: "Releases"\n                                on_release: app.settings_open_releases()\n\n                            MDRectangleFlatIconButton:\n                                icon: "broom"\n                                text: "Limpar cache"\n                                on_release: app.settings_clear_cache()\n\n                        HintText:\n                            id: set_status\n                            text: ""\n\n\n# --- ui/kv/bossfavorites.kv ---\n<BossFavoritesScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Bosses Favoritos"\n            left_action_items: [["arrow-left", lambda x: app.go(\'bosses\')]]\n            right_action_items: [["refresh", lambda x: app.boss_favorites_refresh()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                HintText:\n                    id: boss_fav_status\n                    text: "Favoritos: -"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boss_fav_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/root.kv ---\nRootSM:\n    HomeScreen:\n        name: "home"\n    BossesScreen:\n        name: "bosses"\n    BoostedScreen:\n        name: "boosted"\n    TrainingScreen:\n        name: "training"\n    ImbuementsScreen:\n        name: "imbuements"\n    HuntScreen:\n        name: "hunt"\n    StaminaScreen:\n        name: "stamina"\n    SettingsScreen:\n        name: "settings"\n    BossFavoritesScreen:\n        name: "boss_favorites"\n'
+FALLBACK_KV = '# --- ui/kv/common.kv ---\n#:import dp kivy.metrics.dp\n\n# ---------- UI defaults (polish) ----------\n<MDCard>:\n    radius: [dp(16), dp(16), dp(16), dp(16)]\n    elevation: 1\n\n<MDRaisedButton>:\n    size_hint_y: None\n    height: dp(44)\n\n<AppCard@MDCard>:\n    padding: dp(14)\n    radius: [dp(18), dp(18), dp(18), dp(18)]\n    elevation: 1\n\n<SectionTitle@MDLabel>:\n    font_style: "Subtitle1"\n    bold: True\n    size_hint_y: None\n    height: self.texture_size[1] + dp(8)\n\n<HintText@MDLabel>:\n    theme_text_color: "Hint"\n    font_style: "Caption"\n    size_hint_y: None\n    height: self.texture_size[1] + dp(6)\n\n<ActionRow@MDBoxLayout>:\n    size_hint_y: None\n    height: dp(44)\n    spacing: dp(10)\n\n<MoreItem>:\n    icon: "chevron-right"\n    IconLeftWidget:\n        icon: root.icon\n\n\n# --- ui/kv/home.kv ---\n<HomeScreen@MDScreen>:\n    char_last_url: ""\n\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Tibia Tools"\n            elevation: 2\n\n        MDBottomNavigation:\n            id: bottom_nav\n            panel_color: app.theme_cls.bg_normal\n\n\n            MDBottomNavigationItem:\n                name: "tab_dashboard"\n                text: "Home"\n                icon: "home"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Boosted hoje"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "refresh"\n                                        on_release: app.dashboard_refresh()\n\n                                ClickableRow:\n                                    orientation: "horizontal"\n                                    spacing: dp(10)\n                                    size_hint_y: None\n                                    height: dp(56)\n                                    on_release: app.open_boosted_from_home("creature")\n                                    AnchorLayout:\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        anchor_x: "center"\n                                        anchor_y: "center"\n                                        AsyncImage:\n                                            id: dash_boost_creature_sprite\n                                            source: ""\n                                            size_hint: None, None\n                                            size: dp(48), dp(48)\n                                            allow_stretch: True\n                                            keep_ratio: True\n                                            opacity: 1 if self.source else 0\n                                    MDLabel:\n                                        id: dash_boost_creature\n                                        text: "-"\n                                        valign: "middle"\n                                        halign: "left"\n                                        text_size: self.size\n\n                                ClickableRow:\n                                    orientation: "horizontal"\n                                    spacing: dp(10)\n                                    size_hint_y: None\n                                    height: dp(56)\n                                    on_release: app.open_boosted_from_home("boss")\n                                    AnchorLayout:\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        anchor_x: "center"\n                                        anchor_y: "center"\n                                        AsyncImage:\n                                            id: dash_boost_boss_sprite\n                                            source: ""\n                                            size_hint: None, None\n                                            size: dp(48), dp(48)\n                                            allow_stretch: True\n                                            keep_ratio: True\n                                            opacity: 1 if self.source else 0\n                                    MDLabel:\n                                        id: dash_boost_boss\n                                        text: "-"\n                                        valign: "middle"\n                                        halign: "left"\n                                        text_size: self.size\n\n                                MDLabel:\n                                    id: dash_boost_updated\n                                    text: ""\n                                    theme_text_color: "Hint"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Último char"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "account-search"\n                                        on_release: app.select_home_tab("tab_char")\n\n                                MDLabel:\n                                    id: dash_last_char\n                                    text: "-"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                                MDRaisedButton:\n                                    text: "Abrir último no Tibia.com"\n                                    on_release: app.dashboard_open_last_char()\n\n                        MDCard:\n                            padding: dp(12)\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    MDLabel:\n                                        text: "Bosses favoritos (High)"\n                                        bold: True\n\n                                    MDIconButton:\n                                        icon: "skull"\n                                        on_release: app.open_more_target("bosses")\n\n                                MDLabel:\n                                    id: dash_boss_hint\n                                    text: "Configure favoritos na tela Bosses."\n                                    theme_text_color: "Hint"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(6)\n\n                                MDList:\n                                    id: dash_boss_list\n\n            MDBottomNavigationItem:\n                name: "tab_char"\n                text: "Char"\n                icon: "account-search"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        MDBoxLayout:\n                            id: world_row\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: char_name\n                                hint_text: "Nome do personagem"\n                                mode: "rectangle"\n                                multiline: False\n                                on_text_validate: app.search_character()\n\n                            MDIconButton:\n                                icon: "history"\n                                on_release: app.open_char_history_menu()\n\n                            MDIconButton:\n                                icon: "close"\n                                on_release: app.clear_char_search()\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Buscar"\n                                on_release: app.search_character()\n\n                            MDRectangleFlatIconButton:\n                                icon: "open-in-new"\n                                text: "Tibia.com"\n                                on_release: app.open_last_in_browser()\n\n                            MDRectangleFlatIconButton:\n                                icon: "star-plus-outline"\n                                text: "Favoritar"\n                                on_release: app.add_current_to_favorites()\n\n                        MDCard:\n                            id: char_result_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                size_hint_y: None\n                                height: self.minimum_height\n                                spacing: dp(8)\n\n                                MDLabel:\n                                    id: char_title\n                                    text: "Faça uma busca"\n                                    font_style: "H6"\n                                    bold: True\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(4)\n\n                                MDLabel:\n                                    id: char_badge\n                                    text: ""\n                                    markup: True\n                                    halign: "right"\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(4)\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_details_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Digite o nome e toque em Buscar."\n                                    IconLeftWidget:\n                                        icon: "information-outline"\n\n                        MDCard:\n                            id: char_xp_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "XP últimos 30 dias"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                                Widget:\n                                    size_hint_x: 1\n\n                                MDIconButton:\n                                    icon: "open-in-new"\n                                    on_release: app.open_char_xp_source()\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDLabel:\n                                id: char_xp_total\n                                text: "—"\n                                theme_text_color: "Hint"\n                                size_hint_y: None\n                                height: self.texture_size[1] + dp(6)\n\n                            MDList:\n                                id: char_xp_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Faça uma busca para ver o histórico."\n                                    IconLeftWidget:\n                                        icon: "chart-line"\n\n                        MDCard:\n                            id: char_deaths_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "Últimas mortes"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                                Widget:\n                                    size_hint_x: 1\n\n                                MDIconButton:\n                                    icon: "content-copy"\n                                    on_release: app.copy_deaths_to_clipboard()\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_deaths_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Nenhuma informação ainda."\n                                    IconLeftWidget:\n                                        icon: "skull-outline"\n\n                        MDCard:\n                            id: char_account_card\n                            orientation: "vertical"\n                            padding: dp(12)\n                            spacing: dp(6)\n                            size_hint_y: None\n                            height: self.minimum_height\n                            radius: [dp(16), dp(16), dp(16), dp(16)]\n                            elevation: 1\n\n                            MDBoxLayout:\n                                size_hint_y: None\n                                height: dp(32)\n                                spacing: dp(6)\n\n                                MDLabel:\n                                    text: "Outros chars na conta"\n                                    font_style: "Subtitle1"\n                                    bold: True\n\n                            MDSeparator:\n                                height: dp(1)\n\n                            MDList:\n                                id: char_account_list\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                OneLineIconListItem:\n                                    text: "Faça uma busca para ver os outros personagens."\n                                    IconLeftWidget:\n                                        icon: "account-multiple"\n\n            MDBottomNavigationItem:\n                name: "tab_share"\n                text: "Share XP"\n                icon: "account-group"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                SectionTitle:\n                                    text: "Calculadora de Shared XP"\n\n                                HintText:\n                                    text: "Informe seu level e veja a faixa permitida para shared."\n\n                                MDTextField:\n                                    id: share_level\n                                    hint_text: "Seu level"\n                                    mode: "rectangle"\n                                    input_filter: "int"\n\n                                ActionRow:\n                                    MDRaisedButton:\n                                        text: "Calcular"\n                                        on_release: app.calc_shared_xp()\n\n                                MDLabel:\n                                    id: share_result\n                                    text: ""\n                                    halign: "left"\n                                    valign: "top"\n                                    text_size: self.width, None\n                                    size_hint_y: None\n                                    height: self.texture_size[1] + dp(20)\n\n\n            MDBottomNavigationItem:\n                name: "tab_fav"\n                text: "Favoritos"\n                icon: "star"\n                on_tab_release: app.on_fav_tab_shown()\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                MDBoxLayout:\n                                    size_hint_y: None\n                                    height: dp(36)\n\n                                    SectionTitle:\n                                        text: "Favoritos"\n\n                                    MDIconButton:\n                                        icon: "refresh"\n                                        on_release: app.refresh_favorites_list(force=True)\n\n                                HintText:\n                                    text: "Toque em um favorito para opções."\n\n                                MDSeparator:\n                                    height: dp(1)\n\n                                MDList:\n                                    id: fav_list\n                                    size_hint_y: None\n                                    height: self.minimum_height\n            MDBottomNavigationItem:\n                name: "tab_more"\n                text: "Mais"\n                icon: "dots-horizontal"\n\n                MDScrollView:\n                    do_scroll_x: False\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        padding: dp(12)\n                        spacing: dp(12)\n                        size_hint_y: None\n                        height: self.minimum_height\n                        adaptive_height: True\n\n                        AppCard:\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            MDBoxLayout:\n                                orientation: "vertical"\n                                spacing: dp(6)\n                                size_hint_y: None\n                                height: self.minimum_height\n\n                                SectionTitle:\n                                    text: "Ferramentas"\n\n                                MDSeparator:\n                                    height: dp(1)\n\n                                MDList:\n                                    MoreItem:\n                                        text: "Bosses (ExevoPan)"\n                                        icon: "skull"\n                                        on_release: app.open_more_target("bosses")\n                                    MoreItem:\n                                        text: "Boosted"\n                                        icon: "star-four-points"\n                                        on_release: app.open_more_target("boosted")\n                                    MoreItem:\n                                        text: "Treino (Exercise)"\n                                        icon: "dumbbell"\n                                        on_release: app.open_more_target("training")\n                                    MoreItem:\n                                        text: "Imbuements"\n                                        icon: "flash"\n                                        on_release: app.open_more_target("imbuements")\n                                    MoreItem:\n                                        text: "Stamina"\n                                        icon: "timer-outline"\n                                        on_release: app.open_more_target("stamina")\n                                    MoreItem:\n                                        text: "Hunt Analyzer"\n                                        icon: "chart-bar"\n                                        on_release: app.open_more_target("hunt")\n                                    MoreItem:\n                                        text: "Novidades"\n                                        icon: "new-box"\n                                        on_release: app.open_more_target("changelog")\n                                    MoreItem:\n                                        text: "Sobre"\n                                        icon: "information-outline"\n                                        on_release: app.open_more_target("about")\n                                    MoreItem:\n                                        text: "Feedback"\n                                        icon: "message-text"\n                                        on_release: app.open_more_target("feedback")\n                                    MoreItem:\n                                        text: "Configurações"\n                                        icon: "cog"\n                                        on_release: app.open_more_target("settings")\n\n\n# --- ui/kv/bosses.kv ---\n<BossesScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Bosses (ExevoPan)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "World"\n\n                        MDBoxLayout:\n                            id: world_row\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: world_field\n                                hint_text: "World"\n                                mode: "rectangle"\n\n                            MDIconButton:\n                                id: world_drop\n                                icon: "menu-down"\n                                on_release:\n                                    app.open_world_menu()\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Buscar"\n                                on_release: app.bosses_fetch()\n\n                            MDRectangleFlatIconButton:\n                                icon: "star-box-multiple-outline"\n                                text: "Favoritos"\n                                on_release: app.open_boss_favorites()\n\n                        HintText:\n                            id: boss_status\n                            text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Filtros"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: boss_search\n                                hint_text: "Buscar boss..."\n                                mode: "rectangle"\n                                on_text: app.bosses_apply_filters_debounced()\n\n                            MDIconButton:\n                                id: boss_filter_btn\n                                icon: "filter-variant"\n                                on_release: app.open_boss_filter_menu()\n\n                            MDIconButton:\n                                id: boss_sort_btn\n                                icon: "sort"\n                                on_release: app.open_boss_sort_menu()\n\n                            MDIconButton:\n                                id: boss_fav_toggle\n                                icon: "star-outline"\n                                on_release: app.bosses_toggle_fav_only()\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(22)\n                            spacing: dp(12)\n\n                            MDLabel:\n                                id: boss_filter_label\n                                text: "All"\n                                theme_text_color: "Hint"\n                                size_hint_x: .5\n\n                            MDLabel:\n                                id: boss_sort_label\n                                text: "Chance"\n                                theme_text_color: "Hint"\n                                halign: "right"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boss_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/boosted.kv ---\n<BoostedScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Boosted"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            right_action_items: [["refresh", lambda x: app.update_boosted()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                HintText:\n                    id: boost_status\n                    text: ""\n\n                MDBoxLayout:\n                    orientation: "horizontal"\n                    spacing: dp(12)\n                    size_hint_y: None\n                    height: dp(138)\n\n                    AppCard:\n                        size_hint_x: 0.5\n                        size_hint_y: None\n                        height: dp(138)\n\n                        MDBoxLayout:\n                            orientation: "vertical"\n                            spacing: dp(10)\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            SectionTitle:\n                                text: "Criatura Boosted"\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: dp(64)\n\n                                AnchorLayout:\n                                    size_hint: None, None\n                                    size: dp(64), dp(64)\n                                    anchor_x: "center"\n                                    anchor_y: "center"\n\n                                    AsyncImage:\n                                        id: boost_creature_sprite\n                                        source: ""\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        allow_stretch: True\n                                        keep_ratio: True\n                                        opacity: 1 if self.source else 0\n\n                                MDLabel:\n                                    id: boost_creature\n                                    text: "-"\n                                    valign: "middle"\n                                    halign: "left"\n                                    text_size: self.size\n\n                    AppCard:\n                        size_hint_x: 0.5\n                        size_hint_y: None\n                        height: dp(138)\n\n                        MDBoxLayout:\n                            orientation: "vertical"\n                            spacing: dp(10)\n                            size_hint_y: None\n                            height: self.minimum_height\n\n                            SectionTitle:\n                                text: "Boss Boosted"\n\n                            MDBoxLayout:\n                                orientation: "horizontal"\n                                spacing: dp(10)\n                                size_hint_y: None\n                                height: dp(64)\n\n                                AnchorLayout:\n                                    size_hint: None, None\n                                    size: dp(64), dp(64)\n                                    anchor_x: "center"\n                                    anchor_y: "center"\n\n                                    AsyncImage:\n                                        id: boost_boss_sprite\n                                        source: ""\n                                        size_hint: None, None\n                                        size: dp(56), dp(56)\n                                        allow_stretch: True\n                                        keep_ratio: True\n                                        opacity: 1 if self.source else 0\n\n                                MDLabel:\n                                    id: boost_boss\n                                    text: "-"\n                                    valign: "middle"\n                                    halign: "left"\n                                    text_size: self.size\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Histórico (7 dias)"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boost_hist_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/training.kv ---\n<TrainingScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Treino (Exercise)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Configuração"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: skill_field\n                                hint_text: "Skill"\n                                text: "Sword"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: skill_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("skill")\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: voc_field\n                                hint_text: "Vocação"\n                                text: "Knight"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: voc_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("voc")\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: weapon_field\n                                hint_text: "Arma de treino"\n                                text: "Enhanced (1800)"\n                                mode: "rectangle"\n                                readonly: True\n\n                            MDIconButton:\n                                id: weapon_drop\n                                icon: "menu-down"\n                                on_release: app.training_open_menu("weapon")\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Níveis"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: from_level\n                                hint_text: "De"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: percent_left\n                                hint_text: "% restante (1-100)"\n                                mode: "rectangle"\n                                input_filter: "float"\n                                text: "100"\n\n                            MDTextField:\n                                id: to_level\n                                hint_text: "Até"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        MDTextField:\n                            id: loyalty\n                            hint_text: "Loyalty (%) (0-50)"\n                            mode: "rectangle"\n                            input_filter: "float"\n                            text: "0"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Bônus"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Private dummy (+10%)"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: private_dummy\n                                active: False\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Double event (x2)"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: double_event\n                                active: False\n\n                ActionRow:\n                    MDRaisedButton:\n                        text: "Calcular"\n                        on_release: app.training_calculate()\n\n                HintText:\n                    id: train_status\n                    text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Resultado"\n\n                        MDLabel:\n                            id: train_result\n                            text: ""\n                            halign: "left"\n                            valign: "top"\n                            size_hint_y: None\n                            height: self.texture_size[1] + dp(20)\n\n\n# --- ui/kv/imbuements.kv ---\n<ImbuementsScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Imbuements (TibiaWiki)"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            right_action_items: [["refresh", lambda x: app._imbuements_load()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Filtros"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(44)\n                            spacing: dp(8)\n\n                            MDIconButton:\n                                id: imb_tier_btn\n                                icon: "tag-outline"\n                                on_release: app.open_imb_tier_menu()\n\n                            MDLabel:\n                                id: imb_tier_label\n                                text: "All"\n                                theme_text_color: "Hint"\n                                size_hint_x: None\n                                width: dp(60)\n\n                            MDIconButton:\n                                id: imb_fav_toggle\n                                icon: "star-outline"\n                                on_release: app.imbuements_toggle_fav_only()\n\n                            MDIconButton:\n                                icon: "content-copy"\n                                on_release: app.imbuements_copy_selected_hint()\n\n                        MDTextField:\n                            id: imb_search\n                            hint_text: "Buscar (ex: Vampirism, Strike...)"\n                            mode: "rectangle"\n                            on_text: app.imbuements_refresh_list_debounced()\n\n                        HintText:\n                            id: imb_status\n                            text: "Toque em refresh para carregar."\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: imb_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/hunt.kv ---\n<HuntScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Hunt Analyzer"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Entrada"\n\n                        HintText:\n                            text: "Cole aqui o texto do Session Data do Tibia."\n\n                        MDTextField:\n                            id: hunt_input\n                            hint_text: "Session Data"\n                            mode: "rectangle"\n                            multiline: True\n                            size_hint_y: None\n                            height: dp(220)\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Analisar"\n                                on_release: app.hunt_parse()\n\n                ActionRow:\n                    MDRaisedButton:\n                        id: hunt_copy_btn\n                        text: "Copiar"\n                        on_release: app.hunt_copy()\n\n                    MDRectangleFlatIconButton:\n                        icon: "share-variant"\n                        text: "Compartilhar"\n                        on_release: app.hunt_share()\n\n                HintText:\n                    id: hunt_status\n                    text: ""\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Resultado"\n\n                        MDTextField:\n                            id: hunt_output\n                            hint_text: "Resultado"\n                            mode: "rectangle"\n                            multiline: True\n                            readonly: True\n                            size_hint_y: None\n                            height: dp(260)\n\n\n# --- ui/kv/stamina.kv ---\n<StaminaScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Stamina"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Calculadora de Stamina (offline)"\n\n                        HintText:\n                            text: "A regeneração começa 10 min após deslogar. Até 39:00 é mais rápida; de 39:00 a 42:00 (verde) é mais lenta."\n\n                        MDLabel:\n                            text: "Stamina atual"\n                            size_hint_y: None\n                            height: dp(20)\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: stam_cur_h\n                                hint_text: "Horas"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: stam_cur_m\n                                hint_text: "Min"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        MDLabel:\n                            text: "Stamina desejada"\n                            size_hint_y: None\n                            height: dp(20)\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(56)\n                            spacing: dp(8)\n\n                            MDTextField:\n                                id: stam_tgt_h\n                                hint_text: "Horas"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                            MDTextField:\n                                id: stam_tgt_m\n                                hint_text: "Min"\n                                mode: "rectangle"\n                                input_filter: "int"\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Calcular"\n                                on_release: app.stamina_calculate()\n\n                        MDLabel:\n                            id: stam_result\n                            text: ""\n                            halign: "left"\n                            valign: "top"\n                            text_size: self.width, None\n                            size_hint_y: None\n                            height: self.texture_size[1] + dp(20)\n\n\n# --- ui/kv/settings.kv ---\n<SettingsScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Configurações"\n            left_action_items: [["arrow-left", lambda x: app.back_home()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Aparência"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Tema claro"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_theme_light\n                                active: False\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Notificações (ao abrir o app)"\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Boosted mudou"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_notify_boosted\n                                active: False\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Boss favorito High"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_notify_boss_high\n                                active: False\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Favoritos (segundo plano)"\n\n                        HintText:\n                            text: "Notificações mesmo com o app fechado. Isso roda como serviço em primeiro plano (pode aparecer um aviso fixo do Android)."\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Monitorar favoritos"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_monitor\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Iniciar automaticamente ao ligar"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_autostart\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando ficar online"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_online\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando upar level"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_level\n                                active: True\n\n                        MDBoxLayout:\n                            size_hint_y: None\n                            height: dp(48)\n                            spacing: dp(10)\n\n                            MDLabel:\n                                text: "Avisar quando morrer"\n                                valign: "middle"\n\n                            MDSwitch:\n                                id: set_bg_notify_death\n                                active: True\n\n                        MDTextField:\n                            id: set_bg_interval\n                            hint_text: "Intervalo do monitor (segundos) - ex: 30"\n                            text: "30"\n                            mode: "rectangle"\n                            input_filter: "int"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(10)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Updates (GitHub)"\n\n                        MDTextField:\n                            id: set_repo_url\n                            hint_text: "URL do repo (ex: https://github.com/user/repo)"\n                            mode: "rectangle"\n\n                        ActionRow:\n                            MDRaisedButton:\n                                text: "Salvar"\n                                on_release: app.settings_save()\n\n                            MDRectangleFlatIconButton:\n                                icon: "cloud-download-outline"\n                                text: "Checar"\n                                on_release: app.settings_check_updates()\n\n                        ActionRow:\n                            MDRectangleFlatIconButton:\n                                icon: "github"\n                                text: "Releases"\n                                on_release: app.settings_open_releases()\n\n                            MDRectangleFlatIconButton:\n                                icon: "broom"\n                                text: "Limpar cache"\n                                on_release: app.settings_clear_cache()\n\n                        HintText:\n                            id: set_status\n                            text: ""\n\n\n# --- ui/kv/bossfavorites.kv ---\n<BossFavoritesScreen@MDScreen>:\n    MDBoxLayout:\n        orientation: "vertical"\n\n        MDTopAppBar:\n            title: "Bosses Favoritos"\n            left_action_items: [["arrow-left", lambda x: app.go(\'bosses\')]]\n            right_action_items: [["refresh", lambda x: app.boss_favorites_refresh()]]\n            elevation: 2\n\n        MDScrollView:\n            do_scroll_x: False\n\n            MDBoxLayout:\n                orientation: "vertical"\n                padding: dp(12)\n                spacing: dp(12)\n                size_hint_y: None\n                height: self.minimum_height\n\n                HintText:\n                    id: boss_fav_status\n                    text: "Favoritos: -"\n\n                AppCard:\n                    size_hint_y: None\n                    height: self.minimum_height\n\n                    MDBoxLayout:\n                        orientation: "vertical"\n                        spacing: dp(8)\n                        size_hint_y: None\n                        height: self.minimum_height\n\n                        SectionTitle:\n                            text: "Lista"\n\n                        MDSeparator:\n                            height: dp(1)\n\n                        MDList:\n                            id: boss_fav_list\n                            size_hint_y: None\n                            height: self.minimum_height\n\n\n# --- ui/kv/root.kv ---\nRootSM:\n    HomeScreen:\n        name: "home"\n    BossesScreen:\n        name: "bosses"\n    BoostedScreen:\n        name: "boosted"\n    TrainingScreen:\n        name: "training"\n    ImbuementsScreen:\n        name: "imbuements"\n    HuntScreen:\n        name: "hunt"\n    StaminaScreen:\n        name: "stamina"\n    SettingsScreen:\n        name: "settings"\n    BossFavoritesScreen:\n        name: "boss_favorites"\n'
 
 
 def _project_root() -> Path: